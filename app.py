@@ -12,12 +12,24 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from data.data_fetcher import DataFetcher
 from strategies.strategy_manager import StrategyManager
+from strategies.signal_scheduler import SignalScheduler
 from deepseek.analyzer import DeepSeekAnalyzer
 
+@st.cache_resource
+def get_data_fetcher() -> DataFetcher:
+    """Rerun'lar arasında paylaşılan DataFetcher; tarihsel veri önbelleği korunur"""
+    return DataFetcher()
+
+@st.cache_resource
+def get_signal_scheduler() -> SignalScheduler:
+    """Rerun'lar arasında paylaşılan zamanlayıcı; stratejiler yalnızca mum kapanışında yeniden çalışır"""
+    return SignalScheduler(StrategyManager(tail_only=True))
+
 class CryptoTradingDashboard:
     def __init__(self):
-        self.data_fetcher = DataFetcher()
-        self.strategy_manager = StrategyManager()
+        self.data_fetcher = get_data_fetcher()
+        self.signal_scheduler = get_signal_scheduler()
+        self.strategy_manager = self.signal_scheduler.strategy_manager
         
         # DeepSeek analyzer'ı başlat
         api_key = os.environ.get("DEEPSEEK_API_KEY")
@@ -196,15 +208,16 @@ class CryptoTradingDashboard:
         
         symbols = ["BTCUSDT", "ETHUSDT"]
         
+        # Tüm sembollerin verisini eşzamanlı al
+        symbols_data = self.data_fetcher.get_multiple_symbols_data(symbols, "1h", 200)
+        # Strateji analizleri yalnızca yeni mum kapanan semboller için, tek toplu çağrıda
+        batch = self.signal_scheduler.update_many(symbols_data, "1h")
+        
         for symbol in symbols:
             with st.expander(f"{symbol} - Strateji Sinyalleri", expanded=True):
-                # Veriyi al
-                data = self.data_fetcher.get_historical_data(symbol, "1h", 200)
+                strategies_results = batch["results"].get(symbol)
                 
-                if not data.empty:
-                    # Strateji analizleri
-                    strategies_results = self.strategy_manager.analyze_symbol(symbol, data)
-                    
+                if strategies_results:
                     # Sinyal kartları
                     cols = st.columns(3)
                     
@@ -233,14 +246,11 @@ class CryptoTradingDashboard:
         
         if not data.empty:
             cols = st.columns(4)
+            # Stratejilerle aynı gösterge planı; veri değişmediyse sonuç önbellekten gelir
+            indicators = self.strategy_manager.compute_indicators(data)
             
             # RSI
-            delta = data['close'].diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-            rs = gain / loss
-            rsi = 100 - (100 / (1 + rs))
-            current_rsi = rsi.iloc[-1]
+            current_rsi = indicators['rsi(14)'].iloc[-1]
             
             with cols[0]:
                 rsi_color = "green" if current_rsi < 30 else "red" if current_rsi > 70 else "orange"
@@ -249,27 +259,24 @@ class CryptoTradingDashboard:
                 st.caption(f"Durum: {'Oversold' if current_rsi < 30 else 'Overbought' if current_rsi > 70 else 'Nötr'}")
             
             # MACD
-            exp1 = data['close'].ewm(span=12).mean()
-            exp2 = data['close'].ewm(span=26).mean()
-            macd = exp1 - exp2
-            macd_signal = macd.ewm(span=9).mean()
-            current_macd = macd.iloc[-1]
+            macd_signal = indicators['macd(12,26,9).signal']
+            current_macd = indicators['macd(12,26,9).macd'].iloc[-1]
             
             with cols[1]:
                 macd_status = "AL" if current_macd > macd_signal.iloc[-1] else "SAT"
                 st.metric("MACD", f"{current_macd:.2f}", macd_status)
             
             # Moving Averages
-            ma_20 = data['close'].rolling(20).mean().iloc[-1]
-            ma_50 = data['close'].rolling(50).mean().iloc[-1]
+            ma_20 = indicators['sma(20)'].iloc[-1]
+            ma_50 = indicators['sma(50)'].iloc[-1]
             
             with cols[2]:
                 ma_status = "Yükseliş" if ma_20 > ma_50 else "Düşüş"
                 st.metric("MA 20/50", f"{ma_20:.2f}/{ma_50:.2f}", ma_status)
             
             # Bollinger Bands
-            bb_upper = data['close'].rolling(20).mean() + (data['close'].rolling(20).std() * 2)
-            bb_lower = data['close'].rolling(20).mean() - (data['close'].rolling(20).std() * 2)
+            bb_upper = indicators['bb(20,2).upper']
+            bb_lower = indicators['bb(20,2).lower']
             current_price = data['close'].iloc[-1]
             
             with cols[3]:
@@ -334,42 +341,57 @@ class CryptoTradingDashboard:
             strategies_results = self.strategy_manager.analyze_symbol(symbol, data)
             
             try:
-                # DeepSeek analizini al
-                analysis = self.deepseek_analyzer.analyze_trading_signals(symbol, strategies_results, current_price)
-                
-                # Analiz sonuçlarını göster
                 col1, col2 = st.columns([1, 1])
-                
                 with col1:
                     st.subheader("AI Önerisi")
-                    
-                    recommendation = analysis['recommendation']
-                    confidence = analysis['confidence']
-                    risk_level = analysis['risk_level']
-                    
-                    # Öneri kartı
-                    if recommendation == "AL":
-                        st.success(f"🎯 **{recommendation}** (%{confidence} Güven)")
-                    elif recommendation == "SAT":
-                        st.error(f"🎯 **{recommendation}** (%{confidence} Güven)")
-                    else:
-                        st.warning(f"🎯 **{recommendation}** (%{confidence} Güven)")
-                    
-                    st.metric("Risk Seviyesi", risk_level)
-                
+                    verdict_slot = st.empty()
+                    risk_slot = st.empty()
                 with col2:
                     st.subheader("Detaylı Analiz")
-                    st.write(analysis['reasoning'])
-                    
+                    reasoning_slot = st.empty()
+                    targets_slot = st.container()
+                verdict_slot.info("⏳ AI analizi bekleniyor...")
+                
+                # Akışlı analiz: karar alanları tamamlanınca gerekçe beklenmeden gösterilir
+                analysis = None
+                for event in self.deepseek_analyzer.analyze_trading_signals_stream(symbol, strategies_results, current_price):
+                    if event["type"] == "verdict":
+                        self._render_verdict(verdict_slot, risk_slot, event)
+                        reasoning_slot.caption(f"Gerekçe yazılıyor... (karar {event['elapsed']:.1f}s)")
+                    elif event["type"] == "field" and event["field"] == "reasoning":
+                        reasoning_slot.write(event["value"])
+                    elif event["type"] == "result":
+                        analysis = event["result"]
+                
+                # Analiz sonuçlarını göster
+                self._render_verdict(verdict_slot, risk_slot, analysis)
+                reasoning_slot.write(analysis['reasoning'])
+                with targets_slot:
                     # Fiyat hedefleri
                     price_targets = analysis.get('analysis', {}).get('price_targets', {})
                     if price_targets:
                         st.subheader("🎯 Fiyat Hedefleri")
                         for target, value in price_targets.items():
                             st.write(f"**{target}**: {value}")
+                    timing = analysis.get('timing', {})
+                    if not analysis.get('cached') and timing.get('verdict') is not None:
+                        st.caption(f"İlk karar {timing['verdict']:.1f}s · toplam {timing['total']:.1f}s")
                 
             except Exception as e:
                 st.error(f"DeepSeek analiz hatası: {str(e)}")
+    
+    def _render_verdict(self, verdict_slot, risk_slot, analysis):
+        """Öneri kartı ve risk seviyesi"""
+        recommendation = analysis['recommendation']
+        confidence = analysis['confidence']
+        text = f"🎯 **{recommendation}** (%{confidence} Güven)"
+        if recommendation == "AL":
+            verdict_slot.success(text)
+        elif recommendation == "SAT":
+            verdict_slot.error(text)
+        else:
+            verdict_slot.warning(text)
+        risk_slot.metric("Risk Seviyesi", analysis['risk_level'])
 
 def main():
     """Ana uygulama"""
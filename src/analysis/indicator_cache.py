@@ -0,0 +1,128 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+# Parmak izine giren kolonlar; gösterge hesapları yalnızca bunları okur
+FINGERPRINT_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+
+def data_fingerprint(data: pd.DataFrame) -> str:
+    """
+    OHLCV içeriğinin özeti; son bar (veya herhangi bir bar) değişirse özet de değişir
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(len(data)).encode())
+    if len(data):
+        digest.update(str(data.index[0]).encode())
+        digest.update(str(data.index[-1]).encode())
+    for column in FINGERPRINT_COLUMNS:
+        if column in data:
+            digest.update(column.encode())
+            digest.update(np.ascontiguousarray(data[column].to_numpy(dtype=np.float64)).tobytes())
+    return digest.hexdigest()
+
+
+def split_fingerprint(data: pd.DataFrame) -> Tuple[str, str]:
+    """
+    (son bar hariç verinin özeti, son barın özeti); oluşan bar güncellenince yalnızca ikincisi değişir
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    if len(data):
+        digest.update(str(data.index[-1]).encode())
+        for column in FINGERPRINT_COLUMNS:
+            if column in data:
+                digest.update(column.encode())
+                digest.update(np.float64(data[column].iloc[-1]).tobytes())
+    return data_fingerprint(data.iloc[:-1]), digest.hexdigest()
+
+
+class IndicatorCache:
+    """
+    (son bar hariç veri parmak izi, gösterge, parametreler) anahtarlı gösterge önbelleği.
+    Aynı analyze_symbol çağrısındaki stratejiler ortak seriyi bir kez hesaplar;
+    veri değişmediği sürece sonraki çağrılar da aynı sonuçları kullanır. Yalnızca son
+    bar değiştiyse (oluşan mum) ve refresh verilmişse önbellekteki sonuç refresh ile
+    güncellenir; önceki barların hesabı yeniden kullanılır.
+    Dönen seriler paylaşılır, çağıranlar yerinde değiştirmemelidir.
+    """
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Tuple, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.hits = 0
+        self.partial_hits = 0
+        self.misses = 0
+
+    @contextmanager
+    def evaluation(self, data: pd.DataFrame) -> Iterator[Tuple[str, str]]:
+        """
+        Bir değerlendirme boyunca bu DataFrame'in parmak izini bir kez hesapla
+        """
+        previous = getattr(self._local, 'pinned', None)
+        fingerprint = split_fingerprint(data)
+        self._local.pinned = (data, fingerprint)
+        try:
+            yield fingerprint
+        finally:
+            self._local.pinned = previous
+
+    def fingerprint(self, data: pd.DataFrame) -> Tuple[str, str]:
+        pinned = getattr(self._local, 'pinned', None)
+        if pinned is not None and pinned[0] is data:
+            return pinned[1]
+        return split_fingerprint(data)
+
+    def get_or_compute(self, data: pd.DataFrame, indicator: str, params: Tuple[Hashable, ...],
+                       compute: Callable[[], Any],
+                       refresh: Optional[Callable[[Any], Any]] = None) -> Any:
+        """
+        refresh(önceki sonuç): yalnızca son barı farklı veri için önceki sonucu güncelle
+        """
+        prefix, last = self.fingerprint(data)
+        key = (prefix, indicator, params)
+        previous = None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == last:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry[1]
+            if entry is not None and refresh is not None:
+                previous = entry[1]
+                self.partial_hits += 1
+            else:
+                self.misses += 1
+
+        value = compute() if previous is None else refresh(previous)
+        with self._lock:
+            self._entries[key] = (last, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = 0
+            self.partial_hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "partial_hits": self.partial_hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "hit_rate": self.hits / total if total else 0.0
+            }
@@ -0,0 +1,205 @@
+import math
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from . import kernels
+
+# Parametre verilmezse kullanılacak varsayılanlar (TechnicalAnalyzer ile aynı)
+DEFAULT_PARAMS = {
+    'rsi': (14,),
+    'macd': (12, 26, 9),
+    'bb': (20, 2),
+    'stoch': (14, 3)
+}
+# Parametre sayısı; sma/ema/std pencere ister
+PARAM_COUNTS = {'sma': 1, 'ema': 1, 'std': 1, 'rsi': 1, 'macd': 3, 'bb': 2, 'stoch': 2}
+# Çok çıktılı göstergelerin kolon ekleri
+OUTPUT_FIELDS = {
+    'macd': ('macd', 'signal', 'histogram'),
+    'bb': ('upper', 'middle', 'lower'),
+    'stoch': ('k', 'd')
+}
+_SPEC_PATTERN = re.compile(r'^\s*([a-z]+)\s*(?:\(([^)]*)\))?\s*$')
+
+NodeKey = Tuple
+
+
+def _number(text: str):
+    value = float(text)
+    return int(value) if value.is_integer() else value
+
+
+def parse_spec(spec: str) -> NodeKey:
+    """
+    'rsi(14)', 'bb(20,2)', 'macd' gibi bir tanımı (tür, parametreler) anahtarına çevir
+    """
+    match = _SPEC_PATTERN.match(spec.lower())
+    if not match or match.group(1) not in PARAM_COUNTS:
+        raise ValueError(f"Bilinmeyen gösterge tanımı: {spec}")
+    kind, raw = match.groups()
+    params = tuple(_number(p) for p in raw.split(',')) if raw and raw.strip() else DEFAULT_PARAMS.get(kind)
+    if params is None or len(params) != PARAM_COUNTS[kind]:
+        raise ValueError(f"{kind} için {PARAM_COUNTS[kind]} parametre gerekli: {spec}")
+    return (kind,) + params
+
+
+def spec_name(key: NodeKey) -> str:
+    return f"{key[0]}({','.join(str(p) for p in key[1:])})"
+
+
+def _dependencies(key: NodeKey) -> List[NodeKey]:
+    kind = key[0]
+    if kind == 'macd':
+        return [('ema', key[1]), ('ema', key[2])]
+    if kind == 'bb':
+        return [('sma', key[1]), ('std', key[1])]
+    return []
+
+
+def _ema_warmup(span: float, tolerance: float) -> int:
+    # Kesilen geçmişin ağırlığı decay**n <= tolerance olacak bar sayısı
+    decay = 1.0 - 2.0 / (span + 1.0)
+    if decay <= 0:
+        return 1
+    return int(math.ceil(math.log(tolerance) / math.log(decay)))
+
+
+def _warmup(key: NodeKey, tolerance: float) -> int:
+    """
+    Düğümün ilk doğru çıktısı için gereken ek bar sayısı (bağımlılıklar dahil)
+    """
+    kind = key[0]
+    if kind in ('sma', 'std'):
+        return key[1] - 1
+    if kind == 'rsi':
+        return key[1]
+    if kind == 'ema':
+        return _ema_warmup(key[1], tolerance)
+    if kind == 'macd':
+        return max(_ema_warmup(key[1], tolerance), _ema_warmup(key[2], tolerance)) + _ema_warmup(key[3], tolerance)
+    if kind == 'bb':
+        return key[1] - 1
+    if kind == 'stoch':
+        return key[1] + key[2] - 2
+    raise ValueError(f"Bilinmeyen gösterge: {kind}")
+
+
+def _compute(key: NodeKey, values: Dict[NodeKey, object], inputs: Dict[str, np.ndarray]):
+    kind = key[0]
+    close = inputs['close']
+    if kind == 'sma':
+        return kernels.rolling_mean(close, key[1])
+    if kind == 'std':
+        return kernels.rolling_std(close, key[1])
+    if kind == 'ema':
+        return kernels.ema(close, key[1])
+    if kind == 'rsi':
+        return kernels.rsi(close, key[1])
+    if kind == 'macd':
+        macd = values[('ema', key[1])] - values[('ema', key[2])]
+        signal = kernels.ema(macd, key[3])
+        return macd, signal, macd - signal
+    if kind == 'bb':
+        middle = values[('sma', key[1])]
+        deviation = values[('std', key[1])] * key[2]
+        return middle + deviation, middle, middle - deviation
+    if kind == 'stoch':
+        return kernels.stochastic(inputs['high'], inputs['low'], close, key[1], key[2])
+    raise ValueError(f"Bilinmeyen gösterge: {kind}")
+
+
+class IndicatorPlan:
+    """
+    İstenen gösterge çıktılarından (ör. 'rsi(14)', 'bb(20,2)', 'sma(20)') kurulan
+    bağımlılık grafiği. Ara seriler (ortak EMA'lar, SMA'lar) bir kez hesaplanır;
+    sonuç, her çıktı için bir kolon içeren DataFrame'dir. Çok çıktılı göstergeler
+    'macd(12,26,9).signal', 'bb(20,2).upper', 'stoch(14,3).k' şeklinde adlandırılır.
+    """
+    def __init__(self, specs: Iterable[str], tail_tolerance: float = 1e-6):
+        self.tail_tolerance = tail_tolerance
+        self.outputs: List[NodeKey] = []
+        for spec in specs:
+            key = parse_spec(spec)
+            if key not in self.outputs:
+                self.outputs.append(key)
+        self.nodes = self._resolve(self.outputs)
+        self.key = tuple(sorted(spec_name(key) for key in self.outputs))
+        self.columns = [column for key in self.outputs for column in self._columns(key)]
+        self.inputs = sorted({'close'} | ({'high', 'low'} if any(key[0] == 'stoch' for key in self.nodes) else set()))
+
+    @staticmethod
+    def _resolve(outputs: List[NodeKey]) -> List[NodeKey]:
+        # Bağımlılıklar önce gelecek şekilde sıralı, tekrarsız düğüm listesi
+        ordered: List[NodeKey] = []
+
+        def visit(key: NodeKey):
+            if key in ordered:
+                return
+            for dependency in _dependencies(key):
+                visit(dependency)
+            ordered.append(key)
+
+        for key in outputs:
+            visit(key)
+        return ordered
+
+    @staticmethod
+    def _columns(key: NodeKey) -> List[str]:
+        name = spec_name(key)
+        if key[0] in OUTPUT_FIELDS:
+            return [f"{name}.{field}" for field in OUTPUT_FIELDS[key[0]]]
+        return [name]
+
+    def warmup(self) -> int:
+        """
+        Son değer modunda gereken en uzun ısınma penceresi
+        """
+        return max((_warmup(key, self.tail_tolerance) for key in self.outputs), default=0)
+
+    def evaluate(self, data: pd.DataFrame, tail: Optional[int] = None) -> pd.DataFrame:
+        """
+        Planı bir OHLCV DataFrame'i üzerinde çalıştır. tail verilirse yalnızca son
+        `tail` satır, gereken en kısa pencere üzerinden hesaplanır (EMA tabanlı
+        çıktılarda hata tail_tolerance × kapanış aralığı mertebesinde).
+        """
+        start = 0 if tail is None else max(0, len(data) - (self.warmup() + tail))
+        inputs = {name: np.ascontiguousarray(data[name].to_numpy(dtype=np.float64)[start:]) for name in self.inputs}
+        values: Dict[NodeKey, object] = {}
+        for key in self.nodes:
+            values[key] = _compute(key, values, inputs)
+
+        rows = len(data) - start if tail is None else min(tail, len(data))
+        columns = {}
+        for key in self.outputs:
+            result = values[key] if isinstance(values[key], tuple) else (values[key],)
+            for column, series in zip(self._columns(key), result):
+                columns[column] = series[len(series) - rows:]
+        return pd.DataFrame(columns, index=data.index[len(data) - rows:])
+
+    def refresh_last(self, previous: pd.DataFrame, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Yalnızca son barı değişmiş veri için önceki sonucun son satırını, ısınma
+        penceresi üzerinden yeniden hesaplayıp önceki satırların arkasına ekle
+        """
+        last = self.evaluate(data, tail=1)
+        if previous.empty:
+            return last
+        return pd.concat([previous.iloc[:-1], last])
+
+
+_plans: Dict[Tuple, IndicatorPlan] = {}
+_plans_lock = threading.Lock()
+
+
+def get_plan(specs: Iterable[str]) -> IndicatorPlan:
+    """
+    Aynı gösterge kümesi için paylaşılan plan nesnesi
+    """
+    specs = list(specs)
+    key = tuple(sorted(spec_name(parse_spec(spec)) for spec in specs))
+    with _plans_lock:
+        if key not in _plans:
+            _plans[key] = IndicatorPlan(specs)
+        return _plans[key]
@@ -0,0 +1,215 @@
+import os
+import logging
+from typing import Tuple
+import numpy as np
+from . import panel_indicators
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    numba = None
+    NUMBA_AVAILABLE = False
+
+BACKENDS = ('auto', 'numba', 'numpy', 'pandas')
+# Döngülerde kayan toplamın baştan yeniden hesaplanma aralığı (yuvarlama hatası birikmesin)
+RESYNC_INTERVAL = 1024
+
+logger = logging.getLogger(__name__)
+
+
+# --- Döngü kernelleri: Numba varsa derlenir, yoksa düz Python olarak kalır ---
+
+def _ema_loop(values, span):
+    n = values.shape[0]
+    out = np.empty(n)
+    decay = 1.0 - 2.0 / (span + 1.0)
+    numerator = 0.0
+    denominator = 0.0
+    for i in range(n):
+        x = values[i]
+        if x == x:
+            numerator = x + decay * numerator
+            denominator = 1.0 + decay * denominator
+        else:
+            numerator *= decay
+            denominator *= decay
+        out[i] = numerator / denominator if denominator > 0 else np.nan
+    return out
+
+
+def _rolling_mean_loop(values, window):
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    total = 0.0
+    count = 0
+    for i in range(n):
+        x = values[i]
+        if x == x:
+            total += x
+            count += 1
+        if i >= window:
+            old = values[i - window]
+            if old == old:
+                total -= old
+                count -= 1
+        if i % RESYNC_INTERVAL == RESYNC_INTERVAL - 1:
+            total = 0.0
+            for j in range(max(0, i - window + 1), i + 1):
+                if values[j] == values[j]:
+                    total += values[j]
+        if count == window:
+            out[i] = total / window
+    return out
+
+
+def _rolling_extreme_loop(values, window, sign):
+    # sign=1 kayan minimum, sign=-1 kayan maksimum; indeksler monoton deque'de
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    queue = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+    last_nan = -window
+    for i in range(n):
+        x = values[i]
+        if x != x:
+            last_nan = i
+        else:
+            while tail > head and sign * values[queue[tail - 1]] >= sign * x:
+                tail -= 1
+            queue[tail] = i
+            tail += 1
+        while tail > head and queue[head] <= i - window:
+            head += 1
+        if i >= window - 1 and i - last_nan >= window and tail > head:
+            out[i] = values[queue[head]]
+    return out
+
+
+def _ratio(numerator, denominator):
+    # NumPy bölme anlamı: 0/0 → NaN, x/0 → ±inf
+    if denominator != 0:
+        return numerator / denominator
+    if numerator != numerator or numerator == 0:
+        return np.nan
+    return np.inf if numerator > 0 else -np.inf
+
+
+def _rsi_loop(close, period):
+    n = close.shape[0]
+    gains = np.zeros(n)
+    losses = np.zeros(n)
+    for i in range(1, n):
+        delta = close[i] - close[i - 1]
+        if delta > 0:
+            gains[i] = delta
+        elif delta < 0:
+            losses[i] = -delta
+    gain = _rolling_mean_loop(gains, period)
+    loss = _rolling_mean_loop(losses, period)
+    out = np.empty(n)
+    for i in range(n):
+        rs = _ratio(gain[i], loss[i])
+        out[i] = 100.0 - 100.0 / (1.0 + rs)
+    return out
+
+
+def _stochastic_loop(high, low, close, k_period, d_period):
+    low_min = _rolling_extreme_loop(low, k_period, 1.0)
+    high_max = _rolling_extreme_loop(high, k_period, -1.0)
+    n = close.shape[0]
+    k = np.empty(n)
+    for i in range(n):
+        k[i] = 100.0 * _ratio(close[i] - low_min[i], high_max[i] - low_min[i])
+    return k, _rolling_mean_loop(k, d_period)
+
+
+if NUMBA_AVAILABLE:
+    _jit = numba.njit(cache=True, nogil=True)
+    _ema_loop = _jit(_ema_loop)
+    _rolling_mean_loop = _jit(_rolling_mean_loop)
+    _rolling_extreme_loop = _jit(_rolling_extreme_loop)
+    _ratio = _jit(_ratio)
+    _rsi_loop = _jit(_rsi_loop)
+    _stochastic_loop = _jit(_stochastic_loop)
+
+
+# --- Backend seçimi ---
+
+def _resolve(backend: str) -> str:
+    if backend not in BACKENDS:
+        raise ValueError(f"Bilinmeyen gösterge backend'i: {backend} (seçenekler: {', '.join(BACKENDS)})")
+    if backend == 'auto':
+        return 'numba' if NUMBA_AVAILABLE else 'numpy'
+    if backend == 'numba' and not NUMBA_AVAILABLE:
+        logger.warning("Numba kurulu değil, NumPy backend'i kullanılıyor")
+        return 'numpy'
+    return backend
+
+
+_backend = _resolve(os.environ.get("INDICATOR_BACKEND", "auto"))
+
+
+def set_backend(backend: str) -> str:
+    """
+    Gösterge kernellerinin global backend'ini seç: auto, numba, numpy veya pandas.
+    'pandas' mevcut rolling/ewm yoluna döner. Etkin backend döndürülür.
+    """
+    global _backend
+    _backend = _resolve(backend)
+    return _backend
+
+
+def get_backend() -> str:
+    return _backend
+
+
+def _as_array(values) -> np.ndarray:
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def _numpy_1d(func, *arrays, **params):
+    result = func(*(array[:, None] for array in arrays), **params)
+    if isinstance(result, tuple):
+        return tuple(r[:, 0] for r in result)
+    return result[:, 0]
+
+
+# --- Kernel API (1 boyutlu diziler) ---
+
+def ema(values, span: int, backend: str = None) -> np.ndarray:
+    """
+    pandas ewm(span=span).mean() karşılığı
+    """
+    values = _as_array(values)
+    if (backend or _backend) == 'numba':
+        return _ema_loop(values, span)
+    return _numpy_1d(panel_indicators.ewm_mean, values, span=span)
+
+
+def rolling_mean(values, window: int, backend: str = None) -> np.ndarray:
+    values = _as_array(values)
+    if (backend or _backend) == 'numba':
+        return _rolling_mean_loop(values, window)
+    return _numpy_1d(panel_indicators.rolling_mean, values, window=window)
+
+
+def rolling_std(values, window: int, backend: str = None) -> np.ndarray:
+    # Kayan std için ayrı döngü kerneli yok; kümülatif toplamlı NumPy yolu her backend'de yeterince hızlı
+    return _numpy_1d(panel_indicators.rolling_std, _as_array(values), window=window)
+
+
+def rsi(close, period: int = 14, backend: str = None) -> np.ndarray:
+    close = _as_array(close)
+    if (backend or _backend) == 'numba':
+        return _rsi_loop(close, period)
+    return _numpy_1d(panel_indicators.rsi, close, period=period)
+
+
+def stochastic(high, low, close, k_period: int = 14, d_period: int = 3,
+               backend: str = None) -> Tuple[np.ndarray, np.ndarray]:
+    high, low, close = _as_array(high), _as_array(low), _as_array(close)
+    if (backend or _backend) == 'numba':
+        return _stochastic_loop(high, low, close, k_period, d_period)
+    return _numpy_1d(panel_indicators.stochastic, high, low, close, k_period=k_period, d_period=d_period)
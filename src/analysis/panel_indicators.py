@@ -0,0 +1,256 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Tuple
+
+# EWM bloklarında decay**-i ölçeğinin üst sınırı (doğal log); float64 taşmadan kalır
+EWM_SCALE_LIMIT = 300.0
+
+
+def _valid_and_filled(x: np.ndarray) -> Tuple[np.ndarray, np.ndarray, bool]:
+    valid = ~np.isnan(x)
+    complete = bool(valid.all())
+    if complete:
+        return valid, x, complete
+    filled = x.copy()
+    filled[~valid] = 0.0
+    return valid, filled, complete
+
+
+def _window_sums(values: np.ndarray, window: int) -> np.ndarray:
+    # Zaman ekseninde (axis 0) kümülatif toplamdan kayan pencere toplamı
+    cumulative = np.zeros((values.shape[0] + 1,) + values.shape[1:])
+    np.cumsum(values, axis=0, out=cumulative[1:])
+    return cumulative[window:] - cumulative[:-window]
+
+
+def _centered(x: np.ndarray, valid: np.ndarray, filled: np.ndarray,
+              complete: bool) -> Tuple[np.ndarray, np.ndarray]:
+    # Kümülatif toplamda hassasiyet kaybını azaltmak için sütunun ilk geçerli değerini çıkar
+    first = valid.argmax(axis=0)
+    offset = x[first, np.arange(x.shape[1])]
+    offset[np.isnan(offset)] = 0.0
+    centered = filled - offset
+    if not complete:
+        centered[~valid] = 0.0
+    return centered, offset
+
+
+def _apply_counts(out: np.ndarray, values: np.ndarray, valid: np.ndarray, window: int, complete: bool):
+    if not complete:
+        counts = _window_sums(valid.astype(np.float64), window)
+        values[counts < window] = np.nan
+    out[window - 1:] = values
+
+
+def rolling_mean(x: np.ndarray, window: int) -> np.ndarray:
+    """
+    pandas rolling(window).mean() karşılığı; penceresinde NaN olan satırlar NaN
+    """
+    out = np.full(x.shape, np.nan)
+    if window > x.shape[0]:
+        return out
+    valid, filled, complete = _valid_and_filled(x)
+    centered, offset = _centered(x, valid, filled, complete)
+    means = _window_sums(centered, window) / window + offset
+    _apply_counts(out, means, valid, window, complete)
+    return out
+
+
+def rolling_std(x: np.ndarray, window: int) -> np.ndarray:
+    """
+    pandas rolling(window).std() (ddof=1) karşılığı
+    """
+    out = np.full(x.shape, np.nan)
+    if window > x.shape[0] or window < 2:
+        return out
+    valid, filled, complete = _valid_and_filled(x)
+    centered, _ = _centered(x, valid, filled, complete)
+    sums = _window_sums(centered, window)
+    squares = _window_sums(centered * centered, window)
+    variance = np.maximum((squares - sums * sums / window) / (window - 1), 0.0)
+    _apply_counts(out, np.sqrt(variance), valid, window, complete)
+    return out
+
+
+def _rolling_extreme(x: np.ndarray, window: int, reducer, fill: float) -> np.ndarray:
+    out = np.full(x.shape, np.nan)
+    if window > x.shape[0]:
+        return out
+    valid = ~np.isnan(x)
+    complete = bool(valid.all())
+    source = x
+    if not complete:
+        source = x.copy()
+        source[~valid] = fill
+    windows = np.lib.stride_tricks.sliding_window_view(source, window, axis=0)
+    _apply_counts(out, reducer(windows, axis=-1), valid, window, complete)
+    return out
+
+
+def rolling_min(x: np.ndarray, window: int) -> np.ndarray:
+    return _rolling_extreme(x, window, np.min, np.inf)
+
+
+def rolling_max(x: np.ndarray, window: int) -> np.ndarray:
+    return _rolling_extreme(x, window, np.max, -np.inf)
+
+
+def ewm_mean(x: np.ndarray, span: int) -> np.ndarray:
+    """
+    pandas ewm(span=span).mean() (adjust=True, ignore_na=False) karşılığı.
+    Özyineleme, decay**-i ölçeklemesiyle zaman bloklarında kümülatif toplama
+    çevrilir; tüm sütunlar tek seferde hesaplanır.
+    """
+    decay = 1.0 - 2.0 / (span + 1.0)
+    valid, filled, _ = _valid_and_filled(x)
+    weights = valid.astype(np.float64)
+    if decay <= 0.0:
+        numerator, denominator = filled.copy(), weights.copy()
+        for t in range(1, x.shape[0]):
+            missing = ~valid[t]
+            numerator[t][missing] = numerator[t - 1][missing]
+            denominator[t][missing] = denominator[t - 1][missing]
+    else:
+        # decay**-block EWM_SCALE_LIMIT'i aşmayacak en uzun blok
+        block = max(1, min(x.shape[0], int(EWM_SCALE_LIMIT / -np.log(decay))))
+        steps = np.arange(block, dtype=np.float64)
+        grow = (decay ** -steps).reshape((block,) + (1,) * (x.ndim - 1))
+        shrink = (decay ** steps).reshape(grow.shape)
+        numerator = np.empty(x.shape)
+        denominator = np.empty(x.shape)
+        carry_num = np.zeros(x.shape[1:])
+        carry_den = np.zeros(x.shape[1:])
+        for start in range(0, x.shape[0], block):
+            end = min(start + block, x.shape[0])
+            n = end - start
+            numerator[start:end] = shrink[:n] * (np.cumsum(filled[start:end] * grow[:n], axis=0) + decay * carry_num)
+            denominator[start:end] = shrink[:n] * (np.cumsum(weights[start:end] * grow[:n], axis=0) + decay * carry_den)
+            carry_num = numerator[end - 1]
+            carry_den = denominator[end - 1]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(denominator > 0, numerator / denominator, np.nan)
+
+
+def _leading_mask(valid: np.ndarray) -> np.ndarray:
+    # Her sütunun ilk geçerli değerinden önceki satırlar (eksik geçmiş)
+    started = np.maximum.accumulate(valid, axis=0)
+    return ~started
+
+
+def rsi(close: np.ndarray, period: int = 14) -> np.ndarray:
+    """
+    TechnicalAnalyzer.calculate_rsi karşılığı (zaman ekseni 0)
+    """
+    delta = np.full(close.shape, np.nan)
+    delta[1:] = close[1:] - close[:-1]
+    # Tek sembollü hesaplamadaki gibi NaN fark sıfır sayılır, eksik geçmiş ise dışarıda kalır
+    leading = _leading_mask(~np.isnan(close))
+    gain = np.maximum(delta, 0.0)
+    loss = np.maximum(-delta, 0.0)
+    for series in (gain, loss):
+        series[np.isnan(series)] = 0.0
+        series[leading] = np.nan
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rs = rolling_mean(gain, period) / rolling_mean(loss, period)
+        return 100 - 100 / (1 + rs)
+
+
+def stochastic(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+               k_period: int = 14, d_period: int = 3) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    TechnicalAnalyzer.calculate_stochastic karşılığı: (k, d)
+    """
+    low_min = rolling_min(low, k_period)
+    high_max = rolling_max(high, k_period)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        k = 100 * ((close - low_min) / (high_max - low_min))
+    return k, rolling_mean(k, d_period)
+
+
+class IndicatorPanel:
+    """
+    Çok sembollü (zaman × sembol) fiyat paneli üzerinde tüm göstergeleri
+    sütun bazlı tek vektörel geçişte hesaplar. Kısa geçmişli semboller
+    baştaki NaN'larla maskelenir; sonuçlar her sembolün kendi DataFrame'i
+    üzerinde TechnicalAnalyzer ile hesaplananla aynıdır.
+    """
+    def __init__(self, close: pd.DataFrame, high: Optional[pd.DataFrame] = None,
+                 low: Optional[pd.DataFrame] = None, volume: Optional[pd.DataFrame] = None):
+        self.index = close.index
+        self.symbols = list(close.columns)
+        self.close = self._array(close)
+        self.high = self._array(high)
+        self.low = self._array(low)
+        self.volume = self._array(volume)
+
+    @staticmethod
+    def _array(frame: Optional[pd.DataFrame]) -> Optional[np.ndarray]:
+        # Zaman ekseni boyunca pencere işlemleri için satır sıralı (C) dizi
+        if frame is None:
+            return None
+        return np.ascontiguousarray(frame.to_numpy(dtype=np.float64))
+
+    @classmethod
+    def from_frames(cls, frames: Dict[str, pd.DataFrame]) -> 'IndicatorPanel':
+        """
+        Sembol → OHLCV DataFrame sözlüğünden paneli kur (index'ler birleştirilir)
+        """
+        fields = {}
+        for field in ['close', 'high', 'low', 'volume']:
+            columns = {symbol: df[field] for symbol, df in frames.items() if field in df}
+            fields[field] = pd.DataFrame(columns) if len(columns) == len(frames) else None
+        return cls(fields['close'], fields['high'], fields['low'], fields['volume'])
+
+    def _frame(self, values: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame(values, index=self.index, columns=self.symbols)
+
+    def _require_high_low(self):
+        if self.high is None or self.low is None:
+            raise ValueError("Bu gösterge için high/low paneli gerekli")
+
+    def rsi(self, period: int = 14) -> pd.DataFrame:
+        return self._frame(rsi(self.close, period))
+
+    def macd(self, fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        macd = ewm_mean(self.close, fast) - ewm_mean(self.close, slow)
+        macd_signal = ewm_mean(macd, signal)
+        return self._frame(macd), self._frame(macd_signal), self._frame(macd - macd_signal)
+
+    def moving_averages(self, periods: List[int] = [20, 50, 200]) -> Dict[str, pd.DataFrame]:
+        ma_dict = {}
+        for period in periods:
+            ma_dict[f'sma_{period}'] = self._frame(rolling_mean(self.close, period))
+            ma_dict[f'ema_{period}'] = self._frame(ewm_mean(self.close, period))
+        return ma_dict
+
+    def bollinger_bands(self, period: int = 20, std: int = 2) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        sma = rolling_mean(self.close, period)
+        deviation = rolling_std(self.close, period) * std
+        return self._frame(sma + deviation), self._frame(sma), self._frame(sma - deviation)
+
+    def stochastic(self, k_period: int = 14, d_period: int = 3) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        self._require_high_low()
+        k, d = stochastic(self.high, self.low, self.close, k_period, d_period)
+        return self._frame(k), self._frame(d)
+
+    def compute_all(self, rsi_period: int = 14, macd: Tuple[int, int, int] = (12, 26, 9),
+                    ma_periods: List[int] = [20, 50], bb: Tuple[int, int] = (20, 2),
+                    stochastic: Tuple[int, int] = (14, 3)) -> Dict[str, pd.DataFrame]:
+        """
+        Tüm göstergeleri hesapla: gösterge adı → (zaman × sembol) DataFrame
+        """
+        results = {'rsi': self.rsi(rsi_period)}
+        results['macd'], results['macd_signal'], results['macd_histogram'] = self.macd(*macd)
+        results.update(self.moving_averages(ma_periods))
+        results['bollinger_upper'], results['bollinger_middle'], results['bollinger_lower'] = self.bollinger_bands(*bb)
+        if self.high is not None and self.low is not None:
+            results['stochastic_k'], results['stochastic_d'] = self.stochastic(*stochastic)
+        return results
+
+    def latest(self, **params) -> pd.DataFrame:
+        """
+        Tarama için her sembolün son değerleri: (sembol × gösterge) DataFrame
+        """
+        results = self.compute_all(**params)
+        return pd.DataFrame({name: frame.iloc[-1] for name, frame in results.items()})
@@ -0,0 +1,247 @@
+import math
+from collections import deque
+from typing import Any, Dict, Optional, Tuple
+import pandas as pd
+
+NAN = float('nan')
+
+
+def _close(bar: Any) -> float:
+    # Bar bir sayı veya 'close' alanı olan eşleme (dict, DataFrame satırı) olabilir
+    if isinstance(bar, (int, float)):
+        return float(bar)
+    return float(bar['close'])
+
+
+class StreamingSMA:
+    """
+    Kayan ortalama; toplam her güncellemede O(1) ile taşınır
+    """
+    def __init__(self, period: int):
+        self.period = period
+        self._window = deque()
+        self._sum = 0.0
+        self._updates = 0
+
+    def update(self, bar: Any) -> float:
+        x = _close(bar)
+        self._window.append(x)
+        self._sum += x
+        if len(self._window) > self.period:
+            self._sum -= self._window.popleft()
+        self._updates += 1
+        # Kayan toplamda biriken yuvarlama hatasını ara ara sıfırla
+        if self._updates % (self.period * 64) == 0:
+            self._sum = math.fsum(self._window)
+        return self.value()
+
+    def value(self) -> float:
+        if len(self._window) < self.period:
+            return NAN
+        return self._sum / self.period
+
+
+class StreamingEMA:
+    """
+    pandas ewm(span=...).mean() (adjust=True) ile birebir aynı üstel ortalama.
+    Ağırlıklı pay ve payda ayrı taşınır: her güncelleme O(1).
+    """
+    def __init__(self, span: int):
+        self.span = span
+        self.alpha = 2.0 / (span + 1.0)
+        self._decay = 1.0 - self.alpha
+        self._numerator = 0.0
+        self._denominator = 0.0
+
+    def update(self, bar: Any) -> float:
+        x = _close(bar)
+        if math.isnan(x):
+            return self.value()
+        self._numerator = x + self._decay * self._numerator
+        self._denominator = 1.0 + self._decay * self._denominator
+        return self.value()
+
+    def value(self) -> float:
+        if self._denominator == 0.0:
+            return NAN
+        return self._numerator / self._denominator
+
+
+class StreamingMACD:
+    """
+    TechnicalAnalyzer.calculate_macd ile aynı MACD: (macd, signal, histogram)
+    """
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self.fast = StreamingEMA(fast)
+        self.slow = StreamingEMA(slow)
+        self.signal = StreamingEMA(signal)
+        self._macd = NAN
+
+    def update(self, bar: Any) -> Tuple[float, float, float]:
+        x = _close(bar)
+        self._macd = self.fast.update(x) - self.slow.update(x)
+        self.signal.update(self._macd)
+        return self.value()
+
+    def value(self) -> Tuple[float, float, float]:
+        signal = self.signal.value()
+        return self._macd, signal, self._macd - signal
+
+
+class StreamingRSI:
+    """
+    TechnicalAnalyzer.calculate_rsi ile aynı RSI (kazanç/kayıpların basit kayan ortalaması)
+    """
+    def __init__(self, period: int = 14):
+        self.period = period
+        self._gains = StreamingSMA(period)
+        self._losses = StreamingSMA(period)
+        self._previous: Optional[float] = None
+
+    def update(self, bar: Any) -> float:
+        x = _close(bar)
+        # Toplu hesaplamadaki gibi ilk barın (NaN) farkı sıfır sayılır
+        delta = x - self._previous if self._previous is not None else 0.0
+        self._gains.update(delta if delta > 0 else 0.0)
+        self._losses.update(-delta if delta < 0 else 0.0)
+        self._previous = x
+        return self.value()
+
+    def value(self) -> float:
+        gain = self._gains.value()
+        loss = self._losses.value()
+        if math.isnan(gain) or math.isnan(loss):
+            return NAN
+        if loss == 0.0:
+            return 100.0 if gain > 0 else NAN
+        return 100.0 - 100.0 / (1.0 + gain / loss)
+
+
+class StreamingBollingerBands:
+    """
+    Kayan pencerede Welford varyansı (ddof=1) ile Bollinger bantları: (upper, middle, lower)
+    """
+    def __init__(self, period: int = 20, std: float = 2):
+        self.period = period
+        self.std = std
+        self._window = deque()
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def update(self, bar: Any) -> Tuple[float, float, float]:
+        x = _close(bar)
+        self._window.append(x)
+        if len(self._window) <= self.period:
+            # Pencere dolana kadar standart Welford ekleme
+            n = len(self._window)
+            delta = x - self._mean
+            self._mean += delta / n
+            self._m2 += delta * (x - self._mean)
+        else:
+            # Dolu pencerede en eski değeri çıkarıp yenisini ekle
+            old = self._window.popleft()
+            old_mean = self._mean
+            self._mean += (x - old) / self.period
+            self._m2 += (x - old) * (x - self._mean + old - old_mean)
+            if self._m2 < 0:
+                self._m2 = 0.0
+        return self.value()
+
+    def value(self) -> Tuple[float, float, float]:
+        if len(self._window) < self.period:
+            return NAN, NAN, NAN
+        deviation = math.sqrt(self._m2 / (self.period - 1)) if self.period > 1 else NAN
+        return self._mean + deviation * self.std, self._mean, self._mean - deviation * self.std
+
+
+class StreamingStochastic:
+    """
+    Monoton deque'lerle kayan en düşük/en yüksek; (k, d)
+    """
+    def __init__(self, k_period: int = 14, d_period: int = 3):
+        self.k_period = k_period
+        self._lows = deque()
+        self._highs = deque()
+        self._index = -1
+        self._k = NAN
+        self._d = StreamingSMA(d_period)
+
+    def update(self, bar: Any) -> Tuple[float, float]:
+        high, low, close = float(bar['high']), float(bar['low']), float(bar['close'])
+        self._index += 1
+        i = self._index
+        while self._lows and self._lows[-1][1] >= low:
+            self._lows.pop()
+        self._lows.append((i, low))
+        while self._highs and self._highs[-1][1] <= high:
+            self._highs.pop()
+        self._highs.append((i, high))
+        oldest = i - self.k_period + 1
+        if self._lows[0][0] < oldest:
+            self._lows.popleft()
+        if self._highs[0][0] < oldest:
+            self._highs.popleft()
+
+        if i + 1 < self.k_period:
+            self._k = NAN
+        else:
+            lowest, highest = self._lows[0][1], self._highs[0][1]
+            span = highest - lowest
+            self._k = 100.0 * (close - lowest) / span if span != 0 else NAN
+        if not math.isnan(self._k):
+            self._d.update(self._k)
+        return self.value()
+
+    def value(self) -> Tuple[float, float]:
+        return self._k, self._d.value()
+
+
+class StreamingIndicators:
+    """
+    Bir sembol/zaman dilimi için göstergelerin bar başına O(1) güncellenen kümesi.
+    Varsayılan parametreler TechnicalAnalyzer varsayılanlarıyla aynıdır.
+    """
+    def __init__(self, rsi_period: int = 14, macd: Tuple[int, int, int] = (12, 26, 9),
+                 sma_periods: Tuple[int, ...] = (20, 50), bb: Tuple[int, float] = (20, 2),
+                 stochastic: Tuple[int, int] = (14, 3)):
+        self.rsi = StreamingRSI(rsi_period)
+        self.macd = StreamingMACD(*macd)
+        self.smas = {period: StreamingSMA(period) for period in sma_periods}
+        self.bollinger = StreamingBollingerBands(*bb)
+        self.stochastic = StreamingStochastic(*stochastic)
+
+    def update(self, bar: Any) -> Dict[str, float]:
+        self.rsi.update(bar)
+        self.macd.update(bar)
+        for sma in self.smas.values():
+            sma.update(bar)
+        self.bollinger.update(bar)
+        self.stochastic.update(bar)
+        return self.value()
+
+    def warm_up(self, data: pd.DataFrame) -> Dict[str, float]:
+        """
+        Geçmiş barlarla durumu doldur
+        """
+        for high, low, close in data[['high', 'low', 'close']].itertuples(index=False, name=None):
+            self.update({'high': high, 'low': low, 'close': close})
+        return self.value()
+
+    def value(self) -> Dict[str, float]:
+        macd, macd_signal, macd_histogram = self.macd.value()
+        upper, middle, lower = self.bollinger.value()
+        k, d = self.stochastic.value()
+        values = {
+            'rsi': self.rsi.value(),
+            'macd': macd,
+            'macd_signal': macd_signal,
+            'macd_histogram': macd_histogram,
+            'bollinger_upper': upper,
+            'bollinger_middle': middle,
+            'bollinger_lower': lower,
+            'stochastic_k': k,
+            'stochastic_d': d
+        }
+        for period, sma in self.smas.items():
+            values[f'sma_{period}'] = sma.value()
+        return values
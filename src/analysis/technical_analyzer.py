@@ -2,8 +2,14 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional
 import logging
+from . import kernels
 
 class TechnicalAnalyzer:
+    """
+    Tek seferlik gösterge hesapları (pandas veya seçili kernel backend'i).
+    Strateji değerlendirmesi önbellekli ve son değer modlu IndicatorPlan
+    (StrategyManager.compute_indicators) üzerinden yapılır.
+    """
     def __init__(self):
         self.logger = self._setup_logger()
         
@@ -18,11 +24,23 @@ class TechnicalAnalyzer:
         )
         return logging.getLogger(__name__)
     
+    def _sma(self, data: pd.DataFrame, period: int) -> pd.Series:
+        if kernels.get_backend() == 'pandas':
+            return data['close'].rolling(window=period).mean()
+        return pd.Series(kernels.rolling_mean(data['close'].to_numpy(), period), index=data.index)
+    
+    def _ema(self, data: pd.DataFrame, span: int) -> pd.Series:
+        if kernels.get_backend() == 'pandas':
+            return data['close'].ewm(span=span).mean()
+        return pd.Series(kernels.ema(data['close'].to_numpy(), span), index=data.index)
+    
     def calculate_rsi(self, data: pd.DataFrame, period: int = 14) -> pd.Series:
         """
         RSI (Relative Strength Index) hesaplama
         """
         try:
+            if kernels.get_backend() != 'pandas':
+                return pd.Series(kernels.rsi(data['close'].to_numpy(), period), index=data.index)
             delta = data['close'].diff()
             gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
             loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
@@ -38,9 +56,7 @@ class TechnicalAnalyzer:
         MACD (Moving Average Convergence Divergence) hesaplama
         """
         try:
-            exp1 = data['close'].ewm(span=fast).mean()
-            exp2 = data['close'].ewm(span=slow).mean()
-            macd = exp1 - exp2
+            macd = self._ema(data, fast) - self._ema(data, slow)
             macd_signal = macd.ewm(span=signal).mean()
             macd_histogram = macd - macd_signal
             return macd, macd_signal, macd_histogram
@@ -55,8 +71,8 @@ class TechnicalAnalyzer:
         try:
             ma_dict = {}
             for period in periods:
-                ma_dict[f'sma_{period}'] = data['close'].rolling(window=period).mean()
-                ma_dict[f'ema_{period}'] = data['close'].ewm(span=period).mean()
+                ma_dict[f'sma_{period}'] = self._sma(data, period)
+                ma_dict[f'ema_{period}'] = self._ema(data, period)
             return ma_dict
         except Exception as e:
             self.logger.error(f"Moving Average hesaplama hatası: {e}")
@@ -67,7 +83,7 @@ class TechnicalAnalyzer:
         Bollinger Bands hesaplama
         """
         try:
-            sma = data['close'].rolling(window=period).mean()
+            sma = self._sma(data, period)
             rolling_std = data['close'].rolling(window=period).std()
             
             upper_band = sma + (rolling_std * std)
@@ -83,6 +99,10 @@ class TechnicalAnalyzer:
         Stochastic Oscillator hesaplama
         """
         try:
+            if kernels.get_backend() != 'pandas':
+                k, d = kernels.stochastic(data['high'].to_numpy(), data['low'].to_numpy(),
+                                          data['close'].to_numpy(), k_period, d_period)
+                return pd.Series(k, index=data.index), pd.Series(d, index=data.index)
             low_min = data['low'].rolling(window=k_period).min()
             high_max = data['high'].rolling(window=k_period).max()
             
@@ -0,0 +1,163 @@
+import logging
+from typing import Any, Dict, Optional
+import numpy as np
+import pandas as pd
+from strategies.base_strategy import BaseStrategy
+
+# Index frekansı çıkarılamazsa yıllıklandırmada kullanılacak bar sayısı (günlük kripto)
+DEFAULT_PERIODS_PER_YEAR = 365
+SECONDS_PER_YEAR = 365 * 24 * 60 * 60
+
+
+def annualization_factor(index: pd.Index) -> float:
+    """
+    Index aralığından yıllık bar sayısı (1m → 525600, 1h → 8760, 1d → 365)
+    """
+    if isinstance(index, pd.DatetimeIndex) and len(index) > 1:
+        step = pd.Series(index[:1000]).diff().median()
+        if pd.notna(step) and step.total_seconds() > 0:
+            return SECONDS_PER_YEAR / step.total_seconds()
+    return DEFAULT_PERIODS_PER_YEAR
+
+
+def positions_from_signals(signals: pd.DataFrame, allow_short: bool = False,
+                           min_confidence: float = 0.0) -> np.ndarray:
+    """
+    Sinyal serisinden hedef pozisyon: BUY → 1, SELL → 0 (açığa satışta -1),
+    HOLD ve eşik altı güven → önceki pozisyon korunur
+    """
+    signal = signals['signal'].to_numpy()
+    active = (signal != 0) & (signals['confidence'].to_numpy() >= min_confidence)
+    target = np.where(signal > 0, 1.0, -1.0 if allow_short else 0.0)
+    # Son aktif sinyalin hedefini ileri taşı
+    last = np.maximum.accumulate(np.where(active, np.arange(len(signal)), -1))
+    return np.where(last >= 0, target[np.maximum(last, 0)], 0.0)
+
+
+class Backtester:
+    """
+    Stratejilerin tüm geçmiş üzerindeki vektörel geri testi. Sinyaller bar kapanışında
+    üretilir ve bir sonraki barın açılışında, komisyon ve kayma maliyetiyle uygulanır.
+    """
+    def __init__(self, fee_rate: float = 0.001, slippage: float = 0.0005, initial_capital: float = 10000.0,
+                 allow_short: bool = False, min_confidence: float = 0.0,
+                 periods_per_year: Optional[float] = None):
+        self.logger = self._setup_logger()
+        self.fee_rate = fee_rate
+        self.slippage = slippage
+        self.initial_capital = initial_capital
+        self.allow_short = allow_short
+        self.min_confidence = min_confidence
+        self.periods_per_year = periods_per_year
+
+    def _setup_logger(self):
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(levelname)s - %(message)s',
+            handlers=[
+                logging.FileHandler('logs/backtest.log'),
+                logging.StreamHandler()
+            ]
+        )
+        return logging.getLogger(__name__)
+
+    def run(self, strategy: BaseStrategy, data: pd.DataFrame,
+            signals: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
+        """
+        Stratejiyi OHLCV verisi üzerinde test et: sinyaller, equity eğrisi, işlemler ve metrikler
+        """
+        if signals is None:
+            signals = strategy.signal_series(data)
+        result = self.simulate(data, signals)
+        result["strategy"] = strategy.name
+        self.logger.info(f"Geri test tamamlandı: {strategy.name} - getiri %{result['metrics']['total_return']*100:.2f}, "
+                         f"{result['metrics']['n_trades']} işlem")
+        return result
+
+    def simulate(self, data: pd.DataFrame, signals: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Hazır bir sinyal serisinden (signal, confidence) dolum simülasyonu
+        """
+        open_ = data['open'].to_numpy(dtype=np.float64)
+        close = data['close'].to_numpy(dtype=np.float64)
+        n = len(close)
+
+        # t kapanışındaki hedef pozisyon t+1 açılışında alınır
+        target = positions_from_signals(signals, self.allow_short, self.min_confidence)
+        position = np.zeros(n)
+        position[1:] = target[:-1]
+        previous = np.zeros(n)
+        previous[1:] = position[:-1]
+
+        prev_close = np.empty(n)
+        prev_close[0] = open_[0] if n else np.nan
+        prev_close[1:] = close[:-1]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Gece boşluğu (önceki kapanış → açılış) eski pozisyonla, gün içi hareket yenisiyle
+            gap = np.nan_to_num(open_ / prev_close - 1.0)
+            intrabar = np.nan_to_num(close / open_ - 1.0)
+        turnover = np.abs(position - previous)
+        costs = turnover * (self.fee_rate + self.slippage)
+        returns = (1.0 + previous * gap) * (1.0 + position * intrabar) - 1.0 - costs
+
+        equity = self.initial_capital * np.cumprod(1.0 + returns)
+        equity_curve = pd.DataFrame({
+            "equity": equity,
+            "returns": returns,
+            "position": position
+        }, index=data.index)
+        trades = self._trades(data, position, open_, close)
+        return {
+            "signals": signals,
+            "equity_curve": equity_curve,
+            "trades": trades,
+            "metrics": self._metrics(equity_curve, trades, data.index)
+        }
+
+    def _trades(self, data: pd.DataFrame, position: np.ndarray, open_: np.ndarray,
+                close: np.ndarray) -> pd.DataFrame:
+        # Pozisyonun değiştiği barlar giriş/çıkış noktalarıdır (fiyat: o barın açılışı)
+        columns = ["entry_time", "exit_time", "side", "entry_price", "exit_price", "return", "bars"]
+        changes = np.flatnonzero(np.diff(position, prepend=0.0) != 0)
+        if len(changes) == 0:
+            return pd.DataFrame(columns=columns)
+
+        entries = changes[position[changes] != 0]
+        # Her girişin çıkışı bir sonraki değişim; açık kalan pozisyon son kapanışta değerlenir
+        following = np.searchsorted(changes, entries, side='right')
+        has_exit = following < len(changes)
+        exits = np.where(has_exit, changes[np.minimum(following, len(changes) - 1)], len(position) - 1)
+        side = position[entries]
+        entry_price = open_[entries]
+        exit_price = np.where(has_exit, open_[exits], close[exits])
+        cost = 2 * (self.fee_rate + self.slippage)
+        return pd.DataFrame({
+            "entry_time": data.index[entries],
+            "exit_time": data.index[exits],
+            "side": np.where(side > 0, "LONG", "SHORT"),
+            "entry_price": entry_price,
+            "exit_price": exit_price,
+            "return": side * (exit_price / entry_price - 1.0) - cost,
+            "bars": exits - entries
+        })
+
+    def _metrics(self, equity_curve: pd.DataFrame, trades: pd.DataFrame, index: pd.Index) -> Dict[str, Any]:
+        equity = equity_curve["equity"].to_numpy()
+        returns = equity_curve["returns"].to_numpy()
+        if len(equity) == 0:
+            return {"total_return": 0.0, "sharpe": 0.0, "max_drawdown": 0.0,
+                    "n_trades": 0, "win_rate": 0.0, "exposure": 0.0}
+
+        periods = self.periods_per_year or annualization_factor(index)
+        volatility = returns.std(ddof=1) if len(returns) > 1 else 0.0
+        sharpe = float(returns.mean() / volatility * np.sqrt(periods)) if volatility > 0 else 0.0
+        peak = np.maximum.accumulate(equity)
+        drawdown = equity / peak - 1.0
+        return {
+            "total_return": float(equity[-1] / self.initial_capital - 1.0),
+            "sharpe": sharpe,
+            "max_drawdown": float(-drawdown.min()),
+            "n_trades": int(len(trades)),
+            "win_rate": float((trades["return"] > 0).mean()) if len(trades) else 0.0,
+            "exposure": float((equity_curve["position"] != 0).mean())
+        }
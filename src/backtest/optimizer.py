@@ -0,0 +1,410 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+import pandas as pd
+from analysis.indicator_cache import data_fingerprint
+from strategies.scalp_strategy import ScalpStrategy
+from strategies.swing_strategy import SwingStrategy
+from strategies.daily_strategy import DailyStrategy
+from .engine import Backtester
+
+STRATEGIES = {
+    'scalp': ScalpStrategy,
+    'swing': SwingStrategy,
+    'daily': DailyStrategy
+}
+SHARED_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+# Worker'a aktarılan geri test ayarları
+BACKTEST_FIELDS = ['fee_rate', 'slippage', 'initial_capital', 'allow_short', 'min_confidence', 'periods_per_year']
+SEARCH_METHODS = ('grid', 'random', 'bayesian')
+
+ParameterSpace = Dict[str, Sequence[Any]]
+Window = Tuple[int, int]
+
+
+# --- Paylaşılan bellekteki OHLCV ---
+
+class SharedOHLCV:
+    """
+    OHLCV kolonlarını ve zaman damgalarını tek bir paylaşılan bellek bloğuna koyar.
+    Worker'lar bloğa adıyla bağlanır; her görevde DataFrame pickle edilmez.
+    """
+    def __init__(self, data: pd.DataFrame):
+        self.length = len(data)
+        self.datetime_index = isinstance(data.index, pd.DatetimeIndex)
+        size = max(1, self.length * 8 * (len(SHARED_COLUMNS) + 1))
+        self.shm = shared_memory.SharedMemory(create=True, size=size)
+        block = np.ndarray((len(SHARED_COLUMNS) + 1, self.length), dtype=np.float64, buffer=self.shm.buf)
+        for row, column in enumerate(SHARED_COLUMNS):
+            block[row] = data[column].to_numpy(dtype=np.float64)
+        if self.datetime_index:
+            block[-1].view(np.int64)[:] = data.index.asi8
+        tz = data.index.tz if self.datetime_index else None
+        self.descriptor = {"name": self.shm.name, "length": self.length, "datetime_index": self.datetime_index,
+                           "unit": data.index.unit if self.datetime_index else None, "tz": str(tz) if tz else None}
+
+    def close(self):
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self) -> 'SharedOHLCV':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @staticmethod
+    def attach(descriptor: Dict[str, Any]) -> Tuple[shared_memory.SharedMemory, pd.DataFrame]:
+        """
+        Bloğa bağlan ve kolonları kopyalamadan gösteren DataFrame'i döndür
+        """
+        # Worker'lar ana sürecin resource_tracker'ını paylaşır; bloğu yalnızca sahibi (unlink ile) siler
+        shm = shared_memory.SharedMemory(name=descriptor["name"])
+        length = descriptor["length"]
+        block = np.ndarray((len(SHARED_COLUMNS) + 1, length), dtype=np.float64, buffer=shm.buf)
+        if descriptor["datetime_index"]:
+            index = pd.DatetimeIndex(block[-1].view(np.int64).astype(f"datetime64[{descriptor['unit']}]"))
+            if descriptor["tz"]:
+                index = index.tz_localize('UTC').tz_convert(descriptor["tz"])
+        else:
+            index = pd.RangeIndex(length)
+        data = pd.DataFrame({column: block[row] for row, column in enumerate(SHARED_COLUMNS)},
+                            index=index, copy=False)
+        return shm, data
+
+
+# Worker süreç durumu: paylaşılan veri ve geri test motoru süreç başına bir kez kurulur
+_worker: Dict[str, Any] = {}
+
+
+def _init_worker(descriptor: Optional[Dict[str, Any]], config: Dict[str, Any], data: Optional[pd.DataFrame] = None):
+    if descriptor is not None:
+        _worker["shm"], data = SharedOHLCV.attach(descriptor)
+    _worker["data"] = data
+    _worker["backtester"] = Backtester(**config)
+
+
+def _evaluate(task: Tuple[str, Tuple[Tuple[str, Any], ...], Tuple[Window, ...]]) -> List[Dict[str, Any]]:
+    """
+    Bir parametre kümesi: sinyaller tüm geçmişte bir kez üretilir, her pencere ayrı simüle edilir
+    """
+    strategy_key, params, windows = task
+    data, backtester = _worker["data"], _worker["backtester"]
+    signals = STRATEGIES[strategy_key](**dict(params)).signal_series(data)
+    return [backtester.simulate(data.iloc[start:end], signals.iloc[start:end])["metrics"]
+            for start, end in windows]
+
+
+class _TrialExecutor:
+    """
+    Görevleri süreç havuzunda (max_workers <= 1 ise aynı süreçte) çalıştırır.
+    Havuz ve paylaşılan blok ilk önbellek dışı denemede kurulur.
+    """
+    def __init__(self, data: pd.DataFrame, max_workers: int, config: Dict[str, Any]):
+        self.data = data
+        self.max_workers = max_workers
+        self.config = config
+        self.shared: Optional[SharedOHLCV] = None
+        self.pool: Optional[ProcessPoolExecutor] = None
+
+    def __call__(self, tasks: List[Tuple]) -> List[List[Dict[str, Any]]]:
+        if self.max_workers <= 1:
+            if "data" not in _worker:
+                _init_worker(None, self.config, self.data)
+            return [_evaluate(task) for task in tasks]
+        if self.pool is None:
+            self.shared = SharedOHLCV(self.data)
+            self.pool = ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker,
+                                            initargs=(self.shared.descriptor, self.config))
+        chunksize = max(1, len(tasks) // (self.max_workers * 4))
+        return list(self.pool.map(_evaluate, tasks, chunksize=chunksize))
+
+    def __enter__(self) -> '_TrialExecutor':
+        return self
+
+    def __exit__(self, *exc):
+        if self.pool is not None:
+            self.pool.shutdown()
+        if self.shared is not None:
+            self.shared.close()
+        _worker.clear()
+
+
+# --- Arama uzayı ---
+
+def grid(space: ParameterSpace) -> List[Dict[str, Any]]:
+    """
+    Parametre adı → aday değerler uzayının tüm kombinasyonları
+    """
+    names = list(space)
+    return [dict(zip(names, values)) for values in itertools.product(*(space[name] for name in names))]
+
+
+def random_search(space: ParameterSpace, n_trials: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Izgaradan tekrarsız rastgele örnekler; ızgara küçükse tamamı
+    """
+    total = int(np.prod([len(values) for values in space.values()]))
+    if total <= n_trials:
+        return grid(space)
+    rng = np.random.default_rng(seed)
+    seen, trials = set(), []
+    while len(trials) < n_trials:
+        params = {name: values[rng.integers(len(values))] for name, values in space.items()}
+        key = _params_key(params)
+        if key not in seen:
+            seen.add(key)
+            trials.append(params)
+    return trials
+
+
+def _params_key(params: Dict[str, Any]) -> Tuple[Tuple[str, Any], ...]:
+    return tuple(sorted(params.items()))
+
+
+def _tpe_candidates(space: ParameterSpace, history: List[Tuple[Dict[str, Any], float]], count: int,
+                    seen: set, rng: np.random.Generator, gamma: float = 0.25,
+                    samples: int = 64) -> List[Dict[str, Any]]:
+    """
+    Tree-structured Parzen Estimator: iyi denemelerin (üst gamma dilimi) ve diğerlerinin
+    değer dağılımları ayrı tahmin edilir; l(x)/g(x) oranı en yüksek adaylar seçilir
+    """
+    ordered = sorted(history, key=lambda item: item[1], reverse=True)
+    split = max(1, int(np.ceil(gamma * len(ordered))))
+    good, bad = ordered[:split], ordered[split:]
+
+    densities = {}
+    for name, values in space.items():
+        # Laplace düzeltmeli kategorik yoğunluklar
+        good_counts = np.ones(len(values))
+        bad_counts = np.ones(len(values))
+        for params, _ in good:
+            good_counts[list(values).index(params[name])] += 1
+        for params, _ in bad:
+            bad_counts[list(values).index(params[name])] += 1
+        densities[name] = (good_counts / good_counts.sum(), bad_counts / bad_counts.sum())
+
+    scored = []
+    for _ in range(samples):
+        params, score = {}, 0.0
+        for name, values in space.items():
+            good_density, bad_density = densities[name]
+            choice = rng.choice(len(values), p=good_density)
+            params[name] = values[choice]
+            score += np.log(good_density[choice]) - np.log(bad_density[choice])
+        key = _params_key(params)
+        if key not in seen:
+            scored.append((score, key, params))
+    scored.sort(key=lambda item: item[0], reverse=True)
+
+    candidates = []
+    for _, key, params in scored:
+        if key not in seen:
+            seen.add(key)
+            candidates.append(params)
+        if len(candidates) == count:
+            break
+    return candidates
+
+
+# --- Walk-forward ---
+
+def walk_forward_splits(length: int, n_splits: int, anchored: bool = True) -> List[Tuple[Window, Window]]:
+    """
+    Veriyi n_splits + 1 eşit parçaya böl: her katlamada eğitim penceresi test
+    penceresinden hemen önce gelir. anchored=True eğitimi baştan genişletir,
+    False ise yalnızca bir önceki parçayı kullanır.
+    """
+    if n_splits < 1:
+        raise ValueError("n_splits en az 1 olmalı")
+    segment = length // (n_splits + 1)
+    if segment == 0:
+        raise ValueError(f"{length} bar {n_splits} katlama için yetersiz")
+    splits = []
+    for fold in range(n_splits):
+        train_end = (fold + 1) * segment
+        test_end = length if fold == n_splits - 1 else train_end + segment
+        train_start = 0 if anchored else train_end - segment
+        splits.append(((train_start, train_end), (train_end, test_end)))
+    return splits
+
+
+# --- Disk önbelleği ---
+
+class ResultCache:
+    """
+    (veri parmak izi, strateji, parametreler, pencereler, geri test ayarları)
+    anahtarlı deneme sonuçlarının diskteki JSON önbelleği
+    """
+    def __init__(self, root_dir: str = "cache/optimizer"):
+        self.root_dir = root_dir
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        payload = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root_dir, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        path = self._path(key)
+        if not os.path.exists(path):
+            self.misses += 1
+            return None
+        try:
+            with open(path, 'r') as f:
+                value = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: List[Dict[str, Any]]):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path + ".tmp", 'w') as f:
+            json.dump(value, f)
+        os.replace(path + ".tmp", path)
+
+
+class ParameterOptimizer:
+    """
+    Strateji eşik ve periyotları için paralel parametre taraması. Her deneme
+    vektörel geri testle değerlendirilir; denemeler süreç havuzuna dağıtılır ve
+    OHLCV worker'lara paylaşılan bellekten okunur. n_splits > 0 ise parametreler
+    her katlamada yalnızca eğitim penceresine göre seçilir ve sonraki test
+    penceresinde ölçülür (walk-forward).
+    """
+    def __init__(self, strategy: str, space: ParameterSpace, backtester: Optional[Backtester] = None,
+                 objective: str = 'sharpe', n_splits: int = 0, anchored: bool = True,
+                 max_workers: Optional[int] = None, cache_dir: Optional[str] = "cache/optimizer",
+                 logger: Optional[logging.Logger] = None):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Bilinmeyen strateji: {strategy} (seçenekler: {', '.join(STRATEGIES)})")
+        unknown = sorted(set(space) - set(STRATEGIES[strategy].DEFAULT_PARAMS))
+        if unknown:
+            raise ValueError(f"{strategy} için bilinmeyen parametre: {', '.join(unknown)}")
+        self.strategy = strategy
+        self.space = {name: list(values) for name, values in space.items()}
+        self.backtester = backtester or Backtester()
+        self.objective = objective
+        self.n_splits = n_splits
+        self.anchored = anchored
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.cache = ResultCache(cache_dir) if cache_dir else None
+        self.logger = logger or logging.getLogger(__name__)
+
+    def _config(self) -> Dict[str, Any]:
+        return {field: getattr(self.backtester, field) for field in BACKTEST_FIELDS}
+
+    def run(self, data: pd.DataFrame, method: str = 'grid', n_trials: Optional[int] = None,
+            seed: int = 0, batch_size: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Aramayı çalıştır. method: 'grid', 'random' (n_trials örnek) veya 'bayesian'
+        (TPE; n_trials deneme, her turda batch_size aday paralel değerlendirilir)
+        """
+        if method not in SEARCH_METHODS:
+            raise ValueError(f"Bilinmeyen arama yöntemi: {method} (seçenekler: {', '.join(SEARCH_METHODS)})")
+        started = time.perf_counter()
+        splits = walk_forward_splits(len(data), self.n_splits, self.anchored) if self.n_splits else []
+        windows = tuple(window for split in splits for window in split) or ((0, len(data)),)
+        fingerprint = data_fingerprint(data)
+
+        with _TrialExecutor(data, self.max_workers, self._config()) as evaluate:
+            def run_trials(param_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+                return self._run_trials(evaluate, param_list, windows, fingerprint)
+
+            if method == 'grid':
+                trials = run_trials(grid(self.space))
+            elif method == 'random':
+                trials = run_trials(random_search(self.space, n_trials or 50, seed))
+            else:
+                trials = self._bayesian(run_trials, n_trials or 50, seed, batch_size or self.max_workers)
+
+        result = self._summarize(trials, splits)
+        result["elapsed"] = time.perf_counter() - started
+        if self.cache:
+            result["cache"] = {"hits": self.cache.hits, "misses": self.cache.misses}
+        self.logger.info(f"Parametre taraması tamamlandı: {self.strategy} {method}, {len(trials)} deneme, "
+                         f"{result['elapsed']:.1f}s")
+        return result
+
+    def _run_trials(self, evaluate, param_list: List[Dict[str, Any]], windows: Tuple[Window, ...],
+                    fingerprint: str) -> List[Dict[str, Any]]:
+        config = self._config()
+        trials, pending = [], []
+        for params in param_list:
+            key = ResultCache.key(fingerprint, self.strategy, _params_key(params), windows, config)
+            cached = self.cache.get(key) if self.cache else None
+            trials.append({"params": params, "windows": cached, "key": key})
+            if cached is None:
+                pending.append(trials[-1])
+
+        if pending:
+            results = evaluate([(self.strategy, _params_key(trial["params"]), windows) for trial in pending])
+            for trial, metrics in zip(pending, results):
+                trial["windows"] = metrics
+                if self.cache:
+                    self.cache.put(trial["key"], metrics)
+
+        for trial in trials:
+            # Walk-forward'da eğitim pencereleri çift indekslerde
+            train = trial["windows"][::2] if self.n_splits else trial["windows"]
+            trial["score"] = float(np.mean([metrics[self.objective] for metrics in train]))
+        return trials
+
+    def _bayesian(self, run_trials, n_trials: int, seed: int, batch_size: int) -> List[Dict[str, Any]]:
+        rng = np.random.default_rng(seed)
+        initial = random_search(self.space, min(n_trials, max(batch_size, 10)), seed)
+        trials = run_trials(initial)
+        seen = {_params_key(trial["params"]) for trial in trials}
+        while len(trials) < n_trials:
+            history = [(trial["params"], trial["score"]) for trial in trials]
+            candidates = _tpe_candidates(self.space, history, min(batch_size, n_trials - len(trials)), seen, rng)
+            if not candidates:
+                break
+            trials.extend(run_trials(candidates))
+        return trials
+
+    def _summarize(self, trials: List[Dict[str, Any]], splits: List[Tuple[Window, Window]]) -> Dict[str, Any]:
+        table = pd.DataFrame([{**trial["params"], "score": trial["score"]} for trial in trials])
+        table = table.sort_values("score", ascending=False, kind="stable").reset_index(drop=True)
+        best = max(trials, key=lambda trial: trial["score"])
+        result = {
+            "strategy": self.strategy,
+            "objective": self.objective,
+            "trials": table,
+            "best_params": best["params"],
+            "best_score": best["score"],
+            "folds": []
+        }
+        if not splits:
+            result["best_metrics"] = best["windows"][0]
+            return result
+
+        for fold, (train, test) in enumerate(splits):
+            # Katlamanın parametresi yalnızca eğitim penceresine göre seçilir
+            chosen = max(trials, key=lambda trial: trial["windows"][2 * fold][self.objective])
+            result["folds"].append({
+                "train": train,
+                "test": test,
+                "params": chosen["params"],
+                "train_metrics": chosen["windows"][2 * fold],
+                "test_metrics": chosen["windows"][2 * fold + 1]
+            })
+        result["out_of_sample"] = {
+            self.objective: float(np.mean([fold["test_metrics"][self.objective] for fold in result["folds"]])),
+            "total_return": float(np.prod([1 + fold["test_metrics"]["total_return"] for fold in result["folds"]]) - 1)
+        }
+        return result
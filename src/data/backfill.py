@@ -0,0 +1,172 @@
+import os
+import json
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Union
+import pandas as pd
+from .bulk_fetcher import BulkFetcher
+from .ohlcv_store import OHLCVStore
+
+# Binance klines için sayfa başına en fazla bar
+MAX_PAGE_LIMIT = 1000
+
+
+def to_milliseconds(value: Union[int, float, str, datetime, pd.Timestamp]) -> int:
+    """
+    ms, datetime veya ISO tarih metnini epoch milisaniyeye çevir
+    """
+    if isinstance(value, (int, float)):
+        return int(value)
+    return int(pd.Timestamp(value).value // 10**6)
+
+
+class HistoryBackfiller:
+    """
+    Bir tarih aralığını since tabanlı sayfalara bölüp paralel indirir,
+    çakışan barları ayıklayıp OHLCVStore'a yazar. İlerleme her grup sonunda
+    diske kaydedilir; aynı start ile tekrar çağrılınca kaldığı yerden devam eder
+    ve aralığı yeni end'e (verilmezse şimdiye) kadar uzatır.
+    """
+    def __init__(self, bulk_fetcher: BulkFetcher, store: OHLCVStore,
+                 checkpoint_dir: str = "cache/backfill", max_workers: int = 4,
+                 page_limit: int = MAX_PAGE_LIMIT, logger: Optional[logging.Logger] = None):
+        self.bulk_fetcher = bulk_fetcher
+        self.store = store
+        self.checkpoint_dir = checkpoint_dir
+        self.max_workers = max_workers
+        self.page_limit = min(page_limit, MAX_PAGE_LIMIT)
+        self.logger = logger or logging.getLogger(__name__)
+
+    def _checkpoint_path(self, symbol: str, timeframe: str) -> str:
+        return os.path.join(self.checkpoint_dir, f"{symbol.replace('/', '_').upper()}_{timeframe}.json")
+
+    def load_checkpoint(self, symbol: str, timeframe: str) -> Optional[Dict[str, Any]]:
+        path = self._checkpoint_path(symbol, timeframe)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            self.logger.warning(f"Backfill checkpoint okunamadı ({symbol} {timeframe}): {e}")
+            return None
+
+    def history_start(self, symbol: str, timeframe: str) -> Optional[int]:
+        """
+        Borsanın bu seri için verebildiği ilk bar (daha eskisi yok); bilinmiyorsa None
+        """
+        checkpoint = self.load_checkpoint(symbol, timeframe)
+        return checkpoint.get('history_start') if checkpoint else None
+
+    def mark_history_start(self, symbol: str, timeframe: str, first_ms: int):
+        checkpoint = self.load_checkpoint(symbol, timeframe) or {}
+        checkpoint['history_start'] = int(first_ms)
+        self._save_checkpoint(symbol, timeframe, checkpoint)
+
+    def _save_checkpoint(self, symbol: str, timeframe: str, checkpoint: Dict[str, Any]):
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        path = self._checkpoint_path(symbol, timeframe)
+        with open(path + ".tmp", 'w') as f:
+            json.dump(checkpoint, f)
+        os.replace(path + ".tmp", path)
+
+    def backfill(self, symbol: str, timeframe: str, start, end=None) -> Dict[str, Any]:
+        """
+        [start, end) aralığını indir; özet sözlük döndür
+        """
+        exchange = self.bulk_fetcher.exchange
+        start_ms = to_milliseconds(start)
+        end_ms = to_milliseconds(end) if end is not None else int(exchange.milliseconds())
+        timeframe_ms = int(exchange.parse_timeframe(timeframe) * 1000)
+        page_span = self.page_limit * timeframe_ms
+
+        checkpoint = self.load_checkpoint(symbol, timeframe) or {}
+        if checkpoint.get('start') == start_ms and 'next_since' in checkpoint:
+            # end her çağrıda değişebilir (ör. şimdi); aynı başlangıçlı indirme kaldığı yerden uzatılır
+            next_since = checkpoint['next_since']
+            if checkpoint.get('completed'):
+                # Aralık depoda tam; son saklanan bardan (oluşmakta olabilir) itibaren uzatılır
+                last_ts = self.store.last_timestamp(symbol, timeframe)
+                if last_ts is not None and last_ts >= start_ms:
+                    next_since = last_ts
+            next_since = min(next_since, end_ms)
+            bars_written = checkpoint.get('bars', 0)
+            self.logger.info(f"Backfill devam ediyor ({symbol} {timeframe}): {next_since}")
+        else:
+            next_since = start_ms
+            bars_written = 0
+
+        started = time.perf_counter()
+        pages_done = 0
+        error = None
+        batch_size = max(1, self.max_workers * 2)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while next_since < end_ms:
+                page_starts = [next_since + i * page_span for i in range(batch_size)]
+                page_starts = [since for since in page_starts if since < end_ms]
+                futures = [
+                    executor.submit(self.bulk_fetcher.fetch_ohlcv, symbol, timeframe, since, self.page_limit)
+                    for since in page_starts
+                ]
+
+                pages: List[List[List[float]]] = []
+                for since, future in zip(page_starts, futures):
+                    try:
+                        pages.append(future.result())
+                    except Exception as e:
+                        # Sıra bozulmasın diye ilk hatalı sayfada dur
+                        error = f"{since} sayfası indirilemedi: {e}"
+                        break
+
+                bars = self._merge_pages(pages, start_ms, end_ms)
+                if bars:
+                    self.store.append(symbol, timeframe, bars)
+                    bars_written += len(bars)
+                pages_done += len(pages)
+                next_since = page_starts[len(pages) - 1] + page_span if pages else next_since
+                next_since = min(next_since, end_ms)
+
+                checkpoint.update({
+                    "symbol": symbol,
+                    "timeframe": timeframe,
+                    "start": start_ms,
+                    "end": end_ms,
+                    "next_since": next_since,
+                    "bars": bars_written,
+                    "completed": next_since >= end_ms
+                })
+                self._save_checkpoint(symbol, timeframe, checkpoint)
+
+                if error:
+                    self.logger.error(f"Backfill durdu ({symbol} {timeframe}): {error}")
+                    break
+
+        elapsed = time.perf_counter() - started
+        if not error:
+            # Aralığın başı baştan indirildi; depodaki ilk bar start'tan sonraysa borsada daha eskisi yok
+            first_ts = self.store.first_timestamp(symbol, timeframe)
+            if first_ts is not None and first_ts >= start_ms + timeframe_ms and first_ts != checkpoint.get('history_start'):
+                self.mark_history_start(symbol, timeframe, first_ts)
+            self.logger.info(f"Backfill tamamlandı ({symbol} {timeframe}): {bars_written} bar, {elapsed:.1f}s")
+        return {
+            "symbol": symbol,
+            "timeframe": timeframe,
+            "bars": bars_written,
+            "pages": pages_done,
+            "next_since": next_since,
+            "completed": error is None and next_since >= end_ms,
+            "error": error,
+            "elapsed": elapsed
+        }
+
+    def _merge_pages(self, pages: List[List[List[float]]], start_ms: int, end_ms: int) -> List[List[float]]:
+        # Sayfalar arası çakışan barları ayıkla, aralık dışını at
+        merged = {}
+        for page in pages:
+            for bar in page:
+                if start_ms <= bar[0] < end_ms:
+                    merged[int(bar[0])] = bar
+        return [merged[ts] for ts in sorted(merged)]
@@ -0,0 +1,147 @@
+import threading
+import time
+import random
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Tuple
+import ccxt
+
+
+def kline_request_weight(limit: int) -> int:
+    """
+    Binance /api/v3/klines istek ağırlığı (limit'e göre)
+    """
+    if limit < 100:
+        return 1
+    if limit < 500:
+        return 2
+    if limit <= 1000:
+        return 5
+    return 10
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket; Binance dakikalık ağırlık limitini modellemek için
+    """
+    def __init__(self, capacity: float, refill_per_second: float):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        elapsed = now - self.updated_at
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_per_second)
+        self.updated_at = now
+
+    def acquire(self, weight: float = 1):
+        """
+        Yeterli token olana kadar bekle ve tüket
+        """
+        weight = min(weight, self.capacity)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self.blocked_until and self.tokens >= weight:
+                    self.tokens -= weight
+                    return
+                wait = max(self.blocked_until - now, (weight - self.tokens) / self.refill_per_second)
+            time.sleep(wait)
+
+    def penalize(self, seconds: float):
+        """
+        429/418 sonrası tüm istekleri belirtilen süre durdur
+        """
+        with self._lock:
+            self.tokens = 0
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+
+class BulkFetcher:
+    """
+    Çok sayıda fetch_ohlcv çağrısını thread havuzunda, ağırlık limitine uyarak çalıştırır
+    """
+    def __init__(self, exchange, max_workers: int = 8, weight_per_minute: int = 1200,
+                 max_retries: int = 4, backoff_base: float = 0.5,
+                 logger: Optional[logging.Logger] = None):
+        self.exchange = exchange
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.limiter = TokenBucket(weight_per_minute, weight_per_minute / 60.0)
+        self.logger = logger or logging.getLogger(__name__)
+
+    def fetch_ohlcv_many(self, symbols: List[str], timeframe: str = '1h', limit: int = 100,
+                         max_workers: Optional[int] = None,
+                         incremental: Optional[Dict[str, Tuple[int, int]]] = None) -> Dict[str, Any]:
+        """
+        Sembolleri eşzamanlı çek; sembol bazında sonuç ve hata döndür.
+        incremental: sembol -> (since, limit); bu semboller için yalnızca eksik barlar istenir.
+        """
+        incremental = incremental or {}
+        started = time.perf_counter()
+        data = {}
+        errors = {}
+        workers = max(1, min(max_workers or self.max_workers, len(symbols) or 1))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self._fetch_with_retry, symbol, timeframe,
+                                *self._request_args(symbol, limit, incremental)): symbol
+                for symbol in symbols
+            }
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    data[symbol] = future.result()
+                except Exception as e:
+                    errors[symbol] = str(e)
+
+        return {
+            "data": data,
+            "errors": errors,
+            "elapsed": time.perf_counter() - started
+        }
+
+    def fetch_ohlcv(self, symbol: str, timeframe: str = '1h', since: Optional[int] = None,
+                    limit: int = 100) -> List[List[float]]:
+        """
+        Tek sayfa; ortak limiter ve tekrar deneme mantığıyla
+        """
+        return self._fetch_with_retry(symbol, timeframe, limit, since)
+
+    def _request_args(self, symbol: str, limit: int,
+                      incremental: Dict[str, Tuple[int, int]]) -> Tuple[int, Optional[int]]:
+        if symbol in incremental:
+            since, gap_limit = incremental[symbol]
+            return gap_limit, since
+        return limit, None
+
+    def _fetch_with_retry(self, symbol: str, timeframe: str, limit: int,
+                          since: Optional[int] = None) -> List[List[float]]:
+        weight = kline_request_weight(limit)
+        attempt = 0
+        while True:
+            self.limiter.acquire(weight)
+            try:
+                return self.exchange.fetch_ohlcv(symbol, timeframe, since=since, limit=limit)
+            except (ccxt.RateLimitExceeded, ccxt.DDoSProtection) as e:
+                # 429 / 418: tüm havuzu yavaşlat
+                delay = self._backoff(attempt)
+                self.limiter.penalize(delay)
+                self.logger.warning(f"Rate limit aşıldı ({symbol}), {delay:.1f}s bekleniyor: {e}")
+            except ccxt.NetworkError as e:
+                delay = self._backoff(attempt)
+                self.logger.warning(f"Ağ hatası ({symbol}), {delay:.1f}s sonra tekrar denenecek: {e}")
+                time.sleep(delay)
+            attempt += 1
+            if attempt > self.max_retries:
+                raise ConnectionError(f"{symbol} için {self.max_retries} denemeden sonra veri çekilemedi")
+
+    def _backoff(self, attempt: int) -> float:
+        delay = self.backoff_base * (2 ** attempt)
+        return delay + random.uniform(0, delay / 2)
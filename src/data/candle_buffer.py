@@ -0,0 +1,85 @@
+from typing import Dict, Optional
+import numpy as np
+import pandas as pd
+from .ohlcv_store import OHLCV_COLUMNS, COLUMN_DTYPES, columns_to_dataframe
+
+
+class OHLCVRingBuffer:
+    """
+    Sabit kapasiteli OHLCV halka tamponu.
+    Her bar hem i hem de i + capacity konumuna yazılır; böylece son n bar
+    (n <= capacity) her zaman bitişik bir dilimdir ve kopyasız okunabilir.
+    Oluşmakta olan bar yerinde güncellenir, kapanınca yeni bar yeni slota yazılır.
+    Tek yazıcı (WebSocket thread'i), çok okuyucu için tasarlanmıştır.
+    """
+    def __init__(self, capacity: int = 1000):
+        if capacity < 1:
+            raise ValueError("capacity en az 1 olmalı")
+        self.capacity = capacity
+        self._columns = {col: np.zeros(2 * capacity, dtype=COLUMN_DTYPES[col]) for col in OHLCV_COLUMNS}
+        self._count = 0
+        self._head = 0
+        self.last_closed = False
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        if self._count == 0:
+            return None
+        return int(self._columns['timestamp'][self._head + self.capacity - 1])
+
+    def update(self, timestamp: int, open_: float, high: float, low: float, close: float,
+               volume: float, closed: bool = False):
+        """
+        Bar güncelle. Aynı timestamp son barın üzerine yazılır, yeni timestamp yeni bar açar.
+        """
+        last_ts = self.last_timestamp
+        if last_ts is not None and timestamp < last_ts:
+            return
+        new_bar = last_ts is None or timestamp > last_ts
+        # Yeni bar önce iki ayna slota yazılır, head/count sonra ilerletilir;
+        # okuyucu yarım yazılmış barı hiçbir zaman görünür pencerede görmez
+        pos = self._head if new_bar else (self._head - 1) % self.capacity
+        values = (timestamp, open_, high, low, close, volume)
+        for col, value in zip(OHLCV_COLUMNS, values):
+            column = self._columns[col]
+            column[pos] = value
+            column[pos + self.capacity] = value
+        self.last_closed = closed
+        if new_bar:
+            self._head = (pos + 1) % self.capacity
+            self._count += 1
+
+    def extend(self, ohlcv):
+        """
+        REST'ten gelen kapanmış barlarla tamponu doldur
+        """
+        for bar in ohlcv:
+            self.update(int(bar[0]), bar[1], bar[2], bar[3], bar[4], bar[5], closed=True)
+
+    def extend_dataframe(self, df: pd.DataFrame):
+        """
+        get_historical_data çıktısıyla tamponu doldur
+        """
+        timestamps = pd.DatetimeIndex(df.index).as_unit('ms').asi8
+        values = df[['open', 'high', 'low', 'close', 'volume']].to_numpy(dtype=np.float64)
+        for ts, row in zip(timestamps, values):
+            self.update(int(ts), *row, closed=True)
+
+    def window(self, n: Optional[int] = None, include_forming: bool = True) -> Dict[str, np.ndarray]:
+        """
+        Son n barın kopyasız görünümü (kolon -> ndarray)
+        """
+        head, count = self._head, self._count
+        size = min(count, self.capacity)
+        end = head + self.capacity
+        if not include_forming and not self.last_closed and size > 0:
+            end -= 1
+            size -= 1
+        n = size if n is None else min(n, size)
+        return {col: values[end - n:end] for col, values in self._columns.items()}
+
+    def to_dataframe(self, n: Optional[int] = None, include_forming: bool = True) -> pd.DataFrame:
+        return columns_to_dataframe(self.window(n, include_forming))
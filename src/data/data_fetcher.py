@@ -1,20 +1,64 @@
-import websocket
 import json
-import threading
 import time
-from datetime import datetime
 import logging
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import ccxt
+import numpy as np
 import pandas as pd
+from .stream_multiplexer import StreamMultiplexer
+from .stream_supervisor import StreamSupervisor
+from .bulk_fetcher import BulkFetcher
+from .ohlcv_store import OHLCVStore, columns_to_dataframe
+from .backfill import HistoryBackfiller, MAX_PAGE_LIMIT
+from .historical_cache import HistoricalDataCache
+from .candle_buffer import OHLCVRingBuffer
+from .resampler import IncrementalResampler, resample_ohlcv, timeframe_to_ms
+from .tick_buffer import TickRingBuffer, RealTimeDataView, TICK_DTYPE, TICKER_STAT_FIELDS
+
+# Üst zaman dilimi türetmek için çekilecek en fazla taban bar (~10 sayfa; 1m için ~7 gün).
+# Daha uzun geçmiş gerektiren istekler borsadan doğrudan kendi zaman diliminde çekilir.
+MAX_RESAMPLE_BASE_BARS = 10 * MAX_PAGE_LIMIT
+
+
+def ohlcv_to_dataframe(ohlcv: List[List[float]]) -> pd.DataFrame:
+    """
+    ccxt OHLCV listesini timestamp index'li DataFrame'e çevir
+    """
+    df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
+    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+    df.set_index('timestamp', inplace=True)
+    
+    for col in ['open', 'high', 'low', 'close', 'volume']:
+        df[col] = df[col].astype(float)
+    return df
+
 
 class DataFetcher:
-    def __init__(self):
+    def __init__(self, store_dir: Optional[str] = "cache/ohlcv", use_cache: bool = True,
+                 exchange=None, stream_base_url: str = "wss://stream.binance.com:9443",
+                 max_streams: int = 32):
         self.logger = self._setup_logger()
-        self.binance = ccxt.binance()
-        self.real_time_data = {}
+        # exchange/stream_base_url ile ccxt uyumlu başka bir kaynağa (ör. yerel simülatör) yönlendirilebilir
+        self.binance = exchange if exchange is not None else ccxt.binance()
+        self.stream_base_url = stream_base_url.rstrip('/')
+        # Sembol başına tik geçmişi; real_time_data eski sözlük arayüzünü sağlayan görünüm
+        self.tick_capacity = 10000
+        self.tick_buffers = {}
+        self.ticker_stats = {}
+        self.real_time_data = RealTimeDataView(self.tick_buffers, self.ticker_stats)
         self.historical_data = {}
         self.ws_connections = {}
+        # Tüm WebSocket akışlarının yaşam döngüsü; bağlantı ve thread sayısı max_streams ile sınırlı
+        self.stream_supervisor = StreamSupervisor(max_streams=max_streams, logger=self.logger)
+        self.stream_multiplexer = None
+        self.candle_buffers = {}
+        self.resamplers = {}
+        self.bulk_fetcher = BulkFetcher(self.binance, logger=self.logger)
+        # store_dir=None ile kalıcı OHLCV deposu devre dışı bırakılır
+        self.ohlcv_store = OHLCVStore(store_dir) if store_dir else None
+        self.backfiller = HistoryBackfiller(self.bulk_fetcher, self.ohlcv_store, logger=self.logger) if self.ohlcv_store else None
+        # Mum kapanışına kadar geçerli, single-flight tarihsel veri önbelleği
+        self.historical_cache = HistoricalDataCache() if use_cache else None
         self.symbols = ["BTCUSDT", "ETHUSDT", "ADAUSDT", "DOTUSDT", "LINKUSDT"]
         self.is_running = False
         
@@ -30,101 +74,398 @@ class DataFetcher:
         return logging.getLogger(__name__)
     
     def get_historical_data(self, symbol: str, timeframe: str = '1h', limit: int = 100) -> pd.DataFrame:
+        if self.historical_cache is None:
+            return self._load_historical_data(symbol, timeframe, limit)
+        return self.historical_cache.get_or_load(
+            symbol, timeframe, limit, self.binance.parse_timeframe(timeframe),
+            lambda n: self._load_historical_data(symbol, timeframe, n)
+        )
+    
+    def _load_historical_data(self, symbol: str, timeframe: str, limit: int) -> pd.DataFrame:
         try:
             self.logger.info(f"{symbol} için tarihsel veri çekiliyor...")
             
-            ohlcv = self.binance.fetch_ohlcv(symbol, timeframe, limit=limit)
-            df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            df.set_index('timestamp', inplace=True)
-            
-            for col in ['open', 'high', 'low', 'close', 'volume']:
-                df[col] = df[col].astype(float)
+            plan = self._incremental_plan(symbol, timeframe, limit)
+            if plan is None and limit > MAX_PAGE_LIMIT and self.backfiller is not None:
+                # Tek sayfaya sığmayan istekler sayfalı backfill ile doldurulur
+                return self._backfill_and_read(symbol, timeframe, limit)
+            if plan is None and limit > MAX_PAGE_LIMIT:
+                # Depo yok: borsanın sayfa sınırını aşan istek since ile sayfalanır
+                ohlcv = self._fetch_paged(symbol, timeframe, limit)
+            elif plan is None:
+                ohlcv = self.binance.fetch_ohlcv(symbol, timeframe, limit=limit)
+                self._note_history_start(symbol, timeframe, limit, ohlcv)
+            else:
+                since, gap_limit = plan
+                ohlcv = self.binance.fetch_ohlcv(symbol, timeframe, since=since, limit=gap_limit)
+            df = self._merge_into_store(symbol, timeframe, limit, ohlcv)
             
             self.historical_data[symbol] = df
-            self.logger.info(f"{symbol} için {len(df)} bar veri çekildi")
+            self.logger.info(f"{symbol} için {len(df)} bar veri hazır ({len(ohlcv)} bar çekildi)")
             return df
             
         except Exception as e:
             self.logger.error(f"Tarihsel veri çekme hatası ({symbol}): {e}")
             return pd.DataFrame()
     
-    def get_multiple_symbols_data(self, symbols: List[str], timeframe: str = '1h', limit: int = 100) -> Dict[str, pd.DataFrame]:
+    def get_multiple_symbols_data(self, symbols: List[str], timeframe: str = '1h', limit: int = 100,
+                                  max_workers: Optional[int] = None) -> Dict[str, pd.DataFrame]:
+        return self.fetch_multiple_symbols(symbols, timeframe, limit, max_workers)['data']
+    
+    def fetch_multiple_symbols(self, symbols: List[str], timeframe: str = '1h', limit: int = 100,
+                               max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Sembolleri eşzamanlı ve rate limit'e uyarak çek; {"data", "errors", "elapsed"} döndür
+        """
         data = {}
+        to_fetch = []
         for symbol in symbols:
-            df = self.get_historical_data(symbol, timeframe, limit)
+            cached = self.historical_cache.peek(symbol, timeframe, limit) if self.historical_cache else None
+            if cached is not None:
+                data[symbol] = cached
+            else:
+                to_fetch.append(symbol)
+        
+        self.logger.info(f"{len(to_fetch)} sembol için toplu veri çekiliyor ({len(data)} önbellekten)...")
+        incremental = {}
+        for symbol in to_fetch:
+            plan = self._incremental_plan(symbol, timeframe, limit)
+            if plan is not None:
+                incremental[symbol] = plan
+        result = self.bulk_fetcher.fetch_ohlcv_many(to_fetch, timeframe, limit, max_workers, incremental)
+        
+        for symbol, ohlcv in result['data'].items():
+            if symbol not in incremental:
+                self._note_history_start(symbol, timeframe, limit, ohlcv)
+            df = self._merge_into_store(symbol, timeframe, limit, ohlcv)
             if not df.empty:
+                self.historical_data[symbol] = df
                 data[symbol] = df
-            time.sleep(0.1)
-        return data
+                if self.historical_cache is not None:
+                    self.historical_cache.put(symbol, timeframe, df, self.binance.parse_timeframe(timeframe))
+        
+        for symbol, error in result['errors'].items():
+            self.logger.error(f"Toplu veri çekme hatası ({symbol}): {error}")
+        
+        self.logger.info(f"{len(data)}/{len(symbols)} sembol {result['elapsed']:.2f}s içinde çekildi")
+        return {"data": data, "errors": result['errors'], "elapsed": result['elapsed']}
 
-    def start_real_time_data(self, symbols: List[str]):
+    def _incremental_plan(self, symbol: str, timeframe: str, limit: int) -> Optional[Tuple[int, int]]:
+        """
+        Depodaki geçmiş yeterliyse yalnızca son saklanan bardan sonrasını iste: (since, limit)
+        """
+        if self.ohlcv_store is None or not self._history_covered(symbol, timeframe, limit):
+            return None
+        last_ts = self.ohlcv_store.last_timestamp(symbol, timeframe)
+        timeframe_ms = self.binance.parse_timeframe(timeframe) * 1000
+        missing = (self.binance.milliseconds() - last_ts) // timeframe_ms + 1
+        if missing >= limit or missing + 1 > MAX_PAGE_LIMIT:
+            return None
+        # Son saklanan bar da tekrar istenir; oluşmakta olan mum güncellenmiş olabilir
+        return last_ts, int(missing) + 1
+    
+    def _history_covered(self, symbol: str, timeframe: str, limit: int) -> bool:
+        """
+        Depo son limit barı boşluksuz tutuyor ya da borsanın verebildiği ilk bara kadar
+        boşluksuz iniyor mu
+        """
+        length = self.ohlcv_store.length(symbol, timeframe)
+        if length == 0:
+            return False
+        if length < limit:
+            if self.backfiller is None:
+                return False
+            history_start = self.backfiller.history_start(symbol, timeframe)
+            if history_start is None or self.ohlcv_store.first_timestamp(symbol, timeframe) > history_start:
+                return False
+        timestamps = self.ohlcv_store.read(symbol, timeframe, limit=limit)['timestamp']
+        timeframe_ms = self.binance.parse_timeframe(timeframe) * 1000
+        # Uzun bir aradan sonra düz çekilen barlar eski serinin ardına boşlukla eklenmiş olabilir
+        return int(timestamps[-1]) - int(timestamps[0]) == (len(timestamps) - 1) * timeframe_ms
+
+    def _note_history_start(self, symbol: str, timeframe: str, limit: int, ohlcv: List[List[float]]):
+        # Son limit bar istendi ama borsa daha azını döndürdü: daha eski bar yok (yeni listelenmiş sembol)
+        if self.backfiller is None or not ohlcv or len(ohlcv) >= min(limit, MAX_PAGE_LIMIT):
+            return
+        first_ms = int(ohlcv[0][0])
+        if self.backfiller.history_start(symbol, timeframe) != first_ms:
+            self.backfiller.mark_history_start(symbol, timeframe, first_ms)
+
+    def backfill_historical_data(self, symbol: str, timeframe: str, start, end=None) -> Dict[str, Any]:
+        """
+        Tarih aralığını sayfalı ve paralel indirip depoya yaz; kesilirse kaldığı yerden devam eder
+        """
+        if self.backfiller is None:
+            raise ValueError("Backfill için kalıcı OHLCV deposu (store_dir) gerekli")
+        return self.backfiller.backfill(symbol, timeframe, start, end)
+    
+    def _fetch_paged(self, symbol: str, timeframe: str, limit: int) -> List[List[float]]:
+        """
+        Son limit barı MAX_PAGE_LIMIT'lik since sayfalarıyla sırayla çek (depo kullanılmadan)
+        """
+        end = int(self.binance.milliseconds())
+        timeframe_ms = int(self.binance.parse_timeframe(timeframe) * 1000)
+        since = end - limit * timeframe_ms
+        bars = {}
+        while since < end:
+            page = self.bulk_fetcher.fetch_ohlcv(symbol, timeframe, since, MAX_PAGE_LIMIT)
+            for bar in page:
+                bars[int(bar[0])] = bar
+            if not page:
+                since += MAX_PAGE_LIMIT * timeframe_ms
+            elif page[-1][0] + timeframe_ms <= since:
+                break
+            else:
+                since = int(page[-1][0]) + timeframe_ms
+        return [bars[ts] for ts in sorted(bars)][-limit:]
+
+    def _backfill_and_read(self, symbol: str, timeframe: str, limit: int) -> pd.DataFrame:
+        end = int(self.binance.milliseconds())
+        timeframe_ms = self.binance.parse_timeframe(timeframe) * 1000
+        last_ts = self.ohlcv_store.last_timestamp(symbol, timeframe)
+        if last_ts is not None and self._history_covered(symbol, timeframe, limit):
+            # Geçmiş depoda; yalnızca son saklanan bardan sonrası sayfalı indirilir
+            start = last_ts
+        else:
+            start = end - limit * timeframe_ms
+        checkpoint = self.backfiller.load_checkpoint(symbol, timeframe) or {}
+        if checkpoint.get('start') is not None and not checkpoint.get('completed') and checkpoint['start'] <= start:
+            # Yarıda kalan indirme aynı start ile kaldığı yerden sürdürülür
+            start = checkpoint['start']
+        elif last_ts is not None and last_ts + timeframe_ms < start:
+            # Saklanan seri istenen aralığa yetişmiyor; arada boşluk bırakmak yerine seri yenilenir
+            self.ohlcv_store.clear(symbol, timeframe)
+        result = self.backfill_historical_data(symbol, timeframe, start, end)
+        if result['error']:
+            self.logger.error(f"Tarihsel veri backfill hatası ({symbol}): {result['error']}")
+        df = self.ohlcv_store.read_dataframe(symbol, timeframe, limit=limit)
+        self.historical_data[symbol] = df
+        return df
+    
+    def _merge_into_store(self, symbol: str, timeframe: str, limit: int, ohlcv: List[List[float]]) -> pd.DataFrame:
+        if self.ohlcv_store is None:
+            return ohlcv_to_dataframe(ohlcv)
+        last_ts = self.ohlcv_store.last_timestamp(symbol, timeframe)
+        timeframe_ms = self.binance.parse_timeframe(timeframe) * 1000
+        if ohlcv and last_ts is not None and ohlcv[0][0] > last_ts + timeframe_ms:
+            # Çekilen barlar saklanan serinin ardına boşlukla eklenecekti; seri yenisiyle değiştirilir
+            self.ohlcv_store.clear(symbol, timeframe)
+        self.ohlcv_store.append(symbol, timeframe, ohlcv)
+        return self.ohlcv_store.read_dataframe(symbol, timeframe, limit=limit)
+    
+    def start_real_time_data(self, symbols: List[str], combined: bool = True,
+                             max_connections: Optional[int] = None):
+        """
+        Real-time ticker akışını başlat. combined=True iken tüm semboller az sayıda
+        combined bağlantı üzerinden taşınır; False ise sembol başına bir bağlantı açılır.
+        max_connections yalnızca ilk combined akışta belirlenir (varsayılan 2).
+        """
         self.logger.info("Real-time veri akışı başlatılıyor...")
         self.is_running = True
         
+        if combined:
+            multiplexer = self._get_multiplexer(max_connections)
+            multiplexer.subscribe([f"{symbol.lower()}@ticker" for symbol in symbols])
+            multiplexer.start()
+            return
+        
         for symbol in symbols:
-            thread = threading.Thread(target=self._start_individual_websocket, args=(symbol,))
-            thread.daemon = True
-            thread.start()
-            time.sleep(0.5)
+            self._start_individual_websocket(symbol)
     
-    def _start_individual_websocket(self, symbol: str):
-        def on_message(ws, message):
-            try:
-                data = json.loads(message)
-                
-                if 'e' in data and data['e'] == '24hrTicker':
-                    tick_data = {
-                        'symbol': data['s'],
-                        'price': float(data['c']),
-                        'timestamp': datetime.now(),
-                        'change_percent': float(data['P']),
-                        'high_24h': float(data['h']),
-                        'low_24h': float(data['l']),
-                        'volume': float(data['v']),
-                        'price_change': float(data['p'])
-                    }
-                    
-                    self.real_time_data[symbol] = tick_data
-                    self.logger.debug(f"Real-time {symbol}: {tick_data['price']}")
-                    
-            except Exception as e:
-                self.logger.error(f"WebSocket mesaj işleme hatası ({symbol}): {e}")
-        
-        def on_error(ws, error):
-            self.logger.error(f"WebSocket hatası ({symbol}): {error}")
-        
-        def on_close(ws, close_status_code, close_msg):
-            self.logger.warning(f"WebSocket bağlantısı kapandı ({symbol})")
-            if self.is_running:
-                time.sleep(5)
-                self._start_individual_websocket(symbol)
-        
-        def on_open(ws):
-            self.logger.info(f"WebSocket bağlantısı açıldı ({symbol})")
-        
-        stream_url = f"wss://stream.binance.com:9443/ws/{symbol.lower()}@ticker"
+    def start_kline_stream(self, symbols: List[str], timeframe: str = '1m', capacity: int = 1000,
+                           seed: bool = True, max_connections: Optional[int] = None,
+                           derived_timeframes: Optional[List[str]] = None):
+        """
+        @kline_<tf> akışından sembol başına canlı OHLCV halka tamponu oluştur.
+        seed=True ise tampon önce REST'ten kapanmış barlarla doldurulur.
+        derived_timeframes verilirse bu üst zaman dilimlerinin oluşan barı artımlı tutulur.
+        """
+        self.is_running = True
+        for symbol in symbols:
+            key = (symbol.upper(), timeframe)
+            if derived_timeframes:
+                self.resamplers[key] = IncrementalResampler(derived_timeframes)
+            if key in self.candle_buffers:
+                continue
+            buffer = OHLCVRingBuffer(capacity)
+            if seed:
+                history = self.get_historical_data(symbol, timeframe, capacity)
+                if not history.empty:
+                    buffer.extend_dataframe(history)
+            self.candle_buffers[key] = buffer
         
-        ws = websocket.WebSocketApp(
-            stream_url,
-            on_message=on_message,
-            on_error=on_error,
-            on_close=on_close,
-            on_open=on_open
-        )
+        multiplexer = self._get_multiplexer(max_connections)
+        multiplexer.subscribe([f"{symbol.lower()}@kline_{timeframe}" for symbol in symbols])
+        multiplexer.start()
+    
+    def get_live_candles(self, symbol: str, timeframe: str = '1m', n: Optional[int] = None,
+                         include_forming: bool = True) -> Dict[str, Any]:
+        """
+        Canlı tamponun son n barına kopyasız erişim (kolon -> ndarray)
+        """
+        buffer = self.candle_buffers.get((symbol.upper(), timeframe))
+        if buffer is None:
+            return {}
+        return buffer.window(n, include_forming)
+    
+    def get_live_dataframe(self, symbol: str, timeframe: str = '1m', n: Optional[int] = None,
+                           include_forming: bool = True) -> pd.DataFrame:
+        """
+        Canlı tamponu stratejilerin beklediği DataFrame biçiminde döndür
+        """
+        buffer = self.candle_buffers.get((symbol.upper(), timeframe))
+        if buffer is None:
+            return pd.DataFrame()
+        return buffer.to_dataframe(n, include_forming)
+    
+    def get_live_resampled(self, symbol: str, timeframe: str, n: Optional[int] = None,
+                           base_timeframe: str = '1m') -> pd.DataFrame:
+        """
+        Canlı alt zaman dilimi tamponundan üst zaman dilimi barlarını türet
+        """
+        window = self.get_live_candles(symbol, base_timeframe)
+        if not window:
+            return pd.DataFrame()
+        resampled = resample_ohlcv(window, timeframe)
+        if n is not None:
+            resampled = {col: values[-n:] for col, values in resampled.items()}
+        return columns_to_dataframe(resampled)
+    
+    def get_forming_bar(self, symbol: str, timeframe: str, base_timeframe: str = '1m') -> Optional[List[float]]:
+        """
+        Üst zaman diliminin oluşmakta olan barı: [timestamp, open, high, low, close, volume]
+        """
+        resampler = self.resamplers.get((symbol.upper(), base_timeframe))
+        if resampler is None or timeframe not in resampler.timeframes:
+            return None
+        return resampler.current(timeframe)
+    
+    def get_resampled_data(self, symbol: str, timeframe: str = '1h', limit: int = 100,
+                           base_timeframe: str = '1m') -> pd.DataFrame:
+        """
+        Yalnızca base_timeframe barlarını çekip (depo + artımlı) üst zaman dilimini yerelde türet.
+        Tüm zaman dilimleri aynı 1m seriden üretildiği için birbiriyle tutarlıdır.
+        (limit + 1) * oran taban barı tek sayfayı aşarsa depo yokken de since ile sayfalanır;
+        MAX_RESAMPLE_BASE_BARS'ı aşarsa (ör. 1d x 200) üst zaman dilimi doğrudan çekilir.
+        """
+        ratio = timeframe_to_ms(timeframe) // timeframe_to_ms(base_timeframe)
+        if ratio <= 1:
+            return self.get_historical_data(symbol, timeframe, limit)
+        if (limit + 1) * ratio > MAX_RESAMPLE_BASE_BARS:
+            self.logger.info(f"{symbol} {timeframe} x {limit} için {(limit + 1) * ratio} {base_timeframe} bar "
+                             f"gerekirdi; doğrudan {timeframe} çekiliyor")
+            return self.get_historical_data(symbol, timeframe, limit)
         
-        self.ws_connections[symbol] = ws
+        # İlk kova yarım olabilir; bir kova fazlası istenir
+        base = self.get_historical_data(symbol, base_timeframe, (limit + 1) * ratio)
+        if base.empty:
+            return pd.DataFrame()
+        columns = {col: base[col].to_numpy() for col in ['open', 'high', 'low', 'close', 'volume']}
+        columns['timestamp'] = pd.DatetimeIndex(base.index).as_unit('ms').asi8
+        resampled = resample_ohlcv(columns, timeframe)
+        # Baştaki eksik kovayı at
+        if len(resampled['timestamp']) > limit:
+            resampled = {col: values[-limit:] for col, values in resampled.items()}
+        return columns_to_dataframe(resampled)
+    
+    def _get_multiplexer(self, max_connections: Optional[int] = None) -> StreamMultiplexer:
+        if self.stream_multiplexer is None:
+            self.stream_multiplexer = StreamMultiplexer(
+                self._handle_stream_message, max_connections=max_connections or 2,
+                url=f"{self.stream_base_url}/stream", logger=self.logger,
+                supervisor=self.stream_supervisor
+            )
+        elif max_connections is not None and max_connections != len(self.stream_multiplexer.connections):
+            # Bağlantı sayısı çalışan akışlar bölünmeden değiştirilemez
+            raise ValueError(f"Combined akış {len(self.stream_multiplexer.connections)} bağlantıyla çalışıyor; "
+                             f"max_connections={max_connections} uygulanamaz")
+        return self.stream_multiplexer
+    
+    def add_real_time_symbols(self, symbols: List[str]):
+        """
+        Çalışan combined akışa yeniden bağlanmadan sembol ekle
+        """
+        if self.stream_multiplexer is None:
+            self.start_real_time_data(symbols)
+            return
+        self.stream_multiplexer.subscribe([f"{symbol.lower()}@ticker" for symbol in symbols])
+    
+    def remove_real_time_symbols(self, symbols: List[str]):
+        """
+        Çalışan combined akıştan yeniden bağlanmadan sembol çıkar
+        """
+        if self.stream_multiplexer is None:
+            return
+        self.stream_multiplexer.unsubscribe([f"{symbol.lower()}@ticker" for symbol in symbols])
+        for symbol in symbols:
+            self.tick_buffers.pop(symbol.upper(), None)
+            self.ticker_stats.pop(symbol.upper(), None)
+    
+    def _handle_stream_message(self, stream: str, data: Dict):
+        """
+        Stream mesajını 's' alanına göre ilgili tampona yönlendir
+        """
+        if data.get('e') == '24hrTicker':
+            self._record_ticker(data)
+        elif data.get('e') == 'kline':
+            kline = data['k']
+            key = (data['s'], kline['i'])
+            bar = (int(kline['t']), float(kline['o']), float(kline['h']), float(kline['l']),
+                   float(kline['c']), float(kline['v']))
+            buffer = self.candle_buffers.get(key)
+            if buffer is not None:
+                buffer.update(*bar, closed=kline['x'])
+            resampler = self.resamplers.get(key)
+            if resampler is not None:
+                resampler.update(*bar, closed=kline['x'])
+    
+    def _record_ticker(self, data: Dict):
+        symbol = data['s']
+        buffer = self.tick_buffers.get(symbol)
+        if buffer is None:
+            buffer = self.tick_buffers.setdefault(symbol, TickRingBuffer(self.tick_capacity))
+            self.ticker_stats.setdefault(symbol, np.zeros(len(TICKER_STAT_FIELDS)))
+        stats = self.ticker_stats[symbol]
+        stats[0] = float(data['P'])
+        stats[1] = float(data['h'])
+        stats[2] = float(data['l'])
+        stats[3] = float(data['p'])
+        buffer.append(float(data['c']), float(data['v']), int(data.get('E', 0)), time.time_ns())
+    
+    def get_recent_ticks(self, symbol: str, n: Optional[int] = None) -> np.ndarray:
+        """
+        Son n tik (price, volume, event_time, receive_time)
+        """
+        buffer = self.tick_buffers.get(symbol)
+        return buffer.last(n) if buffer is not None else np.zeros(0, dtype=TICK_DTYPE)
+    
+    def get_ticks_since(self, symbol: str, since_ms: int) -> np.ndarray:
+        """
+        Borsa olay zamanı since_ms ve sonrasındaki tikler
+        """
+        buffer = self.tick_buffers.get(symbol)
+        return buffer.since(since_ms) if buffer is not None else np.zeros(0, dtype=TICK_DTYPE)
+    
+    def _start_individual_websocket(self, symbol: str):
+        def on_message(ws, message):
+            data = json.loads(message)
+            if 'e' in data and data['e'] == '24hrTicker':
+                self._record_ticker(data)
         
-        while self.is_running:
-            try:
-                ws.run_forever()
-            except Exception as e:
-                self.logger.error(f"WebSocket çalıştırma hatası ({symbol}): {e}")
-                time.sleep(5)
+        stream_url = f"{self.stream_base_url}/ws/{symbol.lower()}@ticker"
+        self.ws_connections[symbol] = self.stream_supervisor.add(symbol, stream_url, on_message)
+    
+    def get_stream_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Akış başına yeniden bağlanma, mesaj hızı ve son mesaj yaşı sayaçları
+        """
+        return self.stream_supervisor.get_stats()
     
     def get_current_price(self, symbol: str) -> Optional[float]:
-        if symbol in self.real_time_data:
-            return self.real_time_data[symbol]['price']
+        buffer = self.tick_buffers.get(symbol)
+        tick = buffer.latest() if buffer is not None else None
+        if tick is not None:
+            return float(tick['price'])
         return None
     
     def get_24h_stats(self, symbol: str) -> Dict:
@@ -144,9 +485,8 @@ class DataFetcher:
     
     def stop_all_connections(self):
         self.is_running = False
-        for symbol, ws in self.ws_connections.items():
-            try:
-                ws.close()
-                self.logger.info(f"WebSocket bağlantısı kapatıldı ({symbol})")
-            except Exception as e:
-                self.logger.error(f"WebSocket kapatma hatası ({symbol}): {e}")
\ No newline at end of file
+        if self.stream_multiplexer is not None:
+            self.stream_multiplexer.stop()
+        self.stream_supervisor.stop_all()
+        self.ws_connections.clear()
+        self.logger.info("WebSocket bağlantıları kapatıldı")
\ No newline at end of file
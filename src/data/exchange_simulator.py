@@ -0,0 +1,446 @@
+import socket
+import threading
+import hashlib
+import base64
+import struct
+import json
+import time
+import random
+import logging
+import zlib
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse, parse_qs
+import numpy as np
+import ccxt
+from .resampler import resample_ohlcv, timeframe_to_ms
+
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+MINUTE_MS = 60000
+
+
+class SyntheticMarket:
+    """
+    Sembol başına deterministik 1m fiyat serisi (rastgele yürüyüş) veya kayıtlı 1m barlar.
+    Üst zaman dilimleri 1m seriden türetilir; REST ve WebSocket aynı fiyatları kullanır.
+    """
+    def __init__(self, symbols: List[str], days: int = 30, seed: int = 42,
+                 start_price: float = 100.0, now_ms: Optional[int] = None):
+        self.seed = seed
+        self.start_price = start_price
+        end_ms = now_ms if now_ms is not None else int(time.time() * 1000)
+        self.end_ms = end_ms - end_ms % MINUTE_MS + MINUTE_MS
+        self.origin_ms = self.end_ms - days * 86400000
+        self._series: Dict[str, Dict[str, np.ndarray]] = {}
+        self._lock = threading.Lock()
+        for symbol in symbols:
+            self._series[symbol] = self._generate(symbol)
+
+    def _generate(self, symbol: str) -> Dict[str, np.ndarray]:
+        count = (self.end_ms - self.origin_ms) // MINUTE_MS
+        rng = np.random.default_rng([self.seed, zlib.crc32(symbol.encode())])
+        returns = rng.normal(0, 0.0015, count)
+        close = self.start_price * np.exp(np.cumsum(returns))
+        open_ = np.r_[self.start_price, close[:-1]]
+        spread = np.abs(rng.normal(0, 0.001, count)) * close
+        return {
+            'timestamp': self.origin_ms + np.arange(count, dtype=np.int64) * MINUTE_MS,
+            'open': open_,
+            'high': np.maximum(open_, close) + spread,
+            'low': np.minimum(open_, close) - spread,
+            'close': close,
+            'volume': rng.gamma(2.0, 5.0, count)
+        }
+
+    def load_recorded(self, symbol: str, ohlcv_1m: List[List[float]]):
+        """
+        Kayıtlı 1m barları (ccxt formatı) sembolün serisi olarak kullan
+        """
+        rows = np.asarray(ohlcv_1m, dtype=np.float64)
+        with self._lock:
+            self._series[symbol] = {
+                'timestamp': rows[:, 0].astype(np.int64),
+                'open': rows[:, 1], 'high': rows[:, 2], 'low': rows[:, 3],
+                'close': rows[:, 4], 'volume': rows[:, 5]
+            }
+
+    def symbols(self) -> List[str]:
+        return list(self._series)
+
+    def ohlcv(self, symbol: str, timeframe: str, since: Optional[int], limit: int,
+              now_ms: Optional[int] = None) -> List[List[float]]:
+        series = self._series.get(symbol)
+        if series is None:
+            raise ccxt.BadSymbol(f"Simülatörde olmayan sembol: {symbol}")
+        target_ms = timeframe_to_ms(timeframe)
+        timestamps = series['timestamp']
+        now_ms = now_ms if now_ms is not None else int(timestamps[-1]) + MINUTE_MS
+        hi = int(np.searchsorted(timestamps, now_ms, side='left'))
+        if since is None:
+            lo = max(0, hi - limit * (target_ms // MINUTE_MS) - target_ms // MINUTE_MS)
+        else:
+            lo = int(np.searchsorted(timestamps, since - since % target_ms, side='left'))
+            hi = min(hi, lo + (limit + 1) * (target_ms // MINUTE_MS))
+        window = {col: values[lo:hi] for col, values in series.items()}
+        bars = resample_ohlcv(window, timeframe) if target_ms > MINUTE_MS else window
+        if since is not None:
+            keep = bars['timestamp'] >= since
+            bars = {col: values[keep] for col, values in bars.items()}
+            bars = {col: values[:limit] for col, values in bars.items()}
+        else:
+            bars = {col: values[-limit:] for col, values in bars.items()}
+        return np.column_stack([bars[col] for col in ['timestamp', 'open', 'high', 'low', 'close', 'volume']]).tolist()
+
+    def last_price(self, symbol: str) -> float:
+        return float(self._series[symbol]['close'][-1])
+
+
+class SimulatedExchange:
+    """
+    ccxt ile uyumlu (fetch_ohlcv / fetch_ticker) yerel borsa; gecikme ve hata enjeksiyonu destekler.
+    DataFetcher(exchange=SimulatedExchange(...)) ile kullanılır.
+    """
+    rateLimit = 0
+
+    def __init__(self, market: SyntheticMarket, latency: float = 0.0,
+                 rate_limit_probability: float = 0.0, seed: int = 0):
+        self.market = market
+        self.latency = latency
+        self.rate_limit_probability = rate_limit_probability
+        self.request_count = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _simulate_request(self):
+        with self._lock:
+            self.request_count += 1
+            fail = self._rng.random() < self.rate_limit_probability
+        if self.latency:
+            time.sleep(self.latency)
+        if fail:
+            raise ccxt.RateLimitExceeded("simulator 429 Too Many Requests")
+
+    def milliseconds(self) -> int:
+        return int(time.time() * 1000)
+
+    def parse_timeframe(self, timeframe: str) -> int:
+        return ccxt.Exchange.parse_timeframe(timeframe)
+
+    def fetch_ohlcv(self, symbol: str, timeframe: str = '1m', since: Optional[int] = None,
+                    limit: Optional[int] = None, params: Optional[Dict] = None) -> List[List[float]]:
+        self._simulate_request()
+        return self.market.ohlcv(symbol, timeframe, since, min(limit or 500, 1000))
+
+    def fetch_ticker(self, symbol: str, params: Optional[Dict] = None) -> Dict:
+        self._simulate_request()
+        day = self.market.ohlcv(symbol, '1m', None, 1440)
+        first, last = day[0], day[-1]
+        return {
+            'symbol': symbol,
+            'last': last[4],
+            'high': max(bar[2] for bar in day),
+            'low': min(bar[3] for bar in day),
+            'baseVolume': sum(bar[5] for bar in day),
+            'percentage': (last[4] - first[1]) / first[1] * 100
+        }
+
+
+class _ClientConnection:
+    def __init__(self, sock: socket.socket, combined: bool):
+        self.sock = sock
+        self.combined = combined
+        self.streams: List[str] = []
+        self.send_lock = threading.Lock()
+        self.alive = True
+        self.pending: deque = deque()
+        self.sent = 0
+
+
+class BinanceStreamSimulator:
+    """
+    Binance tarzı ticker/kline WebSocket sunucusu (yalnızca stdlib).
+    /ws/<stream>, /stream?streams=a/b ve SUBSCRIBE/UNSUBSCRIBE mesajlarını destekler.
+    messages_per_second bağlantı başına hızdır; latency mesajları geciktirir;
+    disconnect_every saniyede bir bağlantılar sert biçimde kapatılır.
+    """
+    def __init__(self, market: SyntheticMarket, host: str = "127.0.0.1", port: int = 0,
+                 messages_per_second: float = 100.0, latency: float = 0.0,
+                 disconnect_every: Optional[float] = None, logger: Optional[logging.Logger] = None):
+        self.market = market
+        self.host = host
+        self.messages_per_second = messages_per_second
+        self.latency = latency
+        self.disconnect_every = disconnect_every
+        self.logger = logger or logging.getLogger(__name__)
+        self.connections: List[_ClientConnection] = []
+        self.total_sent = 0
+        self.total_connections = 0
+        self._prices = {symbol: market.last_price(symbol) for symbol in market.symbols()}
+        self._klines: Dict[str, Dict] = {}
+        self._rng = random.Random(7)
+        self._lock = threading.Lock()
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind((host, port))
+        self.port = self._server.getsockname()[1]
+        self.is_running = False
+
+    @property
+    def base_url(self) -> str:
+        return f"ws://{self.host}:{self.port}"
+
+    @property
+    def combined_url(self) -> str:
+        return f"{self.base_url}/stream"
+
+    def start(self):
+        self.is_running = True
+        self._server.listen(128)
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+        if self.disconnect_every:
+            threading.Thread(target=self._disconnect_loop, daemon=True).start()
+
+    def stop(self):
+        self.is_running = False
+        try:
+            self._server.close()
+        except OSError:
+            pass
+        self.disconnect_all()
+
+    def disconnect_all(self):
+        with self._lock:
+            connections = list(self.connections)
+        for conn in connections:
+            self._drop(conn)
+
+    def _drop(self, conn: _ClientConnection):
+        conn.alive = False
+        try:
+            conn.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        conn.sock.close()
+        with self._lock:
+            if conn in self.connections:
+                self.connections.remove(conn)
+
+    def _disconnect_loop(self):
+        while self.is_running:
+            time.sleep(self.disconnect_every)
+            self.disconnect_all()
+
+    def _accept_loop(self):
+        while self.is_running:
+            try:
+                sock, _ = self._server.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._serve, args=(sock,), daemon=True).start()
+
+    def _serve(self, sock: socket.socket):
+        try:
+            path = self._handshake(sock)
+        except Exception as e:
+            self.logger.debug(f"Simülatör handshake hatası: {e}")
+            sock.close()
+            return
+        parsed = urlparse(path)
+        conn = _ClientConnection(sock, combined=parsed.path.startswith("/stream"))
+        if parsed.path.startswith("/ws/"):
+            conn.streams = [s for s in parsed.path[len("/ws/"):].split('/') if s]
+        streams = parse_qs(parsed.query).get('streams')
+        if streams:
+            conn.streams = [s for s in streams[0].split('/') if s]
+        with self._lock:
+            self.connections.append(conn)
+            self.total_connections += 1
+        threading.Thread(target=self._emit_loop, args=(conn,), daemon=True).start()
+        self._read_loop(conn)
+
+    def _handshake(self, sock: socket.socket) -> str:
+        request = b""
+        while b"\r\n\r\n" not in request:
+            chunk = sock.recv(4096)
+            if not chunk:
+                raise ConnectionError("handshake sırasında bağlantı kapandı")
+            request += chunk
+        lines = request.decode('latin-1').split("\r\n")
+        path = lines[0].split(" ")[1]
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                key, value = line.split(":", 1)
+                headers[key.strip().lower()] = value.strip()
+        accept = base64.b64encode(hashlib.sha1((headers['sec-websocket-key'] + WS_GUID).encode()).digest()).decode()
+        sock.sendall((
+            "HTTP/1.1 101 Switching Protocols\r\n"
+            "Upgrade: websocket\r\n"
+            "Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Accept: {accept}\r\n\r\n"
+        ).encode())
+        return path
+
+    def _recv_exact(self, sock: socket.socket, size: int) -> bytes:
+        data = b""
+        while len(data) < size:
+            chunk = sock.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError("bağlantı kapandı")
+            data += chunk
+        return data
+
+    def _read_loop(self, conn: _ClientConnection):
+        try:
+            while conn.alive:
+                b0, b1 = self._recv_exact(conn.sock, 2)
+                opcode = b0 & 0x0F
+                length = b1 & 0x7F
+                if length == 126:
+                    length = struct.unpack("!H", self._recv_exact(conn.sock, 2))[0]
+                elif length == 127:
+                    length = struct.unpack("!Q", self._recv_exact(conn.sock, 8))[0]
+                mask = self._recv_exact(conn.sock, 4) if b1 & 0x80 else b"\x00\x00\x00\x00"
+                payload = bytearray(self._recv_exact(conn.sock, length))
+                for i in range(length):
+                    payload[i] ^= mask[i % 4]
+
+                if opcode == 0x8:
+                    self._send_frame(conn, 0x8, bytes(payload[:2]))
+                    break
+                if opcode == 0x9:
+                    self._send_frame(conn, 0xA, bytes(payload))
+                elif opcode == 0x1:
+                    self._handle_request(conn, json.loads(payload.decode()))
+        except (ConnectionError, OSError, ValueError):
+            pass
+        finally:
+            if conn.alive:
+                self._drop(conn)
+
+    def _handle_request(self, conn: _ClientConnection, request: Dict):
+        method = request.get('method')
+        params = [p.lower() for p in request.get('params', [])]
+        if method == 'SUBSCRIBE':
+            conn.streams = conn.streams + [p for p in params if p not in conn.streams]
+        elif method == 'UNSUBSCRIBE':
+            conn.streams = [s for s in conn.streams if s not in params]
+        self._send_text(conn, json.dumps({"result": None, "id": request.get('id')}))
+
+    def _send_frame(self, conn: _ClientConnection, opcode: int, payload: bytes):
+        length = len(payload)
+        if length < 126:
+            header = struct.pack("!BB", 0x80 | opcode, length)
+        elif length < 65536:
+            header = struct.pack("!BBH", 0x80 | opcode, 126, length)
+        else:
+            header = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+        with conn.send_lock:
+            conn.sock.sendall(header + payload)
+
+    def _send_text(self, conn: _ClientConnection, text: str):
+        self._send_frame(conn, 0x1, text.encode())
+
+    def _emit_loop(self, conn: _ClientConnection):
+        interval = 0.005
+        budget = 0.0
+        cursor = 0
+        last = time.perf_counter()
+        try:
+            while conn.alive and self.is_running:
+                time.sleep(interval)
+                now = time.perf_counter()
+                budget += (now - last) * self.messages_per_second
+                last = now
+                streams = conn.streams
+                if streams:
+                    count = int(budget)
+                    budget -= count
+                    due_at = now + self.latency
+                    for _ in range(count):
+                        stream = streams[cursor % len(streams)]
+                        cursor += 1
+                        message = self._make_message(stream)
+                        if message is None:
+                            continue
+                        if conn.combined:
+                            message = {"stream": stream, "data": message}
+                        conn.pending.append((due_at, json.dumps(message)))
+                else:
+                    budget = 0.0
+                while conn.pending and conn.pending[0][0] <= now:
+                    _, text = conn.pending.popleft()
+                    self._send_text(conn, text)
+                    conn.sent += 1
+                    self.total_sent += 1
+        except OSError:
+            pass
+
+    def _make_message(self, stream: str) -> Optional[Dict]:
+        if '@' not in stream:
+            return None
+        symbol_lower, kind = stream.split('@', 1)
+        symbol = symbol_lower.upper()
+        if symbol not in self._prices:
+            return None
+        now_ms = int(time.time() * 1000)
+        with self._lock:
+            price = self._prices[symbol] * (1 + self._rng.gauss(0, 0.0002))
+            self._prices[symbol] = price
+
+        if kind == 'ticker':
+            return {
+                "e": "24hrTicker", "E": now_ms, "s": symbol,
+                "c": f"{price:.8f}", "P": "0.00", "p": "0.00",
+                "h": f"{price * 1.02:.8f}", "l": f"{price * 0.98:.8f}", "v": "1000.0"
+            }
+        if kind.startswith('kline_'):
+            interval = kind[len('kline_'):]
+            return self._kline_message(stream, symbol, interval, price, now_ms)
+        return None
+
+    def _kline_message(self, stream: str, symbol: str, interval: str, price: float, now_ms: int) -> Dict:
+        target_ms = timeframe_to_ms(interval)
+        bucket = now_ms - now_ms % target_ms
+        with self._lock:
+            state = self._klines.get(stream)
+            closed = state is not None and state['t'] < bucket
+            if state is None or closed:
+                if closed:
+                    # Önceki mumun kapanış mesajı
+                    finished = dict(state)
+                    self._klines[stream] = {'t': bucket, 'o': price, 'h': price, 'l': price, 'c': price, 'v': 0.0}
+                    return self._format_kline(symbol, interval, finished, True, now_ms, target_ms)
+                state = {'t': bucket, 'o': price, 'h': price, 'l': price, 'c': price, 'v': 0.0}
+                self._klines[stream] = state
+            state['h'] = max(state['h'], price)
+            state['l'] = min(state['l'], price)
+            state['c'] = price
+            state['v'] += self._rng.random()
+            return self._format_kline(symbol, interval, state, False, now_ms, target_ms)
+
+    def _format_kline(self, symbol: str, interval: str, state: Dict, closed: bool,
+                      now_ms: int, target_ms: int) -> Dict:
+        return {
+            "e": "kline", "E": now_ms, "s": symbol,
+            "k": {
+                "t": state['t'], "T": state['t'] + target_ms - 1, "s": symbol, "i": interval,
+                "o": f"{state['o']:.8f}", "h": f"{state['h']:.8f}", "l": f"{state['l']:.8f}",
+                "c": f"{state['c']:.8f}", "v": f"{state['v']:.8f}", "x": closed
+            }
+        }
+
+
+def start_simulated_environment(symbols: List[str], messages_per_second: float = 100.0,
+                                latency: float = 0.0, rest_latency: float = 0.0,
+                                disconnect_every: Optional[float] = None,
+                                seed: int = 42) -> Tuple[SimulatedExchange, BinanceStreamSimulator]:
+    """
+    Aynı sentetik piyasayı paylaşan REST borsası ve WebSocket sunucusunu başlat
+    """
+    market = SyntheticMarket(symbols, seed=seed)
+    exchange = SimulatedExchange(market, latency=rest_latency)
+    streams = BinanceStreamSimulator(market, messages_per_second=messages_per_second,
+                                     latency=latency, disconnect_every=disconnect_every)
+    streams.start()
+    return exchange, streams
@@ -0,0 +1,105 @@
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+import pandas as pd
+
+
+class HistoricalDataCache:
+    """
+    (symbol, timeframe) anahtarlı tarihsel veri önbelleği.
+    Kayıtlar mevcut mum kapanana kadar geçerlidir; aynı anahtar için eşzamanlı
+    istekler tek bir yüklemeyi paylaşır (single-flight). Daha küçük limit'li
+    istekler önbellekteki büyük çerçevenin sonundan dilimlenerek karşılanır.
+    """
+    def __init__(self, clock: Callable[[], float] = time.time, max_age: Optional[float] = None,
+                 close_grace: float = 1.0):
+        self.clock = clock
+        self.max_age = max_age
+        self.close_grace = close_grace
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[Tuple[str, str], Tuple[pd.DataFrame, float]] = {}
+        self._inflight: Dict[Tuple[str, str], threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def expires_at(self, timeframe_seconds: float) -> float:
+        """
+        Bir sonraki mum kapanış zamanı (+ kapanış sonrası küçük pay)
+        """
+        now = self.clock()
+        next_close = (int(now // timeframe_seconds) + 1) * timeframe_seconds + self.close_grace
+        if self.max_age is not None:
+            return min(next_close, now + self.max_age)
+        return next_close
+
+    def peek(self, symbol: str, timeframe: str, limit: int) -> Optional[pd.DataFrame]:
+        """
+        Geçerli ve yeterince uzun kayıt varsa son `limit` barı döndür
+        """
+        with self._lock:
+            return self._lookup((symbol, timeframe), limit)
+
+    def put(self, symbol: str, timeframe: str, df: pd.DataFrame, timeframe_seconds: float):
+        if df is None or df.empty:
+            return
+        with self._lock:
+            self._store((symbol, timeframe), df, timeframe_seconds)
+
+    def get_or_load(self, symbol: str, timeframe: str, limit: int, timeframe_seconds: float,
+                    loader: Callable[[int], pd.DataFrame]) -> pd.DataFrame:
+        key = (symbol, timeframe)
+        while True:
+            with self._lock:
+                cached = self._lookup(key, limit)
+                if cached is not None:
+                    return cached
+                event = self._inflight.get(key)
+                if event is None:
+                    event = threading.Event()
+                    self._inflight[key] = event
+                    break
+            # Aynı anahtar için başka bir yükleme sürüyor; bitmesini bekle ve tekrar bak
+            event.wait()
+
+        try:
+            df = loader(limit)
+            with self._lock:
+                self.misses += 1
+                if df is not None and not df.empty:
+                    self._store(key, df, timeframe_seconds)
+            return df
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            event.set()
+
+    def invalidate(self, symbol: Optional[str] = None, timeframe: Optional[str] = None):
+        with self._lock:
+            for key in list(self._entries):
+                if (symbol is None or key[0] == symbol) and (timeframe is None or key[1] == timeframe):
+                    del self._entries[key]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+    def _lookup(self, key: Tuple[str, str], limit: int) -> Optional[pd.DataFrame]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        df, expires_at = entry
+        if self.clock() >= expires_at:
+            del self._entries[key]
+            return None
+        if len(df) < limit:
+            return None
+        self.hits += 1
+        return df.iloc[-limit:]
+
+    def _store(self, key: Tuple[str, str], df: pd.DataFrame, timeframe_seconds: float):
+        current = self._entries.get(key)
+        # Aynı mum periyodunda daha uzun bir çerçeve varsa onu koru
+        if current is not None and self.clock() < current[1] and len(current[0]) > len(df) \
+                and current[0].index[-1] == df.index[-1]:
+            return
+        self._entries[key] = (df, self.expires_at(timeframe_seconds))
@@ -0,0 +1,160 @@
+import os
+import threading
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+
+OHLCV_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+COLUMN_DTYPES = {
+    'timestamp': np.dtype('<i8'),
+    'open': np.dtype('<f8'),
+    'high': np.dtype('<f8'),
+    'low': np.dtype('<f8'),
+    'close': np.dtype('<f8'),
+    'volume': np.dtype('<f8')
+}
+
+
+def columns_to_dataframe(columns: Dict[str, np.ndarray]) -> pd.DataFrame:
+    """
+    Store kolonlarını get_historical_data ile aynı biçimde DataFrame'e çevir
+    """
+    df = pd.DataFrame({col: np.asarray(columns[col]) for col in OHLCV_COLUMNS[1:]})
+    df.index = pd.to_datetime(np.asarray(columns['timestamp']), unit='ms')
+    df.index.name = 'timestamp'
+    return df
+
+
+class OHLCVStore:
+    """
+    Sembol/zaman dilimi başına diskte kolon bazlı OHLCV deposu.
+    Her kolon ayrı bir ham binary dosyadır; okumalar np.memmap üzerinden
+    kopyasız dilimlerdir, yeni barlar dosya sonuna eklenir.
+    """
+    def __init__(self, root_dir: str = "cache/ohlcv"):
+        self.root_dir = root_dir
+        self._lock = threading.Lock()
+
+    def _series_dir(self, symbol: str, timeframe: str) -> str:
+        return os.path.join(self.root_dir, symbol.replace('/', '_').upper(), timeframe)
+
+    def _column_path(self, symbol: str, timeframe: str, column: str) -> str:
+        return os.path.join(self._series_dir(symbol, timeframe), f"{column}.bin")
+
+    def length(self, symbol: str, timeframe: str) -> int:
+        """
+        Saklanan bar sayısı; yarım kalmış yazmalarda en kısa kolon esas alınır
+        """
+        lengths = []
+        for col in OHLCV_COLUMNS:
+            path = self._column_path(symbol, timeframe, col)
+            if not os.path.exists(path):
+                return 0
+            lengths.append(os.path.getsize(path) // COLUMN_DTYPES[col].itemsize)
+        return min(lengths)
+
+    def _map(self, symbol: str, timeframe: str, column: str, length: int) -> np.ndarray:
+        if length == 0:
+            return np.empty(0, dtype=COLUMN_DTYPES[column])
+        return np.memmap(self._column_path(symbol, timeframe, column),
+                         dtype=COLUMN_DTYPES[column], mode='r', shape=(length,))
+
+    def first_timestamp(self, symbol: str, timeframe: str) -> Optional[int]:
+        length = self.length(symbol, timeframe)
+        if length == 0:
+            return None
+        return int(self._map(symbol, timeframe, 'timestamp', length)[0])
+
+    def last_timestamp(self, symbol: str, timeframe: str) -> Optional[int]:
+        length = self.length(symbol, timeframe)
+        if length == 0:
+            return None
+        return int(self._map(symbol, timeframe, 'timestamp', length)[length - 1])
+
+    def read(self, symbol: str, timeframe: str, start: Optional[int] = None,
+             end: Optional[int] = None, limit: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        [start, end) ms aralığındaki son `limit` barı kopyasız memmap dilimleri olarak döndür
+        """
+        length = self.length(symbol, timeframe)
+        columns = {col: self._map(symbol, timeframe, col, length) for col in OHLCV_COLUMNS}
+        timestamps = columns['timestamp']
+
+        lo = 0 if start is None else int(np.searchsorted(timestamps, start, side='left'))
+        hi = length if end is None else int(np.searchsorted(timestamps, end, side='left'))
+        if limit is not None:
+            lo = max(lo, hi - limit)
+        return {col: values[lo:hi] for col, values in columns.items()}
+
+    def read_dataframe(self, symbol: str, timeframe: str, start: Optional[int] = None,
+                       end: Optional[int] = None, limit: Optional[int] = None) -> pd.DataFrame:
+        return columns_to_dataframe(self.read(symbol, timeframe, start, end, limit))
+
+    def append(self, symbol: str, timeframe: str, ohlcv: List[List[float]]) -> int:
+        """
+        Barları ekle. Son saklanan bar tekrar gelirse (oluşmakta olan mum) yerinde
+        güncellenir; daha eski barlar gelirse seri birleştirilip yeniden yazılır.
+        Eklenen/güncellenen bar sayısını döndürür.
+        """
+        if not ohlcv:
+            return 0
+        rows = np.asarray(ohlcv, dtype=np.float64)
+        rows = rows[np.argsort(rows[:, 0], kind='stable')]
+
+        with self._lock:
+            os.makedirs(self._series_dir(symbol, timeframe), exist_ok=True)
+            length = self.length(symbol, timeframe)
+            self._truncate(symbol, timeframe, length)
+            last_ts = self.last_timestamp(symbol, timeframe)
+
+            if last_ts is not None and rows[0, 0] < last_ts:
+                return self._rewrite_merged(symbol, timeframe, rows)
+
+            if last_ts is not None and rows[0, 0] == last_ts:
+                self._overwrite_row(symbol, timeframe, length - 1, rows[0])
+                rows = rows[1:]
+
+            for idx, col in enumerate(OHLCV_COLUMNS):
+                with open(self._column_path(symbol, timeframe, col), 'ab') as f:
+                    f.write(rows[:, idx].astype(COLUMN_DTYPES[col]).tobytes())
+            return len(ohlcv)
+
+    def _truncate(self, symbol: str, timeframe: str, length: int):
+        # Yarım kalmış bir yazmadan sonra kolon uzunluklarını eşitle
+        for col in OHLCV_COLUMNS:
+            path = self._column_path(symbol, timeframe, col)
+            size = length * COLUMN_DTYPES[col].itemsize
+            if os.path.exists(path) and os.path.getsize(path) != size:
+                with open(path, 'r+b') as f:
+                    f.truncate(size)
+
+    def _overwrite_row(self, symbol: str, timeframe: str, index: int, row: np.ndarray):
+        for idx, col in enumerate(OHLCV_COLUMNS):
+            dtype = COLUMN_DTYPES[col]
+            with open(self._column_path(symbol, timeframe, col), 'r+b') as f:
+                f.seek(index * dtype.itemsize)
+                f.write(np.asarray([row[idx]]).astype(dtype).tobytes())
+
+    def _rewrite_merged(self, symbol: str, timeframe: str, rows: np.ndarray) -> int:
+        existing = self.read(symbol, timeframe)
+        merged = {}
+        for idx, col in enumerate(OHLCV_COLUMNS):
+            merged[col] = np.concatenate([np.asarray(existing[col]), rows[:, idx].astype(COLUMN_DTYPES[col])])
+        # Aynı timestamp için yeni gelen bar kazanır
+        order = np.argsort(merged['timestamp'], kind='stable')
+        timestamps = merged['timestamp'][order]
+        keep = np.append(timestamps[1:] != timestamps[:-1], True)
+        for col in OHLCV_COLUMNS:
+            with open(self._column_path(symbol, timeframe, col) + ".tmp", 'wb') as f:
+                f.write(merged[col][order][keep].tobytes())
+        for col in OHLCV_COLUMNS:
+            path = self._column_path(symbol, timeframe, col)
+            os.replace(path + ".tmp", path)
+        return len(rows)
+
+    def clear(self, symbol: str, timeframe: str):
+        with self._lock:
+            for col in OHLCV_COLUMNS:
+                path = self._column_path(symbol, timeframe, col)
+                if os.path.exists(path):
+                    os.remove(path)
@@ -0,0 +1,99 @@
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from .ohlcv_store import OHLCV_COLUMNS, COLUMN_DTYPES
+
+TIMEFRAME_MS = {
+    '1m': 60000,
+    '3m': 3 * 60000,
+    '5m': 5 * 60000,
+    '15m': 15 * 60000,
+    '30m': 30 * 60000,
+    '1h': 3600000,
+    '2h': 2 * 3600000,
+    '4h': 4 * 3600000,
+    '6h': 6 * 3600000,
+    '12h': 12 * 3600000,
+    '1d': 86400000
+}
+
+
+def timeframe_to_ms(timeframe: str) -> int:
+    if timeframe not in TIMEFRAME_MS:
+        raise ValueError(f"Desteklenmeyen zaman dilimi: {timeframe}")
+    return TIMEFRAME_MS[timeframe]
+
+
+def resample_ohlcv(columns: Dict[str, np.ndarray], timeframe: str) -> Dict[str, np.ndarray]:
+    """
+    Zaman sıralı alt zaman dilimi barlarını vektörel olarak üst zaman dilimine topla.
+    Kovalar UTC epoch'a hizalıdır (Binance mum açılışlarıyla aynı).
+    """
+    target_ms = timeframe_to_ms(timeframe)
+    timestamps = np.asarray(columns['timestamp'], dtype=np.int64)
+    if len(timestamps) == 0:
+        return {col: np.empty(0, dtype=COLUMN_DTYPES[col]) for col in OHLCV_COLUMNS}
+
+    buckets = timestamps - timestamps % target_ms
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(buckets)] - 1
+
+    return {
+        'timestamp': buckets[starts],
+        'open': np.asarray(columns['open'])[starts],
+        'high': np.maximum.reduceat(np.asarray(columns['high']), starts),
+        'low': np.minimum.reduceat(np.asarray(columns['low']), starts),
+        'close': np.asarray(columns['close'])[ends],
+        'volume': np.add.reduceat(np.asarray(columns['volume']), starts)
+    }
+
+
+def _combine(first: Optional[Tuple], second: Optional[Tuple]) -> Optional[Tuple]:
+    # (open, high, low, close, volume) iki ardışık parçayı birleştir
+    if first is None:
+        return second
+    if second is None:
+        return first
+    return (first[0], max(first[1], second[1]), min(first[2], second[2]), second[3], first[4] + second[4])
+
+
+class IncrementalResampler:
+    """
+    1m bar güncellemelerinden üst zaman dilimlerinin oluşmakta olan barını O(1) ile tutar.
+    Her hedef için kovadaki kapanmış 1m barların toplamı ve oluşmakta olan 1m bar
+    ayrı saklanır; böylece yerinde güncellenen 1m bar çift sayılmaz.
+    """
+    def __init__(self, timeframes: List[str]):
+        self.timeframes = {tf: timeframe_to_ms(tf) for tf in timeframes}
+        self._state = {tf: {'bucket': None, 'closed': None, 'forming': None} for tf in timeframes}
+        self.completed: Dict[str, List[float]] = {}
+
+    def update(self, timestamp: int, open_: float, high: float, low: float, close: float,
+               volume: float, closed: bool = False):
+        bar = (open_, high, low, close, volume)
+        for tf, target_ms in self.timeframes.items():
+            state = self._state[tf]
+            bucket = timestamp - timestamp % target_ms
+            if state['bucket'] is not None and bucket < state['bucket']:
+                continue
+            if state['bucket'] != bucket:
+                previous = self.current(tf)
+                if previous is not None:
+                    self.completed[tf] = previous
+                state['bucket'] = bucket
+                state['closed'] = None
+                state['forming'] = None
+            if closed:
+                state['closed'] = _combine(state['closed'], bar)
+                state['forming'] = None
+            else:
+                state['forming'] = bar
+
+    def current(self, timeframe: str) -> Optional[List[float]]:
+        """
+        Oluşmakta olan üst zaman dilimi barı: [timestamp, open, high, low, close, volume]
+        """
+        state = self._state[timeframe]
+        bar = _combine(state['closed'], state['forming'])
+        if bar is None:
+            return None
+        return [state['bucket'], *bar]
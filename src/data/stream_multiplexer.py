@@ -0,0 +1,156 @@
+import json
+import threading
+import logging
+from typing import Callable, Dict, List, Optional, Set
+from .stream_supervisor import StreamSupervisor, SupervisedStream
+
+# Binance combined stream endpoint'i; mesajlar {"stream": ..., "data": ...} olarak gelir
+BINANCE_COMBINED_URL = "wss://stream.binance.com:9443/stream"
+# Binance bir bağlantıda en fazla 1024 stream'e izin veriyor
+MAX_STREAMS_PER_CONNECTION = 1024
+# SUBSCRIBE/UNSUBSCRIBE mesajı başına gönderilecek stream sayısı
+SUBSCRIBE_CHUNK_SIZE = 200
+
+
+class _CombinedConnection:
+    """
+    Tek bir combined WebSocket bağlantısı ve ona atanmış stream'ler
+    """
+    def __init__(self, index: int):
+        self.index = index
+        self.streams: Set[str] = set()
+        self.supervised: Optional[SupervisedStream] = None
+
+    @property
+    def connected(self) -> bool:
+        return self.supervised is not None and self.supervised.connected
+
+    @property
+    def ws(self):
+        return self.supervised.ws if self.supervised is not None else None
+
+
+class StreamMultiplexer:
+    """
+    Çok sayıda Binance stream'ini az sayıda combined bağlantı üzerinden taşır.
+    Stream'ler çalışma anında SUBSCRIBE/UNSUBSCRIBE ile eklenip çıkarılır,
+    bağlantı yeniden kurulmaz.
+    """
+    def __init__(self, on_data: Callable[[str, Dict], None], max_connections: int = 2,
+                 url: str = BINANCE_COMBINED_URL, logger: Optional[logging.Logger] = None,
+                 supervisor: Optional[StreamSupervisor] = None):
+        if max_connections < 1:
+            raise ValueError("max_connections en az 1 olmalı")
+        self.on_data = on_data
+        self.url = url
+        self.logger = logger or logging.getLogger(__name__)
+        self.supervisor = supervisor or StreamSupervisor(max_streams=max_connections, logger=self.logger)
+        self.connections = [_CombinedConnection(i) for i in range(max_connections)]
+        self.is_running = False
+        self._lock = threading.Lock()
+        self._request_id = 0
+
+    def start(self):
+        """
+        Stream'i olan bağlantıları başlat
+        """
+        self.is_running = True
+        for conn in self.connections:
+            if conn.streams:
+                self._ensure_thread(conn)
+
+    def subscribe(self, streams: List[str]):
+        """
+        Stream'leri en az yüklü bağlantılara dağıt ve abone ol
+        """
+        pending: Dict[int, List[str]] = {}
+        with self._lock:
+            for stream in streams:
+                stream = stream.lower()
+                if self._find_connection(stream) is not None:
+                    continue
+                conn = min(self.connections, key=lambda c: len(c.streams))
+                if len(conn.streams) >= MAX_STREAMS_PER_CONNECTION:
+                    raise ValueError(f"Stream limiti aşıldı ({stream}); max_connections değerini artırın")
+                conn.streams.add(stream)
+                pending.setdefault(conn.index, []).append(stream)
+
+        for index, new_streams in pending.items():
+            conn = self.connections[index]
+            if conn.connected:
+                self._send(conn, "SUBSCRIBE", new_streams)
+            elif self.is_running:
+                self._ensure_thread(conn)
+
+    def unsubscribe(self, streams: List[str]):
+        """
+        Stream aboneliklerini bağlantıyı kapatmadan kaldır
+        """
+        pending: Dict[int, List[str]] = {}
+        with self._lock:
+            for stream in streams:
+                stream = stream.lower()
+                conn = self._find_connection(stream)
+                if conn is None:
+                    continue
+                conn.streams.discard(stream)
+                pending.setdefault(conn.index, []).append(stream)
+
+        for index, old_streams in pending.items():
+            conn = self.connections[index]
+            if conn.connected:
+                self._send(conn, "UNSUBSCRIBE", old_streams)
+
+    def get_streams(self) -> List[str]:
+        with self._lock:
+            return sorted(s for conn in self.connections for s in conn.streams)
+
+    def stop(self):
+        self.is_running = False
+        for conn in self.connections:
+            if conn.supervised is not None:
+                self.supervisor.remove(conn.supervised.name)
+                conn.supervised = None
+
+    def _find_connection(self, stream: str) -> Optional[_CombinedConnection]:
+        for conn in self.connections:
+            if stream in conn.streams:
+                return conn
+        return None
+
+    def _send(self, conn: _CombinedConnection, method: str, streams: List[str]):
+        for i in range(0, len(streams), SUBSCRIBE_CHUNK_SIZE):
+            with self._lock:
+                self._request_id += 1
+                request_id = self._request_id
+            payload = {"method": method, "params": streams[i:i + SUBSCRIBE_CHUNK_SIZE], "id": request_id}
+            try:
+                conn.ws.send(json.dumps(payload))
+            except Exception as e:
+                self.logger.error(f"Combined WebSocket {method} hatası (#{conn.index}): {e}")
+
+    def _ensure_thread(self, conn: _CombinedConnection):
+        if conn.supervised is not None:
+            return
+        conn.supervised = self.supervisor.add(
+            f"combined-{conn.index}", self.url,
+            on_message=lambda ws, message: self._on_message(conn, message),
+            on_open=lambda ws: self._on_open(conn)
+        )
+
+    def _on_message(self, conn: _CombinedConnection, message: str):
+        payload = json.loads(message)
+        if 'stream' in payload and 'data' in payload:
+            self.on_data(payload['stream'], payload['data'])
+        elif payload.get('result') is None and 'id' in payload:
+            return
+        else:
+            self.logger.debug(f"Combined WebSocket bilinmeyen mesaj (#{conn.index}): {payload}")
+
+    def _on_open(self, conn: _CombinedConnection):
+        # Yeniden bağlanmada tüm abonelikler tekrar gönderilir
+        with self._lock:
+            streams = sorted(conn.streams)
+        self.logger.info(f"Combined WebSocket #{conn.index}: {len(streams)} stream'e abone olunuyor")
+        if streams:
+            self._send(conn, "SUBSCRIBE", streams)
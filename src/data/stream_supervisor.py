@@ -0,0 +1,203 @@
+import websocket
+import threading
+import time
+import random
+import logging
+from typing import Any, Callable, Dict, Optional
+
+
+class SupervisedStream:
+    """
+    Tek bir WebSocket akışının durumu ve sayaçları
+    """
+    def __init__(self, name: str, url: str, on_message: Callable[[Any, str], None],
+                 on_open: Optional[Callable[[Any], None]] = None):
+        self.name = name
+        self.url = url
+        self.on_message = on_message
+        self.on_open = on_open
+        self.ws: Optional[websocket.WebSocketApp] = None
+        self.thread: Optional[threading.Thread] = None
+        self.stop_event = threading.Event()
+        self.connected = False
+        self.connected_at: Optional[float] = None
+        self.failures = 0
+        self.reconnects = 0
+        self.messages = 0
+        self.last_message_at: Optional[float] = None
+        self.message_rate = 0.0
+        self._rate_checked_at = time.monotonic()
+        self._rate_messages = 0
+
+
+class StreamSupervisor:
+    """
+    WebSocket akışlarının yaşam döngüsünü yönetir: akış başına tek thread,
+    jitter'lı üstel geri çekilme ile yeniden bağlanma, ping/pong ve veri
+    sessizliği ile canlılık denetimi, üst sınırlı bağlantı sayısı.
+    """
+    def __init__(self, max_streams: int = 16, ping_interval: float = 20.0, ping_timeout: float = 10.0,
+                 stale_after: Optional[float] = 60.0, backoff_base: float = 1.0, backoff_max: float = 60.0,
+                 stable_after: float = 30.0, logger: Optional[logging.Logger] = None):
+        self.max_streams = max_streams
+        self.ping_interval = ping_interval
+        self.ping_timeout = ping_timeout
+        self.stale_after = stale_after
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.stable_after = stable_after
+        self.logger = logger or logging.getLogger(__name__)
+        self.streams: Dict[str, SupervisedStream] = {}
+        self._lock = threading.Lock()
+        self._watchdog: Optional[threading.Thread] = None
+        self._watchdog_stop = threading.Event()
+
+    def add(self, name: str, url: str, on_message: Callable[[Any, str], None],
+            on_open: Optional[Callable[[Any], None]] = None) -> SupervisedStream:
+        """
+        Akışı kaydet ve başlat; aynı isim zaten varsa mevcut akışı döndür
+        """
+        with self._lock:
+            if name in self.streams:
+                return self.streams[name]
+            if len(self.streams) >= self.max_streams:
+                raise ValueError(f"Akış limiti aşıldı ({self.max_streams}); combined mod kullanın")
+            stream = SupervisedStream(name, url, on_message, on_open)
+            self.streams[name] = stream
+            stream.thread = threading.Thread(target=self._run, args=(stream,), name=f"ws-{name}")
+            stream.thread.daemon = True
+            stream.thread.start()
+            self._ensure_watchdog()
+        return stream
+
+    def remove(self, name: str):
+        with self._lock:
+            stream = self.streams.pop(name, None)
+        if stream is not None:
+            self._stop_stream(stream)
+
+    def stop_all(self):
+        with self._lock:
+            streams = list(self.streams.values())
+            self.streams.clear()
+        for stream in streams:
+            self._stop_stream(stream)
+        with self._lock:
+            self._watchdog_stop.set()
+            self._watchdog = None
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Akış başına sayaçlar: bağlantı durumu, yeniden bağlanma, mesaj hızı, son mesaj yaşı
+        """
+        now = time.monotonic()
+        with self._lock:
+            streams = list(self.streams.values())
+        return {
+            stream.name: {
+                "connected": stream.connected,
+                "reconnects": stream.reconnects,
+                "messages": stream.messages,
+                "message_rate": stream.message_rate,
+                "last_message_age": None if stream.last_message_at is None else now - stream.last_message_at
+            }
+            for stream in streams
+        }
+
+    def _stop_stream(self, stream: SupervisedStream):
+        stream.stop_event.set()
+        if stream.ws is not None:
+            try:
+                stream.ws.close()
+            except Exception as e:
+                self.logger.error(f"WebSocket kapatma hatası ({stream.name}): {e}")
+
+    def _backoff(self, failures: int) -> float:
+        delay = min(self.backoff_max, self.backoff_base * (2 ** max(0, failures - 1)))
+        # Full jitter: aynı anda kopan akışlar aynı anda geri dönmesin
+        return random.uniform(delay / 2, delay)
+
+    def _run(self, stream: SupervisedStream):
+        def on_message(ws, message):
+            stream.messages += 1
+            stream.last_message_at = time.monotonic()
+            try:
+                stream.on_message(ws, message)
+            except Exception as e:
+                self.logger.error(f"WebSocket mesaj işleme hatası ({stream.name}): {e}")
+
+        def on_open(ws):
+            if stream.stop_event.is_set():
+                ws.close()
+                return
+            stream.connected = True
+            stream.connected_at = time.monotonic()
+            stream.last_message_at = stream.connected_at
+            self.logger.info(f"WebSocket bağlantısı açıldı ({stream.name})")
+            if stream.on_open is not None:
+                try:
+                    stream.on_open(ws)
+                except Exception as e:
+                    self.logger.error(f"WebSocket açılış işleme hatası ({stream.name}): {e}")
+
+        def on_error(ws, error):
+            self.logger.error(f"WebSocket hatası ({stream.name}): {error}")
+
+        def on_close(ws, close_status_code, close_msg):
+            stream.connected = False
+            self.logger.warning(f"WebSocket bağlantısı kapandı ({stream.name})")
+
+        # Yeniden bağlanma tek döngüde; özyineleme ve yığılan WebSocketApp nesnesi yok
+        while not stream.stop_event.is_set():
+            stream.ws = websocket.WebSocketApp(
+                stream.url,
+                on_message=on_message,
+                on_error=on_error,
+                on_close=on_close,
+                on_open=on_open
+            )
+            try:
+                stream.ws.run_forever(ping_interval=self.ping_interval, ping_timeout=self.ping_timeout,
+                                      reconnect=0)
+            except Exception as e:
+                self.logger.error(f"WebSocket çalıştırma hatası ({stream.name}): {e}")
+            stream.connected = False
+            if stream.stop_event.is_set():
+                break
+
+            lasted = time.monotonic() - stream.connected_at if stream.connected_at else 0
+            stream.failures = 1 if lasted >= self.stable_after else stream.failures + 1
+            stream.connected_at = None
+            stream.reconnects += 1
+            delay = self._backoff(stream.failures)
+            self.logger.info(f"WebSocket yeniden bağlanıyor ({stream.name}) {delay:.1f}s sonra")
+            stream.stop_event.wait(delay)
+        stream.ws = None
+
+    def _ensure_watchdog(self):
+        if self._watchdog is not None and self._watchdog.is_alive():
+            return
+        self._watchdog_stop = threading.Event()
+        self._watchdog = threading.Thread(target=self._watch, args=(self._watchdog_stop,), name="ws-watchdog")
+        self._watchdog.daemon = True
+        self._watchdog.start()
+
+    def _watch(self, stop_event: threading.Event):
+        # Mesaj hızını güncelle ve sessiz kalan bağlantıları kapatıp yeniden bağlanmaya zorla
+        while not stop_event.wait(1.0):
+            now = time.monotonic()
+            with self._lock:
+                streams = list(self.streams.values())
+            for stream in streams:
+                elapsed = now - stream._rate_checked_at
+                if elapsed > 0:
+                    stream.message_rate = (stream.messages - stream._rate_messages) / elapsed
+                stream._rate_checked_at = now
+                stream._rate_messages = stream.messages
+                if (self.stale_after and stream.connected and stream.last_message_at is not None
+                        and now - stream.last_message_at > self.stale_after and stream.ws is not None):
+                    self.logger.warning(f"WebSocket {self.stale_after:.0f}s veri almadı, yeniden bağlanılıyor ({stream.name})")
+                    try:
+                        stream.ws.close()
+                    except Exception as e:
+                        self.logger.error(f"WebSocket kapatma hatası ({stream.name}): {e}")
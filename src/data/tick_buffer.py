@@ -0,0 +1,101 @@
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Dict, Iterator, Optional
+import numpy as np
+
+TICK_DTYPE = np.dtype([
+    ('price', '<f8'),
+    ('volume', '<f8'),
+    ('event_time', '<i8'),    # borsa olay zamanı (ms)
+    ('receive_time', '<i8')   # yerel alım zamanı (ns, time.time_ns)
+])
+
+# 24hrTicker'dan her tikte yerinde güncellenen istatistik alanları
+TICKER_STAT_FIELDS = ['change_percent', 'high_24h', 'low_24h', 'price_change']
+
+
+class TickRingBuffer:
+    """
+    Sembol başına önceden ayrılmış, yapılandırılmış NumPy tik halka tamponu.
+    Her tik i ve i + capacity konumlarına yazılır; son n tik bitişik bir dilimdir.
+    Tek yazıcı / çok okuyucu: sayaç yazmadan sonra ilerletilir ve okumalar en fazla
+    capacity - 1 tik döndürür, böylece okunan pencere bir sonraki yazmayla çakışmaz.
+    Dönen dilimler canlı görünümdür; sabit bir kopya için .copy() kullanın.
+    """
+    def __init__(self, capacity: int = 10000):
+        if capacity < 2:
+            raise ValueError("capacity en az 2 olmalı")
+        self.capacity = capacity
+        self._data = np.zeros(2 * capacity, dtype=TICK_DTYPE)
+        self._head = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity - 1)
+
+    @property
+    def total_ticks(self) -> int:
+        return self._count
+
+    def append(self, price: float, volume: float, event_time: int, receive_time: int):
+        pos = self._head
+        record = (price, volume, event_time, receive_time)
+        self._data[pos] = record
+        self._data[pos + self.capacity] = record
+        self._head = (pos + 1) % self.capacity
+        self._count += 1
+
+    def latest(self) -> Optional[np.void]:
+        if self._count == 0:
+            return None
+        return self._data[self._head - 1 + self.capacity]
+
+    def last(self, n: Optional[int] = None) -> np.ndarray:
+        """
+        Son n tik (yapılandırılmış dizi görünümü)
+        """
+        head, count = self._head, self._count
+        size = min(count, self.capacity - 1)
+        n = size if n is None else max(0, min(n, size))
+        end = head + self.capacity
+        return self._data[end - n:end]
+
+    def since(self, timestamp: int, field: str = 'event_time') -> np.ndarray:
+        """
+        field >= timestamp olan tikler; event_time için ms, receive_time için ns
+        """
+        window = self.last()
+        start = int(np.searchsorted(window[field], timestamp, side='left'))
+        return window[start:]
+
+
+class RealTimeDataView(Mapping):
+    """
+    Eski real_time_data sözlüğüyle uyumlu salt okunur görünüm.
+    Sözlükler yalnızca okunduğunda üretilir; tik yolunda nesne ayrılmaz.
+    """
+    def __init__(self, tick_buffers: Dict[str, TickRingBuffer], ticker_stats: Dict[str, np.ndarray]):
+        self._tick_buffers = tick_buffers
+        self._ticker_stats = ticker_stats
+
+    def __getitem__(self, symbol: str) -> Dict:
+        buffer = self._tick_buffers.get(symbol)
+        tick = buffer.latest() if buffer is not None else None
+        if tick is None:
+            raise KeyError(symbol)
+        data = {
+            'symbol': symbol,
+            'price': float(tick['price']),
+            'timestamp': datetime.fromtimestamp(int(tick['receive_time']) / 1e9),
+            'volume': float(tick['volume'])
+        }
+        stats = self._ticker_stats.get(symbol)
+        if stats is not None:
+            data.update(zip(TICKER_STAT_FIELDS, (float(v) for v in stats)))
+        return data
+
+    def __iter__(self) -> Iterator[str]:
+        return (symbol for symbol, buffer in list(self._tick_buffers.items()) if buffer.total_ticks)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
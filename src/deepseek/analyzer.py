@@ -1,14 +1,47 @@
 import requests
+import asyncio
 import json
 import logging
+import math
 import os
-from typing import Dict, List, Any, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Dict, Iterable, Iterator, List, Any, Optional, Tuple
 from datetime import datetime
+from .response_cache import ResponseCache
+from .health_check import HealthCheck
+from .streaming import VERDICT_FIELDS, IncrementalJSONFields, iter_sse_content
+from .batch_analysis import BatchItem, context_limits, create_batch_prompt, estimate_tokens, parse_batch_response, plan_batches
+from .concurrent_analysis import DEFAULT_RATE_LIMITS, AnalysisRequest, analyze_many, collect, get_provider_limiter
+
+# /models yanıtı uç nokta başına bu kadar saniye paylaşılır (model tespiti, model listesi)
+MODELS_TTL = 300.0
+_models_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+_models_lock = threading.Lock()
 
 class DeepSeekAnalyzer:
-    def __init__(self, api_key: str = None, base_url: str = None, model: str = None, local_mode: bool = False):
+    # Yanıt ayrıştırılamadığında döndürülen analiz
+    FALLBACK_ANALYSIS = {
+        "recommendation": "BEKLE",
+        "confidence": 50,
+        "risk_level": "ORTA",
+        "reasoning": "Analiz tamamlanamadı",
+        "market_context": "Model yanıtı işlenemedi"
+    }
+    
+    def __init__(self, api_key: str = None, base_url: str = None, model: str = None, local_mode: bool = False,
+                 response_cache: Optional[ResponseCache] = None, price_bucket: float = 0.0025,
+                 requests_per_minute: Optional[float] = None, pool_size: int = 16, health_ttl: float = 30.0,
+                 context_window: Optional[int] = None, max_output_tokens: Optional[int] = None):
         self.logger = self._setup_logger()
         self.local_mode = local_mode
+        # Keep-alive bağlantı havuzu: her çağrı yeni TCP/TLS el sıkışması yapmaz
+        self.session = self._create_session(pool_size)
+        # Aynı (nicemlenmiş) girdilerle tekrarlanan analizler API'ye gitmez
+        self.response_cache = response_cache if response_cache is not None else ResponseCache()
+        # Önbellek anahtarında fiyatın göreli kova genişliği (0: tam fiyat)
+        self.price_bucket = price_bucket
         
         if self.local_mode:
             # Local LM Studio modu
@@ -27,6 +60,18 @@ class DeepSeekAnalyzer:
                 "Authorization": f"Bearer {api_key}" if api_key else ""
             }
         
+        # Aynı uç noktaya giden tüm analyzer'lar dakikalık limiti paylaşır
+        if requests_per_minute is None:
+            requests_per_minute = DEFAULT_RATE_LIMITS["local" if self.local_mode else "cloud"]
+        self.rate_limiter = get_provider_limiter(self.base_url, requests_per_minute)
+        # Bağlantı durumu ttl boyunca önbellekte; gerçek istekler durumu günceller
+        self.health = HealthCheck(self._probe_connection, ttl=health_ttl, logger=self.logger)
+        # Toplu analizde grup boyutu bu sınırlara göre belirlenir
+        self.context_window, self.max_output_tokens, self.output_tokens_per_symbol = context_limits(
+            self.model, self.local_mode, context_window, max_output_tokens)
+        self.batch_stats = {"requests": 0, "symbols": 0, "retried": 0, "prompt_tokens": 0}
+        self._stats_lock = threading.Lock()
+        
     def _setup_logger(self):
         logging.basicConfig(
             level=logging.INFO,
@@ -38,26 +83,57 @@ class DeepSeekAnalyzer:
         )
         return logging.getLogger(__name__)
     
+    @staticmethod
+    def _create_session(pool_size: int) -> requests.Session:
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+    
+    def close(self):
+        """
+        Bağlantı havuzunu ve arka plan sağlık kontrolünü kapat
+        """
+        self.health.stop()
+        self.session.close()
+    
+    def _fetch_models(self, force: bool = False) -> Optional[List[Dict[str, Any]]]:
+        """
+        /models listesi; aynı uç nokta için MODELS_TTL boyunca önbellekten döner
+        """
+        now = time.monotonic()
+        if not force:
+            with _models_lock:
+                cached = _models_cache.get(self.base_url)
+            if cached is not None and now - cached[0] < MODELS_TTL:
+                return cached[1]
+        try:
+            response = self.session.get(f"{self.base_url}/models", timeout=10)
+            if response.status_code != 200:
+                return None
+            models = response.json().get("data", [])
+        except Exception:
+            return None
+        with _models_lock:
+            _models_cache[self.base_url] = (now, models)
+        return models
+    
     def _detect_available_model(self) -> str:
         """
         LM Studio'da mevcut modelleri tespit et
         """
-        try:
-            response = requests.get(f"{self.base_url}/models", timeout=10)
-            if response.status_code == 200:
-                models = response.json().get("data", [])
-                for model in models:
-                    model_id = model.get("id", "").lower()
-                    if "deepseek" in model_id:
-                        return model.get("id")
-                    elif "qwen" in model_id:
-                        return model.get("id")
-                
-                # Hiçbiri yoksa ilk modeli kullan
-                if models:
-                    return models[0].get("id")
-        except:
-            pass
+        models = self._fetch_models() or []
+        for model in models:
+            model_id = model.get("id", "").lower()
+            if "deepseek" in model_id:
+                return model.get("id")
+            elif "qwen" in model_id:
+                return model.get("id")
+        
+        # Hiçbiri yoksa ilk modeli kullan
+        if models:
+            return models[0].get("id")
         
         # Varsayılan model
         return "deepseek-coder"
@@ -67,38 +143,243 @@ class DeepSeekAnalyzer:
         DeepSeek ile analiz - local veya cloud
         """
         try:
-            if self.local_mode:
-                if not self.test_connection():
-                    raise ConnectionError("LM Studio bağlantısı yok. Lütfen LM Studio'yu çalıştırın.")
-                prompt = self._create_local_analysis_prompt(symbol, strategies_results, current_price)
-                response = self._query_local_deepseek(prompt)
-                source = f"LOCAL_DEEPSEEK ({self.model})"
-            else:
-                if not self.api_key:
-                    raise ValueError("DeepSeek API key gereklidir")
-                prompt = self._create_analysis_prompt(symbol, strategies_results, current_price)
-                response = self._query_deepseek_api(prompt)
-                source = "DEEPSEEK_API"
+            cache_key = self._cache_key(symbol, strategies_results, current_price)
+            response = self.response_cache.get(cache_key)
+            cached = response is not None
+            if not cached:
+                prompt = self._prepare_prompt(symbol, strategies_results, current_price)
+                if self.local_mode:
+                    response = self._query_local_deepseek(prompt)
+                else:
+                    response = self._query_deepseek_api(prompt)
             
             analysis = self._parse_response(response)
+            # Ayrıştırılamayan yanıtlar önbelleğe alınmaz; sonraki çağrı yeniden dener
+            if not cached and analysis != self.FALLBACK_ANALYSIS:
+                self.response_cache.put(cache_key, response)
             
-            return {
-                "symbol": symbol,
-                "analysis": analysis,
-                "timestamp": datetime.now(),
-                "recommendation": analysis.get("recommendation", "BEKLE"),
-                "confidence": analysis.get("confidence", 0),
-                "reasoning": analysis.get("reasoning", "Analiz yapılamadı"),
-                "risk_level": analysis.get("risk_level", "ORTA"),
-                "market_context": analysis.get("market_context", ""),
-                "price_targets": analysis.get("price_targets", {}),
-                "source": source
-            }
+            return self._build_result(symbol, analysis, cached)
             
         except Exception as e:
             self.logger.error(f"DeepSeek analiz hatası ({symbol}): {e}")
             raise ConnectionError(f"DeepSeek analiz hatası: {e}")
     
+    def analyze_trading_signals_stream(self, symbol: str, strategies_results: Dict[str, Any],
+                                       current_price: float) -> Iterator[Dict[str, Any]]:
+        """
+        Akışlı analiz. Olaylar:
+        {"type": "field", "field", "value", "elapsed"}: üst düzey JSON alanı tamamlandı
+        {"type": "verdict", "recommendation", "confidence", "risk_level", "elapsed"}: karar hazır
+        {"type": "result", "result"}: analyze_trading_signals ile aynı sonuç + "timing"
+        """
+        start = time.perf_counter()
+        timing = {"first_token": None, "verdict": None, "total": None}
+        try:
+            cache_key = self._cache_key(symbol, strategies_results, current_price)
+            response = self.response_cache.get(cache_key)
+            cached = response is not None
+            verdict_sent = False
+            if not cached:
+                prompt = self._prepare_prompt(symbol, strategies_results, current_price)
+                extractor = IncrementalJSONFields()
+                for chunk in self._stream_completion(prompt):
+                    elapsed = time.perf_counter() - start
+                    if timing["first_token"] is None:
+                        timing["first_token"] = elapsed
+                    for field, value in extractor.feed(chunk):
+                        yield {"type": "field", "field": field, "value": value, "elapsed": elapsed}
+                        if not verdict_sent and extractor.has(VERDICT_FIELDS):
+                            verdict_sent = True
+                            timing["verdict"] = elapsed
+                            yield dict(type="verdict", elapsed=elapsed,
+                                       **{name: extractor.fields[name] for name in VERDICT_FIELDS})
+                response = extractor.buffer
+            
+            analysis = self._parse_response(response)
+            if not cached and analysis != self.FALLBACK_ANALYSIS:
+                self.response_cache.put(cache_key, response)
+            result = self._build_result(symbol, analysis, cached)
+            timing["total"] = time.perf_counter() - start
+            if not verdict_sent:
+                # Önbellekten gelen veya alanları eksik yanıtlarda karar ayrıştırılmış sonuçtan verilir
+                timing["verdict"] = timing["total"]
+                yield dict(type="verdict", elapsed=timing["total"], **{name: result[name] for name in VERDICT_FIELDS})
+            result["timing"] = timing
+            if not cached:
+                self.logger.info(f"Akışlı analiz ({symbol}): ilk parça {timing['first_token'] or 0:.2f}s, "
+                                 f"karar {timing['verdict']:.2f}s, toplam {timing['total']:.2f}s")
+            yield {"type": "result", "result": result}
+            
+        except Exception as e:
+            self.logger.error(f"DeepSeek analiz hatası ({symbol}): {e}")
+            raise ConnectionError(f"DeepSeek analiz hatası: {e}")
+    
+    def analyze_batch(self, requests: Iterable[AnalysisRequest], max_batch_size: int = 20,
+                      token_budget: Optional[int] = None, max_concurrency: int = 1) -> Dict[str, Dict[str, Any]]:
+        """
+        Çok sembollü toplu analiz: önbellekte olmayan semboller bağlam penceresine ve
+        token bütçesine sığan gruplar halinde tek prompt'la sorgulanır. Yanıtta eksik
+        veya geçersiz çıkan semboller tek tek yeniden denenir. sembol → sonuç döndürür;
+        analiz edilemeyenler {"symbol", "error"} olur.
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        pending: List[BatchItem] = []
+        keys: Dict[str, str] = {}
+        for symbol, strategies_results, current_price in requests:
+            try:
+                keys[symbol] = self._cache_key(symbol, strategies_results, current_price)
+            except Exception as e:
+                self.logger.error(f"DeepSeek analiz hatası ({symbol}): {e}")
+                results[symbol] = {"symbol": symbol, "error": f"DeepSeek analiz hatası: {e}"}
+                continue
+            response = self.response_cache.get(keys[symbol])
+            if response is not None:
+                results[symbol] = self._build_result(symbol, self._parse_response(response), True)
+            else:
+                pending.append((symbol, strategies_results, current_price))
+        if not pending:
+            return results
+        
+        batches = plan_batches(pending, self.context_window, self.max_output_tokens, self.output_tokens_per_symbol,
+                               max_batch_size, compact=self.local_mode, token_budget=token_budget)
+        if max_concurrency > 1 and len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="deepseek-batch") as executor:
+                outcomes = list(executor.map(self._query_batch, batches))
+        else:
+            outcomes = [self._query_batch(batch) for batch in batches]
+        
+        retry, single = [], []
+        for batch, analyses in zip(batches, outcomes):
+            if analyses is None:
+                single.extend(batch)
+                continue
+            for item in batch:
+                symbol = item[0]
+                if symbol in analyses:
+                    # Tekil analizle aynı anahtar: sonraki tekil çağrılar da önbellekten döner
+                    self.response_cache.put(keys[symbol], json.dumps(analyses[symbol], ensure_ascii=False))
+                    results[symbol] = self._build_result(symbol, analyses[symbol], False)
+                    results[symbol]["batched"] = True
+                else:
+                    retry.append(item)
+        
+        if retry:
+            with self._stats_lock:
+                self.batch_stats["retried"] += len(retry)
+            self.logger.warning(f"Toplu yanıtta eksik/geçersiz {len(retry)} sembol tek tek deneniyor: "
+                                f"{', '.join(item[0] for item in retry)}")
+        for symbol, strategies_results, current_price in single + retry:
+            try:
+                results[symbol] = self.analyze_trading_signals(symbol, strategies_results, current_price)
+            except Exception as e:
+                results[symbol] = {"symbol": symbol, "error": str(e)}
+        return results
+    
+    def _query_batch(self, batch: List[BatchItem]) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Bir grubu tek istekle sorgula; geçerli analizleri döndür (hata durumunda boş).
+        Tek sembollü grup için None: toplu şemanın faydası yok, tekil yol kullanılır.
+        """
+        if len(batch) == 1:
+            return None
+        prompt = create_batch_prompt(batch, compact=self.local_mode)
+        max_tokens = min(self.max_output_tokens, self.output_tokens_per_symbol * len(batch) + 200)
+        with self._stats_lock:
+            self.batch_stats["requests"] += 1
+            self.batch_stats["symbols"] += len(batch)
+            self.batch_stats["prompt_tokens"] += estimate_tokens(prompt)
+        try:
+            self._ensure_ready()
+            if self.local_mode:
+                response = self._query_local_deepseek(prompt, max_tokens=max_tokens)
+            else:
+                response = self._query_deepseek_api(prompt, max_tokens=max_tokens)
+        except Exception as e:
+            self.logger.error(f"Toplu DeepSeek analiz hatası ({len(batch)} sembol): {e}")
+            return {}
+        analyses, _ = parse_batch_response(response, [item[0] for item in batch])
+        return analyses
+    
+    def get_batch_stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            return dict(self.batch_stats)
+    
+    def _ensure_ready(self):
+        if self.local_mode:
+            if not self.health.check():
+                raise ConnectionError("LM Studio bağlantısı yok. Lütfen LM Studio'yu çalıştırın.")
+        elif not self.api_key:
+            raise ValueError("DeepSeek API key gereklidir")
+    
+    def _prepare_prompt(self, symbol: str, strategies_results: Dict[str, Any], current_price: float) -> str:
+        """
+        Arka ucun hazır olduğunu doğrula ve moda uygun prompt'u oluştur
+        """
+        self._ensure_ready()
+        if self.local_mode:
+            return self._create_local_analysis_prompt(symbol, strategies_results, current_price)
+        return self._create_analysis_prompt(symbol, strategies_results, current_price)
+    
+    def _build_result(self, symbol: str, analysis: Dict[str, Any], cached: bool) -> Dict[str, Any]:
+        return {
+            "symbol": symbol,
+            "analysis": analysis,
+            "timestamp": datetime.now(),
+            "recommendation": analysis.get("recommendation", "BEKLE"),
+            "confidence": analysis.get("confidence", 0),
+            "reasoning": analysis.get("reasoning", "Analiz yapılamadı"),
+            "risk_level": analysis.get("risk_level", "ORTA"),
+            "market_context": analysis.get("market_context", ""),
+            "price_targets": analysis.get("price_targets", {}),
+            "source": f"LOCAL_DEEPSEEK ({self.model})" if self.local_mode else "DEEPSEEK_API",
+            "cached": cached
+        }
+    
+    def analyze_many(self, requests: Iterable[AnalysisRequest], max_concurrency: int = 4,
+                     deadline: Optional[float] = None) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        (sembol, strateji sonuçları, fiyat) isteklerini eşzamanlı analiz eden async üreteç;
+        sonuçlar tamamlandıkça (sembol, sonuç) olarak gelir
+        """
+        return analyze_many(self, requests, max_concurrency=max_concurrency, deadline=deadline)
+    
+    def analyze_many_sync(self, requests: Iterable[AnalysisRequest], max_concurrency: int = 4,
+                          deadline: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        analyze_many'nin senkron karşılığı: sembol → sonuç
+        """
+        return asyncio.run(collect(self, requests, max_concurrency=max_concurrency, deadline=deadline))
+    
+    def _throttle(self):
+        if self.rate_limiter is not None:
+            self.rate_limiter.wait()
+    
+    def _quantize_price(self, price: float) -> float:
+        # Göreli kovanın orta noktası: yakın fiyatlar aynı değere düşer
+        if not self.price_bucket or price <= 0:
+            return price
+        step = math.log1p(self.price_bucket)
+        return float(f"{math.exp(round(math.log(price) / step) * step):.6g}")
+    
+    def _cache_key(self, symbol: str, strategies_results: Dict[str, Any], current_price: float) -> str:
+        """
+        Prompt, nicemlenmiş fiyat ve prompt'ta gösterilen hassasiyetteki güvenlerle kurulur;
+        anahtar model, uç nokta ve bu prompt'un özetidir
+        """
+        quantized = {
+            name: {"signal": result.get("signal"), "confidence": round(float(result.get("confidence", 0)), 3)}
+            for name, result in strategies_results.items()
+        }
+        price = self._quantize_price(float(current_price))
+        if self.local_mode:
+            prompt = self._create_local_analysis_prompt(symbol, quantized, price)
+        else:
+            prompt = self._create_analysis_prompt(symbol, quantized, price)
+        return ResponseCache.key(self.model, self.base_url, prompt)
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        return self.response_cache.stats()
+    
     def _create_analysis_prompt(self, symbol: str, strategies_results: Dict[str, Any], current_price: float) -> str:
         """
         Cloud analiz için prompt
@@ -156,48 +437,54 @@ class DeepSeekAnalyzer:
         """
         return prompt
     
-    def _query_deepseek_api(self, prompt: str) -> str:
+    def _chat_payload(self, prompt: str, stream: bool = False, max_tokens: int = 1000) -> Dict[str, Any]:
+        """
+        Moda uygun chat-completions isteği (cloud'da sistem mesajı eklenir)
+        """
+        messages = [{"role": "user", "content": prompt}]
+        if not self.local_mode:
+            messages.insert(0, {
+                "role": "system",
+                "content": "Sen bir finansal analiz uzmanısın. Kripto para trading sinyallerini analiz ediyorsun. Yanıtlarını her zaman JSON formatında ver."
+            })
+        return {
+            "model": self.model,
+            "messages": messages,
+            "temperature": 0.3,
+            "max_tokens": max_tokens,
+            "stream": stream
+        }
+    
+    def _query_deepseek_api(self, prompt: str, max_tokens: int = 1000) -> str:
         """
         Cloud DeepSeek API'ye sorgu gönder
         """
+        self._throttle()
         try:
-            data = {
-                "model": self.model,
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "Sen bir finansal analiz uzmanısın. Kripto para trading sinyallerini analiz ediyorsun. Yanıtlarını her zaman JSON formatında ver."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                "temperature": 0.3,
-                "max_tokens": 1000,
-                "stream": False
-            }
-            
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/chat/completions",
                 headers=self.headers,
-                json=data,
+                json=self._chat_payload(prompt, max_tokens=max_tokens),
                 timeout=30
             )
             
             if response.status_code == 200:
+                self.health.mark_success()
                 result = response.json()
                 return result["choices"][0]["message"]["content"]
             else:
+                self.health.mark_failure()
                 error_msg = f"DeepSeek API hatası: {response.status_code} - {response.text}"
                 self.logger.error(error_msg)
                 raise ConnectionError(error_msg)
                 
         except requests.exceptions.Timeout:
+            self.health.mark_failure()
             error_msg = "DeepSeek API zaman aşımı"
             self.logger.error(error_msg)
             raise ConnectionError(error_msg)
         except requests.exceptions.ConnectionError:
+            self.health.mark_failure()
             error_msg = "DeepSeek API bağlantı hatası"
             self.logger.error(error_msg)
             raise ConnectionError(error_msg)
@@ -206,44 +493,36 @@ class DeepSeekAnalyzer:
             self.logger.error(error_msg)
             raise ConnectionError(error_msg)
 
-    def _query_local_deepseek(self, prompt: str) -> str:
+    def _query_local_deepseek(self, prompt: str, max_tokens: int = 1000) -> str:
         """
         Local LM Studio'ya sorgu gönder
         """
+        self._throttle()
         try:
-            data = {
-                "model": self.model,
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                "temperature": 0.3,
-                "max_tokens": 1000,
-                "stream": False
-            }
-            
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/chat/completions",
                 headers=self.headers,
-                json=data,
+                json=self._chat_payload(prompt, max_tokens=max_tokens),
                 timeout=120  # Local model için daha uzun timeout
             )
             
             if response.status_code == 200:
+                self.health.mark_success()
                 result = response.json()
                 return result["choices"][0]["message"]["content"]
             else:
+                self.health.mark_failure()
                 error_msg = f"LM Studio API hatası: {response.status_code} - {response.text}"
                 self.logger.error(error_msg)
                 raise ConnectionError(error_msg)
                 
         except requests.exceptions.Timeout:
+            self.health.mark_failure()
             error_msg = "LM Studio zaman aşımı - Model yanıt vermiyor"
             self.logger.error(error_msg)
             raise ConnectionError(error_msg)
         except requests.exceptions.ConnectionError:
+            self.health.mark_failure()
             error_msg = "LM Studio bağlantı hatası - LM Studio çalışıyor mu?"
             self.logger.error(error_msg)
             raise ConnectionError(error_msg)
@@ -252,6 +531,40 @@ class DeepSeekAnalyzer:
             self.logger.error(error_msg)
             raise ConnectionError(error_msg)
     
+    def _stream_completion(self, prompt: str) -> Iterator[str]:
+        """
+        stream=True ile sorgu gönder; SSE içerik parçalarını geldikçe üret
+        """
+        label = "LM Studio" if self.local_mode else "DeepSeek API"
+        self._throttle()
+        try:
+            response = self.session.post(
+                f"{self.base_url}/chat/completions",
+                headers=self.headers,
+                json=self._chat_payload(prompt, stream=True),
+                timeout=120 if self.local_mode else 30,
+                stream=True
+            )
+            with response:
+                if response.status_code != 200:
+                    self.health.mark_failure()
+                    error_msg = f"{label} API hatası: {response.status_code} - {response.text}"
+                    self.logger.error(error_msg)
+                    raise ConnectionError(error_msg)
+                self.health.mark_success()
+                # text/event-stream genelde charset'siz gelir; satırlar bayt olarak alınıp UTF-8 çözülür
+                yield from iter_sse_content(response.iter_lines())
+        except requests.exceptions.Timeout:
+            self.health.mark_failure()
+            error_msg = f"{label} zaman aşımı"
+            self.logger.error(error_msg)
+            raise ConnectionError(error_msg)
+        except requests.exceptions.ConnectionError:
+            self.health.mark_failure()
+            error_msg = f"{label} bağlantı hatası"
+            self.logger.error(error_msg)
+            raise ConnectionError(error_msg)
+    
     def _parse_response(self, response: str) -> Dict[str, Any]:
         """
         API yanıtını ayrıştır
@@ -270,21 +583,21 @@ class DeepSeekAnalyzer:
             error_msg = f"Yanıt ayrıştırma hatası: {e}"
             self.logger.error(error_msg)
             # Basit bir fallback analiz döndür
-            return {
-                "recommendation": "BEKLE",
-                "confidence": 50,
-                "risk_level": "ORTA",
-                "reasoning": "Analiz tamamlanamadı",
-                "market_context": "Model yanıtı işlenemedi"
-            }
+            return dict(self.FALLBACK_ANALYSIS)
     
     def test_connection(self) -> bool:
         """
-        Bağlantıyı test et (local veya cloud)
+        Bağlantıyı test et (local veya cloud); sonuç sağlık önbelleğine yazılır
         """
+        return self.health.check(force=True)
+    
+    def get_health(self) -> Dict[str, Any]:
+        return self.health.stats()
+    
+    def _probe_connection(self) -> bool:
         try:
             if self.local_mode:
-                response = requests.get(f"{self.base_url}/models", timeout=15)
+                response = self.session.get(f"{self.base_url}/models", timeout=15)
                 return response.status_code == 200
             else:
                 if not self.api_key:
@@ -296,7 +609,7 @@ class DeepSeekAnalyzer:
                     "max_tokens": 5
                 }
                 
-                response = requests.post(
+                response = self.session.post(
                     f"{self.base_url}/chat/completions",
                     headers=self.headers,
                     json=data,
@@ -313,11 +626,5 @@ class DeepSeekAnalyzer:
         if not self.local_mode:
             return []
             
-        try:
-            response = requests.get(f"{self.base_url}/models", timeout=10)
-            if response.status_code == 200:
-                models = response.json().get("data", [])
-                return [model.get("id", "Unknown") for model in models]
-        except:
-            pass
-        return []
\ No newline at end of file
+        models = self._fetch_models()
+        return [model.get("id", "Unknown") for model in models] if models else []
\ No newline at end of file
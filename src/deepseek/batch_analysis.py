@@ -0,0 +1,133 @@
+import json
+import math
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+# Model bağlam penceresi ve tek yanıtta üretilebilecek en fazla token
+CONTEXT_WINDOWS = {
+    "deepseek-chat": 65536,
+    "deepseek-reasoner": 65536
+}
+DEFAULT_CONTEXT_WINDOW = {"cloud": 65536, "local": 4096}
+MAX_OUTPUT_TOKENS = {"cloud": 8192, "local": 2048}
+# Sembol başına beklenen yanıt uzunluğu (token); cloud şemasında fiyat hedefleri de var
+OUTPUT_TOKENS_PER_SYMBOL = {"cloud": 260, "local": 160}
+
+VALID_RECOMMENDATIONS = {"AL", "SAT", "BEKLE"}
+VALID_RISK_LEVELS = {"DÜŞÜK", "ORTA", "YÜKSEK"}
+
+BatchItem = Tuple[str, Dict[str, Any], float]
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Kaba token tahmini (Türkçe metin ve JSON için ~3.5 karakter/token)
+    """
+    return math.ceil(len(text) / 3.5)
+
+
+def format_item(symbol: str, strategies_results: Dict[str, Any], current_price: float) -> str:
+    signals = ", ".join(
+        f"{name} {strategies_results[name]['signal']} %{strategies_results[name]['confidence'] * 100:.0f}"
+        for name in ('scalp', 'swing', 'daily')
+    )
+    return f"- {symbol}: fiyat ${current_price} | {signals}"
+
+
+def create_batch_prompt(items: List[BatchItem], compact: bool = False) -> str:
+    """
+    Birden çok sembol için tek prompt; yanıt sembol anahtarlı JSON dizisi olmalı
+    """
+    fields = [
+        '"symbol": "SEMBOL"',
+        '"recommendation": "AL/SAT/BEKLE"',
+        '"confidence": 75',
+        '"risk_level": "DÜŞÜK/ORTA/YÜKSEK"',
+        '"reasoning": "Kısa gerekçe"',
+        '"market_context": "Piyasa durumu"'
+    ]
+    if not compact:
+        fields.append('"price_targets": {"short_term": "hedef fiyat", "medium_term": "hedef fiyat", "stop_loss": "stop loss fiyatı"}')
+    lines = "\n".join(format_item(*item) for item in items)
+    schema = "{" + ", ".join(fields) + "}"
+    return (
+        "KRİPTO TRADING ANALİZİ - ÇOKLU SEMBOL\n\n"
+        "TEKNİK ANALİZ SONUÇLARI (scalp, swing, daily sinyali ve güveni):\n"
+        f"{lines}\n\n"
+        "Her sembol için bir nesne içeren JSON dizisi döndür; sembolleri atlama, başka metin ekleme:\n"
+        f"[{schema}, ...]\n"
+    )
+
+
+def plan_batches(items: List[BatchItem], context_window: int, max_output_tokens: int,
+                 output_per_symbol: int, max_batch_size: int, compact: bool = False,
+                 token_budget: Optional[int] = None) -> List[List[BatchItem]]:
+    """
+    Sembolleri sırayla, bağlam penceresi (prompt + beklenen yanıt), yanıt token sınırı,
+    isteğe bağlı toplam token bütçesi ve max_batch_size aşılmayacak şekilde gruplar
+    """
+    overhead = estimate_tokens(create_batch_prompt([], compact))
+    limit = context_window if token_budget is None else min(context_window, token_budget)
+    per_batch_symbols = max(1, min(max_batch_size, max_output_tokens // output_per_symbol))
+    batches: List[List[BatchItem]] = []
+    current: List[BatchItem] = []
+    used = overhead
+    for item in items:
+        cost = estimate_tokens(format_item(*item)) + 1 + output_per_symbol
+        if current and (len(current) >= per_batch_symbols or used + cost > limit):
+            batches.append(current)
+            current, used = [], overhead
+        current.append(item)
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def validate_analysis(analysis: Any) -> bool:
+    if not isinstance(analysis, dict):
+        return False
+    if analysis.get("recommendation") not in VALID_RECOMMENDATIONS:
+        return False
+    if analysis.get("risk_level") not in VALID_RISK_LEVELS:
+        return False
+    confidence = analysis.get("confidence")
+    if isinstance(confidence, bool) or not isinstance(confidence, (int, float)) or not 0 <= confidence <= 100:
+        return False
+    return isinstance(analysis.get("reasoning", ""), str)
+
+
+def parse_batch_response(response: str, symbols: List[str]) -> Tuple[Dict[str, Dict[str, Any]], Set[str]]:
+    """
+    Yanıttaki JSON dizisini sembollere ayır. (geçerli analizler, eksik/bozuk semboller) döndürür.
+    """
+    expected = {symbol.upper(): symbol for symbol in symbols}
+    analyses: Dict[str, Dict[str, Any]] = {}
+    try:
+        start = response.find('[')
+        end = response.rfind(']') + 1
+        entries = json.loads(response[start:end]) if start != -1 and end > start else []
+    except ValueError:
+        entries = []
+    if not isinstance(entries, list):
+        entries = []
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        symbol = expected.get(str(entry.get("symbol", "")).upper())
+        if symbol is None or symbol in analyses:
+            continue
+        analysis = {key: value for key, value in entry.items() if key != "symbol"}
+        if validate_analysis(analysis):
+            analyses[symbol] = analysis
+    return analyses, set(symbols) - set(analyses)
+
+
+def context_limits(model: str, local_mode: bool, context_window: Optional[int] = None,
+                   max_output_tokens: Optional[int] = None) -> Tuple[int, int, int]:
+    """
+    (bağlam penceresi, yanıt token sınırı, sembol başına yanıt tokenı)
+    """
+    mode = "local" if local_mode else "cloud"
+    window = context_window or CONTEXT_WINDOWS.get(model, DEFAULT_CONTEXT_WINDOW[mode])
+    output = min(max_output_tokens or MAX_OUTPUT_TOKENS[mode], window // 2)
+    return window, output, OUTPUT_TOKENS_PER_SYMBOL[mode]
@@ -0,0 +1,110 @@
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, Iterable, Optional, Tuple
+
+# Sağlayıcı başına varsayılan dakikalık istek limiti (None: sınırsız)
+DEFAULT_RATE_LIMITS = {
+    "cloud": 120,
+    "local": None
+}
+
+AnalysisRequest = Tuple[str, Dict[str, Any], float]
+
+
+class ProviderRateLimiter:
+    """
+    İstekleri dakikalık limite göre eşit aralıklara yayar. Zaman dilimi rezervasyonu
+    kilit altında yapıldığından farklı thread'ler ve event loop'lar aynı limiti paylaşabilir.
+    """
+    def __init__(self, requests_per_minute: float):
+        self.interval = 60.0 / requests_per_minute
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Sıradaki dilimi ayır; beklenmesi gereken süreyi döndür
+        """
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+            return slot - now
+
+    def wait(self):
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+
+_limiters: Dict[Tuple[str, float], ProviderRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_provider_limiter(base_url: str, requests_per_minute: Optional[float]) -> Optional[ProviderRateLimiter]:
+    """
+    Aynı uç noktaya giden tüm analyzer'ların paylaştığı limiter
+    """
+    if not requests_per_minute:
+        return None
+    key = (base_url, float(requests_per_minute))
+    with _limiters_lock:
+        if key not in _limiters:
+            _limiters[key] = ProviderRateLimiter(requests_per_minute)
+        return _limiters[key]
+
+
+async def analyze_many(analyzer, requests: Iterable[AnalysisRequest], max_concurrency: int = 4,
+                       deadline: Optional[float] = None) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    """
+    (sembol, strateji sonuçları, fiyat) isteklerini en fazla max_concurrency eşzamanlı
+    çağrıyla analiz et; (sembol, sonuç) çiftlerini tamamlandıkça üret. Sağlayıcı
+    limiti analyzer'ın HTTP çağrılarında uygulanır. Hata veren
+    semboller {"symbol", "error"} döner. deadline (saniye) aşılınca kalan istekler
+    iptal edilir ve zaman aşımı hatasıyla döner. Tüketici döngüden çıkarsa veya görev
+    iptal edilirse bekleyen istekler iptal edilir; sürmekte olan HTTP çağrısı kendi
+    timeout'unda biter, sonucu kullanılmaz.
+    """
+    requests = list(requests)
+    if not requests:
+        return
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max_concurrency)
+    executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="deepseek")
+    end = None if deadline is None else loop.time() + deadline
+
+    async def run(symbol: str, strategies_results: Dict[str, Any], current_price: float):
+        async with semaphore:
+            try:
+                result = await loop.run_in_executor(executor, analyzer.analyze_trading_signals,
+                                                    symbol, strategies_results, current_price)
+            except Exception as e:
+                result = {"symbol": symbol, "error": str(e)}
+            return symbol, result
+
+    tasks = {asyncio.ensure_future(run(*request)): request[0] for request in requests}
+    pending = set(tasks)
+    try:
+        while pending:
+            timeout = None if end is None else max(0.0, end - loop.time())
+            done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                break
+            for task in done:
+                yield task.result()
+        for task in pending:
+            task.cancel()
+            yield tasks[task], {"symbol": tasks[task], "error": f"Süre sınırı aşıldı ({deadline:.1f}s)"}
+    finally:
+        for task in pending:
+            task.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def collect(analyzer, requests: Iterable[AnalysisRequest], **options) -> Dict[str, Dict[str, Any]]:
+    results = {}
+    async for symbol, result in analyze_many(analyzer, requests, **options):
+        results[symbol] = result
+    return results
@@ -0,0 +1,112 @@
+import time
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+
+
+class HealthCheck:
+    """
+    Arka uç sağlık durumunu ttl saniye önbellekte tutar. Süresi dolan sağlıklı durum
+    hemen döndürülür ve yenileme arka planda yapılır; sağlıksız veya hiç ölçülmemiş
+    durumda yoklama senkron çalışır. Başarılı/başarısız gerçek istekler durumu
+    doğrudan günceller, böylece düzenli kullanımda ayrıca yoklama yapılmaz.
+    """
+    def __init__(self, probe: Callable[[], bool], ttl: float = 30.0, failure_ttl: float = 5.0,
+                 clock: Callable[[], float] = time.monotonic, logger: Optional[logging.Logger] = None):
+        self.probe = probe
+        self.ttl = ttl
+        # Başarısız yoklama bu süre boyunca tekrarlanmaz (kapalı sunucuya yüklenmemek için)
+        self.failure_ttl = failure_ttl
+        self.clock = clock
+        self.logger = logger or logging.getLogger(__name__)
+        self._healthy: Optional[bool] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self._probe_lock = threading.Lock()
+        self._refreshing = False
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.probes = 0
+        self.cached = 0
+
+    def _run_probe(self) -> bool:
+        with self._probe_lock:
+            try:
+                healthy = bool(self.probe())
+            except Exception as e:
+                self.logger.warning(f"Sağlık kontrolü hatası: {e}")
+                healthy = False
+            with self._lock:
+                self.probes += 1
+                self._set(healthy)
+            return healthy
+
+    def _set(self, healthy: bool):
+        self._healthy = healthy
+        self._checked_at = self.clock()
+
+    def _refresh_in_background(self):
+        try:
+            self._run_probe()
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def check(self, force: bool = False) -> bool:
+        """
+        Güncel sağlık durumu; force=True her zaman yeniden yoklar
+        """
+        if not force:
+            with self._lock:
+                age = self.clock() - self._checked_at
+                if self._healthy is not None:
+                    if age < (self.ttl if self._healthy else self.failure_ttl):
+                        self.cached += 1
+                        return self._healthy
+                    if self._healthy:
+                        # Bayat ama sağlıklı: hemen dön, arka planda yenile
+                        self.cached += 1
+                        if not self._refreshing:
+                            self._refreshing = True
+                            threading.Thread(target=self._refresh_in_background, daemon=True).start()
+                        return True
+        return self._run_probe()
+
+    def mark_success(self):
+        with self._lock:
+            self._set(True)
+
+    def mark_failure(self):
+        with self._lock:
+            self._set(False)
+
+    def start(self, interval: Optional[float] = None):
+        """
+        Durumu interval (varsayılan ttl) saniyede bir arka planda yenile
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        interval = interval or self.ttl
+        self._stop.clear()
+
+        def loop():
+            while not self._stop.wait(interval):
+                self._run_probe()
+
+        self._thread = threading.Thread(target=loop, name="health-check", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "healthy": self._healthy,
+                "age": self.clock() - self._checked_at if self._healthy is not None else None,
+                "probes": self.probes,
+                "cached": self.cached
+            }
@@ -0,0 +1,171 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class ResponseCache:
+    """
+    İçerik adresli LLM yanıt önbelleği. Anahtar, model ve prompt'un (nicemlenmiş
+    girdilerle kurulmuş) özetidir. Kayıtlar ttl saniye geçerlidir; bellekte LRU
+    ile max_entries kayıt tutulur, cache_dir verilirse yeniden başlatmalar arasında
+    diskte saklanır. Diskte de en fazla max_entries dosya kalır (en eski mtime önce
+    silinir); süresi dolmuş dosyalar açılışta temizlenir.
+    """
+    def __init__(self, max_entries: int = 256, ttl: float = 900.0, cache_dir: Optional[str] = "cache/deepseek",
+                 clock: Callable[[], float] = time.time):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.cache_dir = cache_dir
+        self.clock = clock
+        self._entries: 'OrderedDict[str, Tuple[float, Any]]' = OrderedDict()
+        # Diskteki dosyalar: anahtar -> mtime (eskiden yeniye)
+        self._disk: 'OrderedDict[str, float]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evicted = 0
+        if cache_dir:
+            self._sweep()
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        payload = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def _sweep(self):
+        """
+        Açılışta disk dizinini tara: süresi dolmuş ve yarım kalmış dosyaları sil, kalanları indeksle
+        """
+        if not os.path.isdir(self.cache_dir):
+            return
+        files = []
+        for root, _, names in os.walk(self.cache_dir):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    if name.endswith(".tmp"):
+                        os.remove(path)
+                    elif name.endswith(".json"):
+                        mtime = os.path.getmtime(path)
+                        if self._fresh(mtime):
+                            files.append((mtime, name[:-5]))
+                        else:
+                            os.remove(path)
+                            self.expired += 1
+                except OSError:
+                    continue
+        for mtime, key in sorted(files):
+            self._disk[key] = mtime
+        self._evict_disk()
+
+    def _evict_disk(self):
+        while len(self._disk) > self.max_entries:
+            key, _ = self._disk.popitem(last=False)
+            self.evicted += 1
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    def _fresh(self, created: float) -> bool:
+        return self.clock() - created < self.ttl
+
+    def get(self, key: str) -> Optional[Any]:
+        expired = False
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if self._fresh(entry[0]):
+                    self.hits += 1
+                    self._entries.move_to_end(key)
+                    return entry[1]
+                expired = True
+                del self._entries[key]
+
+        entry, disk_expired = self._load(key)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                self.expired += int(expired or disk_expired)
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._remember(key, entry)
+            return entry[1]
+
+    def put(self, key: str, value: Any):
+        entry = (self.clock(), value)
+        with self._lock:
+            self._remember(key, entry)
+        if self.cache_dir:
+            path = self._path(key)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path + ".tmp", 'w', encoding='utf-8') as f:
+                json.dump({"created": entry[0], "value": value}, f, ensure_ascii=False)
+            os.replace(path + ".tmp", path)
+            # mtime = oluşturma zamanı; açılış taraması ve eviction dosyayı okumadan karar verir
+            os.utime(path, (entry[0], entry[0]))
+            with self._lock:
+                self._disk[key] = entry[0]
+                self._disk.move_to_end(key)
+                self._evict_disk()
+
+    def _remember(self, key: str, entry: Tuple[float, Any]):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _load(self, key: str) -> Tuple[Optional[Tuple[float, Any]], bool]:
+        # (kayıt veya None, diskteki kaydın süresi dolmuş muydu)
+        if not self.cache_dir:
+            return None, False
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return None, False
+        if not self._fresh(stored["created"]):
+            with self._lock:
+                self._disk.pop(key, None)
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None, True
+        return (stored["created"], stored["value"]), False
+
+    def clear(self, disk: bool = False):
+        with self._lock:
+            self._entries.clear()
+            if disk:
+                self._disk.clear()
+        if disk and self.cache_dir and os.path.isdir(self.cache_dir):
+            for root, _, files in os.walk(self.cache_dir):
+                for name in files:
+                    if name.endswith(".json"):
+                        os.remove(os.path.join(root, name))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "expired": self.expired,
+                "evicted": self.evicted,
+                "entries": len(self._entries),
+                "disk_entries": len(self._disk),
+                "hit_rate": self.hits / total if total else 0.0
+            }
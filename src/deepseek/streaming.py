@@ -0,0 +1,101 @@
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Panelde erken gösterilen karar alanları
+VERDICT_FIELDS = ("recommendation", "confidence", "risk_level")
+
+
+def iter_sse_content(lines: Iterable[str]) -> Iterator[str]:
+    """
+    OpenAI uyumlu SSE akışındaki ("data: {...}" satırları) içerik parçalarını üret
+    """
+    for line in lines:
+        if not line:
+            continue
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        if not line.startswith("data:"):
+            continue
+        payload = line[5:].strip()
+        if payload == "[DONE]":
+            return
+        try:
+            chunk = json.loads(payload)
+        except ValueError:
+            continue
+        for choice in chunk.get("choices", []):
+            content = (choice.get("delta") or {}).get("content")
+            if content:
+                yield content
+
+
+class IncrementalJSONFields:
+    """
+    Parça parça gelen metindeki ilk JSON nesnesinin üst düzey alanlarını, değerleri
+    tamamlandıkça çıkarır. Metin yalnızca bir kez taranır; nesneden önceki metin
+    (ör. ```json) atlanır.
+    """
+    def __init__(self):
+        self.buffer = ""
+        self.fields: Dict[str, Any] = {}
+        self.done = False
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._key: Optional[str] = None
+        self._value_start: Optional[int] = None
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        Yeni parçayı ekle; bu parçayla tamamlanan (alan, değer) çiftlerini döndür
+        """
+        self.buffer += chunk
+        completed = []
+        buffer = self.buffer
+        while self._pos < len(buffer) and not self.done:
+            char = buffer[self._pos]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1 and self._value_start is None:
+                        # Üst düzeyde değer beklenmiyorsa kapanan metin bir anahtardır
+                        self._key = json.loads(buffer[self._string_start:self._pos + 1])
+            elif char == '"':
+                if self._depth >= 1:
+                    self._in_string = True
+                    self._string_start = self._pos
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]" and self._depth > 0:
+                if self._depth == 1:
+                    self._complete(completed)
+                    self.done = True
+                self._depth -= 1
+            elif self._depth == 1:
+                if char == ":" and self._key is not None:
+                    self._value_start = self._pos + 1
+                elif char == ",":
+                    self._complete(completed)
+            self._pos += 1
+        return completed
+
+    def _complete(self, completed: List[Tuple[str, Any]]):
+        if self._key is not None and self._value_start is not None:
+            raw = self.buffer[self._value_start:self._pos].strip()
+            try:
+                value = json.loads(raw)
+            except ValueError:
+                value = raw
+            self.fields[self._key] = value
+            completed.append((self._key, value))
+        self._key = None
+        self._value_start = None
+
+    def has(self, names: Iterable[str]) -> bool:
+        return all(name in self.fields for name in names)
@@ -5,6 +5,7 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 from deepseek.analyzer import DeepSeekAnalyzer
 from strategies.strategy_manager import StrategyManager
+from strategies.signal_scheduler import SignalScheduler
 from data.data_fetcher import DataFetcher
 
 class PortfolioManager:
@@ -13,8 +14,15 @@ class PortfolioManager:
         self.api_key = api_key
         self.deepseek_analyzer = None
         self.strategy_manager = StrategyManager()
+        # Aynı mum içindeki tekrar analizlerde stratejiler yeniden çalışmaz
+        self.signal_scheduler = SignalScheduler(self.strategy_manager, logger=self.logger)
         self.data_fetcher = DataFetcher()
         self.portfolio = {}
+        # Eşzamanlı DeepSeek çağrısı sayısı ve toplam süre sınırı (saniye)
+        self.analysis_concurrency = 4
+        self.analysis_deadline = 120.0
+        # True: semboller tek prompt'ta gruplanır (daha az istek ve token)
+        self.batch_analysis = True
         
         # API key varsa analyzer'ı başlat
         if self.api_key or os.environ.get("DEEPSEEK_API_KEY"):
@@ -59,41 +67,49 @@ class PortfolioManager:
         
         results = {}
         
+        # Tüm sembollerin güncel verilerini tek seferde, eşzamanlı al
+        market_data = self.data_fetcher.get_multiple_symbols_data(list(self.portfolio.keys()), "1h", 200)
+        strategy_batch = self.signal_scheduler.update_many(market_data, "1h")
+        
+        requests = []
         for symbol in self.portfolio.keys():
             try:
-                # Güncel verileri al
-                current_data = self.data_fetcher.get_historical_data(symbol, "1h", 200)
-                if current_data.empty:
+                current_data = market_data.get(symbol)
+                if current_data is None or current_data.empty:
                     continue
                 
                 current_price = current_data['close'].iloc[-1]
                 
                 # Strateji analizi
-                strategies_results = self.strategy_manager.analyze_symbol(symbol, current_data)
+                strategies_results = strategy_batch["results"].get(symbol)
+                if strategies_results is None:
+                    raise ValueError(strategy_batch["errors"].get(symbol, "Strateji analizi yok"))
                 
                 # Portföy verilerini güncelle
                 self.portfolio[symbol]['current_price'] = current_price
                 avg_price = self.portfolio[symbol]['average_buy_price']
                 self.portfolio[symbol]['pnl_percentage'] = ((current_price - avg_price) / avg_price) * 100
                 
-                # DeepSeek analizi
-                portfolio_data = {
-                    'average_buy_price': avg_price,
-                    'current_position': self.portfolio[symbol]['position_size'],
-                    'pnl_percentage': self.portfolio[symbol]['pnl_percentage']
-                }
-                
-                analysis = self.deepseek_analyzer.analyze_trading_signals(
-                    symbol, strategies_results, current_price
-                )
-                
-                self.portfolio[symbol]['analysis'] = analysis
-                results[symbol] = analysis
+                requests.append((symbol, strategies_results, current_price))
                 
             except Exception as e:
                 self.logger.error(f"Portföy analiz hatası ({symbol}): {e}")
                 results[symbol] = {"error": str(e)}
         
+        if self.batch_analysis:
+            # Gruplar halinde tek prompt; eksik kalan semboller tek tek denenir
+            analyses = self.deepseek_analyzer.analyze_batch(requests, max_concurrency=self.analysis_concurrency)
+        else:
+            # DeepSeek analizleri sınırlı eşzamanlılıkla; toplam süre en yavaş birkaç çağrı kadar
+            analyses = self.deepseek_analyzer.analyze_many_sync(
+                requests, max_concurrency=self.analysis_concurrency, deadline=self.analysis_deadline
+            )
+        for symbol, analysis in analyses.items():
+            if "error" in analysis:
+                self.logger.error(f"Portföy analiz hatası ({symbol}): {analysis['error']}")
+            self.portfolio[symbol]['analysis'] = analysis
+            results[symbol] = analysis
+        
         return results
     
     def get_portfolio_summary(self) -> Dict[str, Any]:
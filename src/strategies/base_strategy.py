@@ -1,15 +1,84 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+import numpy as np
 import pandas as pd
+from analysis.indicator_graph import get_plan, parse_spec, spec_name
+
+# Vektörel sinyal serisindeki kodlama
+SIGNAL_CODES = {"BUY": 1, "SELL": -1, "HOLD": 0}
 
 class BaseStrategy(ABC):
-    def __init__(self, name: str):
+    # Ayarlanabilir eşikler/periyotlar ve varsayılanları; alt sınıflar tanımlar
+    DEFAULT_PARAMS: Dict[str, Any] = {}
+    # Stratejinin okuduğu gösterge tanımları (ör. 'rsi(14)', 'bb(20,2)')
+    indicators: List[str] = []
+    required_periods = 0
+    
+    def __init__(self, name: str, **params):
         self.name = name
+        unknown = sorted(set(params) - set(self.DEFAULT_PARAMS))
+        if unknown:
+            raise ValueError(f"{name} için bilinmeyen parametre: {', '.join(unknown)}")
+        self.params: Dict[str, Any] = {**self.DEFAULT_PARAMS, **params}
+        # Rol → plan kolon adı (ör. 'rsi' → 'rsi(10)'); parametrelerden türetilir
+        self.columns = {role: spec_name(parse_spec(spec)) for role, spec in self.indicator_specs().items()}
+        self.indicators = list(dict.fromkeys(self.columns.values()))
+    
+    def indicator_specs(self) -> Dict[str, str]:
+        """
+        Parametrelere göre rol → gösterge tanımı
+        """
+        return {}
+    
+    def _indicator(self, values: pd.DataFrame, role: str, field: Optional[str] = None) -> pd.Series:
+        column = self.columns[role]
+        return values[f"{column}.{field}" if field else column]
+    
+    def compute_indicators(self, data: pd.DataFrame, indicators: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """
+        Ortak plandan gelen sonuçları kullan; verilmediyse stratejinin kendi planını çalıştır
+        """
+        if indicators is not None:
+            return indicators
+        return get_plan(self.indicators).evaluate(data)
+    
+    @abstractmethod
+    def generate_signal(self, data: pd.DataFrame, indicators: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
+        pass
     
     @abstractmethod
-    def generate_signal(self, data: pd.DataFrame) -> Dict[str, Any]:
+    def signal_series(self, data: pd.DataFrame, indicators: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """
+        generate_signal kurallarının tüm geçmiş için vektörel karşılığı: her bar için
+        o bara kadarki veriyle üretilecek sinyal (1 BUY, -1 SELL, 0 HOLD) ve güven
+        """
         pass
     
     @abstractmethod
     def get_parameters(self) -> Dict[str, Any]:
-        pass
\ No newline at end of file
+        pass
+    
+    @staticmethod
+    def _new_votes(length: int) -> Dict[str, np.ndarray]:
+        return {"buy": np.zeros(length, dtype=np.int64), "sell": np.zeros(length, dtype=np.int64),
+                "confidence": np.zeros(length)}
+    
+    @staticmethod
+    def _vote(votes: Dict[str, np.ndarray], buy: np.ndarray, sell: np.ndarray, weight: float):
+        # if buy: ... elif sell: ... yapısının vektörel karşılığı; NaN karşılaştırmaları False
+        sell = sell & ~buy
+        votes["buy"] += buy
+        votes["sell"] += sell
+        votes["confidence"] += np.where(buy | sell, weight, 0.0)
+    
+    def _signal_frame(self, data: pd.DataFrame, signal: np.ndarray, confidence: np.ndarray,
+                      hold_factor: Optional[float] = None) -> pd.DataFrame:
+        if hold_factor is not None:
+            confidence = np.where(signal == 0, confidence * hold_factor, confidence)
+        confidence = np.minimum(confidence, 1.0)
+        # generate_signal yetersiz veride güveni 0 olan HOLD döner
+        warmup = min(max(self.required_periods - 1, 0), len(data))
+        signal = signal.astype(np.int8)
+        signal[:warmup] = 0
+        confidence[:warmup] = 0.0
+        return pd.DataFrame({"signal": signal, "confidence": confidence}, index=data.index)
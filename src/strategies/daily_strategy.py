@@ -1,23 +1,42 @@
+import numpy as np
 import pandas as pd
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from .base_strategy import BaseStrategy
-from analysis.technical_analyzer import TechnicalAnalyzer
 
 class DailyStrategy(BaseStrategy):
-    def __init__(self):
-        super().__init__("Daily Trading")
-        self.analyzer = TechnicalAnalyzer()
+    DEFAULT_PARAMS = {
+        'rsi_period': 21, 'rsi_overbought': 65, 'rsi_oversold': 35,
+        'macd_fast': 12, 'macd_slow': 26, 'macd_signal': 9,
+        'fast_ma': 50, 'slow_ma': 200,
+        'stoch_k': 14, 'stoch_d': 3, 'stoch_oversold': 20, 'stoch_overbought': 80,
+        'volume_period': 20, 'volume_multiplier': 1.5,
+        'min_votes': 3
+    }
+    
+    def __init__(self, **params):
+        super().__init__("Daily Trading", **params)
         self.required_periods = 100
     
-    def generate_signal(self, data: pd.DataFrame) -> Dict[str, Any]:
+    def indicator_specs(self) -> Dict[str, str]:
+        p = self.params
+        return {
+            'rsi': f"rsi({p['rsi_period']})",
+            'macd': f"macd({p['macd_fast']},{p['macd_slow']},{p['macd_signal']})",
+            'fast_ma': f"sma({p['fast_ma']})",
+            'slow_ma': f"sma({p['slow_ma']})",
+            'stoch': f"stoch({p['stoch_k']},{p['stoch_d']})"
+        }
+    
+    def generate_signal(self, data: pd.DataFrame, indicators: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
         if len(data) < self.required_periods:
             return {"signal": "HOLD", "confidence": 0, "message": "Yetersiz veri"}
         
         # Günlük trading için uzun vadeli göstergeler
-        rsi = self.analyzer.calculate_rsi(data, period=21)
-        macd, macd_signal, histogram = self.analyzer.calculate_macd(data, fast=12, slow=26, signal=9)
-        ma_dict = self.analyzer.calculate_moving_averages(data, [50, 200])
-        k, d = self.analyzer.calculate_stochastic(data)
+        values = self.compute_indicators(data, indicators)
+        p = self.params
+        rsi = self._indicator(values, 'rsi')
+        macd, macd_signal = self._indicator(values, 'macd', 'macd'), self._indicator(values, 'macd', 'signal')
+        k, d = self._indicator(values, 'stoch', 'k'), self._indicator(values, 'stoch', 'd')
         
         signals = []
         confidence = 0
@@ -25,10 +44,10 @@ class DailyStrategy(BaseStrategy):
         # RSI sinyali
         if not rsi.empty:
             last_rsi = rsi.iloc[-1]
-            if last_rsi > 65:
+            if last_rsi > p['rsi_overbought']:
                 signals.append("SELL")
                 confidence += 0.15
-            elif last_rsi < 35:
+            elif last_rsi < p['rsi_oversold']:
                 signals.append("BUY")
                 confidence += 0.15
         
@@ -42,10 +61,10 @@ class DailyStrategy(BaseStrategy):
                 confidence += 0.25
         
         # Moving Average sinyali
-        if 'sma_50' in ma_dict and 'sma_200' in ma_dict:
-            sma_50 = ma_dict['sma_50'].iloc[-1]
-            sma_200 = ma_dict['sma_200'].iloc[-1]
-            if sma_50 > sma_200:
+        if self.columns['fast_ma'] in values and self.columns['slow_ma'] in values:
+            fast_ma = self._indicator(values, 'fast_ma').iloc[-1]
+            slow_ma = self._indicator(values, 'slow_ma').iloc[-1]
+            if fast_ma > slow_ma:
                 signals.append("BUY")
                 confidence += 0.3
             else:
@@ -54,19 +73,20 @@ class DailyStrategy(BaseStrategy):
         
         # Stochastic sinyali
         if not k.empty and not d.empty:
-            if k.iloc[-1] < 20 and d.iloc[-1] < 20 and k.iloc[-1] > d.iloc[-1]:
+            low, high = p['stoch_oversold'], p['stoch_overbought']
+            if k.iloc[-1] < low and d.iloc[-1] < low and k.iloc[-1] > d.iloc[-1]:
                 signals.append("BUY")
                 confidence += 0.15
-            elif k.iloc[-1] > 80 and d.iloc[-1] > 80 and k.iloc[-1] < d.iloc[-1]:
+            elif k.iloc[-1] > high and d.iloc[-1] > high and k.iloc[-1] < d.iloc[-1]:
                 signals.append("SELL")
                 confidence += 0.15
         
         # Volume analizi
-        volume_avg = data['volume'].rolling(20).mean()
+        volume_avg = data['volume'].rolling(p['volume_period']).mean()
         if not volume_avg.empty:
             last_volume = data['volume'].iloc[-1]
             avg_volume = volume_avg.iloc[-1]
-            if last_volume > avg_volume * 1.5 and data['close'].iloc[-1] > data['close'].iloc[-2]:
+            if last_volume > avg_volume * p['volume_multiplier'] and data['close'].iloc[-1] > data['close'].iloc[-2]:
                 signals.append("BUY")
                 confidence += 0.15
         
@@ -74,9 +94,9 @@ class DailyStrategy(BaseStrategy):
         buy_count = signals.count("BUY")
         sell_count = signals.count("SELL")
         
-        if buy_count >= 3:
+        if buy_count >= p['min_votes']:
             final_signal = "BUY"
-        elif sell_count >= 3:
+        elif sell_count >= p['min_votes']:
             final_signal = "SELL"
         else:
             final_signal = "HOLD"
@@ -88,18 +108,52 @@ class DailyStrategy(BaseStrategy):
             "indicators": {
                 "rsi": rsi.iloc[-1] if not rsi.empty else None,
                 "macd": macd.iloc[-1] if not macd.empty else None,
-                "sma_50": ma_dict.get('sma_50', pd.Series()).iloc[-1] if 'sma_50' in ma_dict else None,
-                "sma_200": ma_dict.get('sma_200', pd.Series()).iloc[-1] if 'sma_200' in ma_dict else None,
+                "sma_50": self._indicator(values, 'fast_ma').iloc[-1],
+                "sma_200": self._indicator(values, 'slow_ma').iloc[-1],
                 "stochastic_k": k.iloc[-1] if not k.empty else None,
                 "stochastic_d": d.iloc[-1] if not d.empty else None
             },
             "message": f"Günlük sinyal: {final_signal} (Güven: %{confidence*100:.1f})"
         }
     
+    def signal_series(self, data: pd.DataFrame, indicators: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        values = self.compute_indicators(data, indicators)
+        p = self.params
+        rsi = self._indicator(values, 'rsi').to_numpy()
+        macd = self._indicator(values, 'macd', 'macd').to_numpy()
+        macd_signal = self._indicator(values, 'macd', 'signal').to_numpy()
+        fast_ma = self._indicator(values, 'fast_ma').to_numpy()
+        slow_ma = self._indicator(values, 'slow_ma').to_numpy()
+        k, d = self._indicator(values, 'stoch', 'k').to_numpy(), self._indicator(values, 'stoch', 'd').to_numpy()
+        close = data['close'].to_numpy()
+        volume = data['volume'].to_numpy()
+        volume_avg = data['volume'].rolling(p['volume_period']).mean().to_numpy()
+        
+        # Bir önceki barın değerleri (kesişim ve kapanış karşılaştırması için)
+        prev_macd, prev_signal, prev_close = (np.concatenate(([np.nan], series[:-1]))
+                                              for series in (macd, macd_signal, close))
+        
+        votes = self._new_votes(len(data))
+        self._vote(votes, rsi < p['rsi_oversold'], rsi > p['rsi_overbought'], 0.15)
+        self._vote(votes, (macd > macd_signal) & (prev_macd <= prev_signal),
+                   (macd < macd_signal) & (prev_macd >= prev_signal), 0.25)
+        self._vote(votes, fast_ma > slow_ma, ~(fast_ma > slow_ma), 0.3)
+        low, high = p['stoch_oversold'], p['stoch_overbought']
+        self._vote(votes, (k < low) & (d < low) & (k > d), (k > high) & (d > high) & (k < d), 0.15)
+        self._vote(votes, (volume > volume_avg * p['volume_multiplier']) & (close > prev_close),
+                   np.zeros(len(data), dtype=bool), 0.15)
+        
+        buy, sell = votes["buy"], votes["sell"]
+        signal = np.where(buy >= p['min_votes'], 1, np.where(sell >= p['min_votes'], -1, 0))
+        return self._signal_frame(data, signal, votes["confidence"], hold_factor=0.3)
+    
     def get_parameters(self) -> Dict[str, Any]:
+        p = self.params
         return {
             "timeframe": "4h-1d",
             "hold_time": "haftalar-aylar",
             "risk_level": "düşük",
-            "indicators": ["RSI(21)", "MACD(12,26,9)", "MA(50,200)", "Stochastic(14,3)"]
+            "indicators": [f"RSI({p['rsi_period']})", f"MACD({p['macd_fast']},{p['macd_slow']},{p['macd_signal']})",
+                           f"MA({p['fast_ma']},{p['slow_ma']})", f"Stochastic({p['stoch_k']},{p['stoch_d']})"],
+            "params": dict(p)
         }
\ No newline at end of file
@@ -1,22 +1,37 @@
+import numpy as np
 import pandas as pd
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from .base_strategy import BaseStrategy
-from analysis.technical_analyzer import TechnicalAnalyzer
 
 class ScalpStrategy(BaseStrategy):
-    def __init__(self):
-        super().__init__("Scalp Trading")
-        self.analyzer = TechnicalAnalyzer()
+    DEFAULT_PARAMS = {
+        'rsi_period': 10, 'rsi_overbought': 80, 'rsi_oversold': 20,
+        'macd_fast': 6, 'macd_slow': 13, 'macd_signal': 5,
+        'fast_ma': 5, 'slow_ma': 10
+    }
+    
+    def __init__(self, **params):
+        super().__init__("Scalp Trading", **params)
         self.required_periods = 20
     
-    def generate_signal(self, data: pd.DataFrame) -> Dict[str, Any]:
+    def indicator_specs(self) -> Dict[str, str]:
+        p = self.params
+        return {
+            'rsi': f"rsi({p['rsi_period']})",
+            'macd': f"macd({p['macd_fast']},{p['macd_slow']},{p['macd_signal']})",
+            'fast_ma': f"sma({p['fast_ma']})",
+            'slow_ma': f"sma({p['slow_ma']})"
+        }
+    
+    def generate_signal(self, data: pd.DataFrame, indicators: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
         if len(data) < self.required_periods:
             return {"signal": "HOLD", "confidence": 0, "message": "Yetersiz veri"}
         
         # Scalp için kısa vadeli göstergeler
-        rsi = self.analyzer.calculate_rsi(data, period=10)
-        macd, macd_signal, _ = self.analyzer.calculate_macd(data, fast=6, slow=13, signal=5)
-        ma_dict = self.analyzer.calculate_moving_averages(data, [5, 10])
+        values = self.compute_indicators(data, indicators)
+        p = self.params
+        rsi = self._indicator(values, 'rsi')
+        macd, macd_signal = self._indicator(values, 'macd', 'macd'), self._indicator(values, 'macd', 'signal')
         
         signals = []
         confidence = 0
@@ -24,10 +39,10 @@ class ScalpStrategy(BaseStrategy):
         # RSI sinyali
         if not rsi.empty:
             last_rsi = rsi.iloc[-1]
-            if last_rsi > 80:
+            if last_rsi > p['rsi_overbought']:
                 signals.append("SELL")
                 confidence += 0.3
-            elif last_rsi < 20:
+            elif last_rsi < p['rsi_oversold']:
                 signals.append("BUY")
                 confidence += 0.3
         
@@ -41,10 +56,10 @@ class ScalpStrategy(BaseStrategy):
                 confidence += 0.3
         
         # Moving Average sinyali
-        if 'sma_5' in ma_dict and 'sma_10' in ma_dict:
-            sma_5 = ma_dict['sma_5'].iloc[-1]
-            sma_10 = ma_dict['sma_10'].iloc[-1]
-            if sma_5 > sma_10:
+        if self.columns['fast_ma'] in values and self.columns['slow_ma'] in values:
+            fast_ma = self._indicator(values, 'fast_ma').iloc[-1]
+            slow_ma = self._indicator(values, 'slow_ma').iloc[-1]
+            if fast_ma > slow_ma:
                 signals.append("BUY")
                 confidence += 0.4
             else:
@@ -73,10 +88,31 @@ class ScalpStrategy(BaseStrategy):
             "message": f"Scalp sinyali: {final_signal} (Güven: %{confidence*100:.1f})"
         }
     
+    def signal_series(self, data: pd.DataFrame, indicators: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        values = self.compute_indicators(data, indicators)
+        p = self.params
+        rsi = self._indicator(values, 'rsi').to_numpy()
+        macd = self._indicator(values, 'macd', 'macd').to_numpy()
+        macd_signal = self._indicator(values, 'macd', 'signal').to_numpy()
+        fast_ma = self._indicator(values, 'fast_ma').to_numpy()
+        slow_ma = self._indicator(values, 'slow_ma').to_numpy()
+        
+        votes = self._new_votes(len(data))
+        self._vote(votes, rsi < p['rsi_oversold'], rsi > p['rsi_overbought'], 0.3)
+        self._vote(votes, macd > macd_signal, ~(macd > macd_signal), 0.3)
+        self._vote(votes, fast_ma > slow_ma, ~(fast_ma > slow_ma), 0.4)
+        
+        buy, sell = votes["buy"], votes["sell"]
+        signal = np.where(buy > sell, 1, np.where(sell > buy, -1, 0))
+        return self._signal_frame(data, signal, votes["confidence"])
+    
     def get_parameters(self) -> Dict[str, Any]:
+        p = self.params
         return {
             "timeframe": "1m-5m",
             "hold_time": "dakikalar",
             "risk_level": "yüksek",
-            "indicators": ["RSI(10)", "MACD(6,13,5)", "MA(5,10)"]
+            "indicators": [f"RSI({p['rsi_period']})", f"MACD({p['macd_fast']},{p['macd_slow']},{p['macd_signal']})",
+                           f"MA({p['fast_ma']},{p['slow_ma']})"],
+            "params": dict(p)
         }
\ No newline at end of file
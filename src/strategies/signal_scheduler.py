@@ -0,0 +1,247 @@
+import time
+import queue
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+import pandas as pd
+from data.resampler import timeframe_to_ms
+from .strategy_manager import StrategyManager
+
+Subscriber = Union[Callable[[Dict[str, Any]], None], queue.Queue]
+
+
+class _SymbolState:
+    def __init__(self):
+        # Son değerlendirilen kapanmış barın açılış zamanı (ms)
+        self.last_closed: Optional[int] = None
+        # Strateji → son bar içi değerlendirme zamanı ve o andaki oluşan bar
+        self.last_intrabar: Dict[str, Tuple[float, Tuple]] = {}
+        self.signals: Dict[str, Dict[str, Any]] = {}
+
+
+class SignalScheduler:
+    """
+    StrategyManager için olay tabanlı yeniden değerlendirme. Her sembol/zaman dilimi
+    için son değerlendirilen kapanmış bar tutulur; stratejiler yalnızca yeni bir bar
+    kapandığında (kapanmış barlar üzerinde) çalışır. intrabar_intervals ile bazı
+    stratejiler (ör. {'scalp': 5.0}) oluşan bar değiştikçe en fazla o kadar saniyede
+    bir yeniden değerlendirilir. Aradaki çağrılar önbellekteki sinyalleri döndürür.
+    Sinyal etiketi değiştiğinde olay abonelere (callback veya queue) yayınlanır.
+    """
+    def __init__(self, strategy_manager: Optional[StrategyManager] = None,
+                 intrabar_intervals: Optional[Dict[str, float]] = None,
+                 clock: Callable[[], float] = time.time, logger: Optional[logging.Logger] = None):
+        self.strategy_manager = strategy_manager or StrategyManager()
+        self.intrabar_intervals = dict(intrabar_intervals or {})
+        unknown = sorted(set(self.intrabar_intervals) - set(self.strategy_manager.strategies))
+        if unknown:
+            raise ValueError(f"Bilinmeyen strateji: {', '.join(unknown)}")
+        self.clock = clock
+        self.logger = logger or logging.getLogger(__name__)
+        self._states: Dict[Tuple[str, str], _SymbolState] = {}
+        self._subscribers: List[Subscriber] = []
+        self._lock = threading.Lock()
+        self.evaluations = 0
+        self.intrabar_evaluations = 0
+        self.skipped = 0
+
+    # --- Abonelik ---
+
+    def subscribe(self, callback: Callable[[Dict[str, Any]], None]) -> Callable[[Dict[str, Any]], None]:
+        """
+        Sinyal değişimlerinde çağrılacak fonksiyonu kaydet
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+        return callback
+
+    def subscribe_queue(self, maxsize: int = 0) -> queue.Queue:
+        """
+        Sinyal değişimlerinin yazılacağı yeni bir kuyruk döndür
+        """
+        events = queue.Queue(maxsize=maxsize)
+        with self._lock:
+            self._subscribers.append(events)
+        return events
+
+    def unsubscribe(self, subscriber: Subscriber):
+        with self._lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+
+    def _publish(self, events: List[Dict[str, Any]]):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for event in events:
+            for subscriber in subscribers:
+                if isinstance(subscriber, queue.Queue):
+                    try:
+                        subscriber.put_nowait(event)
+                    except queue.Full:
+                        self.logger.warning(f"Sinyal kuyruğu dolu, olay atlandı: {event['symbol']} {event['strategy']}")
+                    continue
+                try:
+                    subscriber(event)
+                except Exception as e:
+                    self.logger.error(f"Sinyal abonesi hatası: {e}")
+
+    # --- Değerlendirme ---
+
+    def _state(self, symbol: str, timeframe: str) -> _SymbolState:
+        with self._lock:
+            return self._states.setdefault((symbol, timeframe), _SymbolState())
+
+    def _plan(self, state: _SymbolState, data: pd.DataFrame, timeframe: str,
+              now: float) -> Tuple[Optional[int], List[str], int]:
+        """
+        (değerlendirilecek kapanmış bar sayısı veya None, bar içi değerlendirilecek stratejiler, son kapanmış bar).
+        Kontrol ve işaretleme kilit altında yapılır; aynı kapanmış bar (veya bar içi
+        aralık) iki çağıran tarafından birden değerlendirilmez.
+        """
+        if data is None or data.empty:
+            return None, [], None
+        timeframe_ms = timeframe_to_ms(timeframe)
+        last_open = pd.Timestamp(data.index[-1]).value // 1_000_000
+        forming = last_open + timeframe_ms > now * 1000
+        closed_count = len(data) - 1 if forming else len(data)
+        last_closed = pd.Timestamp(data.index[closed_count - 1]).value // 1_000_000 if closed_count else None
+
+        bar = tuple(data.iloc[-1]) if forming else None
+
+        with self._lock:
+            if last_closed is not None and (state.last_closed is None or last_closed > state.last_closed):
+                state.last_closed = last_closed
+                # Yeni bar: bar içi stratejiler bir sonraki oluşan barda hemen değerlendirilebilir
+                state.last_intrabar.clear()
+                return closed_count, [], last_closed
+
+            intrabar = []
+            if forming:
+                for name, interval in self.intrabar_intervals.items():
+                    previous = state.last_intrabar.get(name)
+                    if previous is None or (now - previous[0] >= interval and previous[1] != bar):
+                        state.last_intrabar[name] = (now, bar)
+                        intrabar.append(name)
+            return None, intrabar, last_closed
+
+    def _release(self, state: _SymbolState, last_closed: Optional[int], previous: Optional[int]):
+        # Değerlendirme başarısız: kapanmış bar sonraki çağrıda yeniden denenebilsin
+        with self._lock:
+            if state.last_closed == last_closed:
+                state.last_closed = previous
+
+    def on_data(self, symbol: str, timeframe: str, data: pd.DataFrame,
+                now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Yeni veri geldiğinde çağrılır; gerekiyorsa stratejileri çalıştırır ve güncel sinyalleri döndürür
+        """
+        now = self.clock() if now is None else now
+        state = self._state(symbol, timeframe)
+        previous = state.last_closed
+        closed_count, intrabar, last_closed = self._plan(state, data, timeframe, now)
+        if closed_count is not None:
+            try:
+                results = self.strategy_manager.analyze_symbol(symbol, data.iloc[:closed_count])
+            except Exception:
+                self._release(state, last_closed, previous)
+                raise
+            self._apply(symbol, timeframe, state, results, last_closed, intrabar=False)
+        elif intrabar:
+            results = self.strategy_manager.analyze_symbol(symbol, data, intrabar)
+            self._apply(symbol, timeframe, state, results, last_closed, intrabar=True)
+        else:
+            with self._lock:
+                self.skipped += 1
+        return self.signals(symbol, timeframe)
+
+    def update_many(self, frames: Dict[str, pd.DataFrame], timeframe: str,
+                    now: Optional[float] = None, **batch_options) -> Dict[str, Any]:
+        """
+        Çok sembollü güncelleme: barı kapanan semboller tek analyze_symbols çağrısında
+        değerlendirilir. {"results": sembol → sinyaller, "errors", "evaluated"} döndürür.
+        """
+        now = self.clock() if now is None else now
+        due, intrabar_due, errors = {}, {}, {}
+        for symbol, data in frames.items():
+            if data is None or data.empty:
+                errors[symbol] = "Veri yok"
+                continue
+            state = self._state(symbol, timeframe)
+            previous = state.last_closed
+            closed_count, intrabar, last_closed = self._plan(state, data, timeframe, now)
+            if closed_count is not None:
+                due[symbol] = (data, closed_count, last_closed, previous)
+            elif intrabar:
+                intrabar_due[symbol] = (data, intrabar, last_closed)
+            else:
+                with self._lock:
+                    self.skipped += 1
+
+        if due:
+            try:
+                batch = self.strategy_manager.analyze_symbols(
+                    {symbol: data.iloc[:count] for symbol, (data, count, _, _) in due.items()}, **batch_options)
+            except Exception:
+                for symbol, (_, _, last_closed, previous) in due.items():
+                    self._release(self._state(symbol, timeframe), last_closed, previous)
+                raise
+            errors.update(batch["errors"])
+            for symbol in batch["errors"]:
+                if symbol in due:
+                    _, _, last_closed, previous = due[symbol]
+                    self._release(self._state(symbol, timeframe), last_closed, previous)
+            for symbol, results in batch["results"].items():
+                data, _, last_closed, _ = due[symbol]
+                self._apply(symbol, timeframe, self._state(symbol, timeframe), results, last_closed, intrabar=False)
+        for symbol, (data, names, last_closed) in intrabar_due.items():
+            results = self.strategy_manager.analyze_symbol(symbol, data, names)
+            self._apply(symbol, timeframe, self._state(symbol, timeframe), results, last_closed, intrabar=True)
+
+        return {
+            "results": {symbol: self.signals(symbol, timeframe) for symbol in frames if symbol not in errors},
+            "errors": errors,
+            "evaluated": list(due) + list(intrabar_due)
+        }
+
+    def _apply(self, symbol: str, timeframe: str, state: _SymbolState, results: Dict[str, Any],
+               last_closed: Optional[int], intrabar: bool):
+        events = []
+        with self._lock:
+            if intrabar:
+                self.intrabar_evaluations += 1
+            else:
+                self.evaluations += 1
+            for name, result in results.items():
+                previous = state.signals.get(name)
+                state.signals[name] = result
+                if previous is None or previous.get("signal") != result.get("signal"):
+                    events.append({
+                        "symbol": symbol,
+                        "timeframe": timeframe,
+                        "strategy": name,
+                        "previous": previous.get("signal") if previous else None,
+                        "signal": result.get("signal"),
+                        "confidence": result.get("confidence"),
+                        "bar_time": last_closed,
+                        "intrabar": intrabar,
+                        "result": result
+                    })
+        self._publish(events)
+
+    def signals(self, symbol: str, timeframe: str) -> Dict[str, Any]:
+        """
+        Sembolün son değerlendirilmiş sinyalleri (strateji → sonuç)
+        """
+        with self._lock:
+            state = self._states.get((symbol, timeframe))
+            return dict(state.signals) if state else {}
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "evaluations": self.evaluations,
+                "intrabar_evaluations": self.intrabar_evaluations,
+                "skipped": self.skipped,
+                "tracked": len(self._states),
+                "subscribers": len(self._subscribers)
+            }
@@ -1,33 +1,171 @@
-from typing import Dict, List, Any
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Any, Iterable, Optional, Tuple, Union
 import pandas as pd
+from .base_strategy import BaseStrategy
 from .scalp_strategy import ScalpStrategy
 from .swing_strategy import SwingStrategy
 from .daily_strategy import DailyStrategy
+from analysis.indicator_cache import IndicatorCache
+from analysis.indicator_graph import IndicatorPlan, get_plan
+
+# Dashboard'un teknik analiz panelinde gösterdiği göstergeler
+DASHBOARD_INDICATORS = ['rsi(14)', 'macd(12,26,9)', 'sma(20)', 'sma(50)', 'bb(20,2)']
+EXECUTORS = ('serial', 'thread', 'process')
+
+
+def frames_from_panel(panel: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """
+    (sembol, alan) MultiIndex kolonlu paneli sembol → OHLCV DataFrame sözlüğüne böl
+    """
+    if not isinstance(panel.columns, pd.MultiIndex):
+        raise ValueError("Panel kolonları (sembol, alan) MultiIndex olmalı")
+    return {symbol: panel[symbol].dropna(how='all') for symbol in panel.columns.get_level_values(0).unique()}
+
+
+# Süreç havuzu worker'larının kendi StrategyManager'ı (süreç başına bir kez kurulur)
+_worker_manager: Optional['StrategyManager'] = None
+
+
+def _init_worker(strategies: Dict[str, BaseStrategy], tail_only: bool, extra_indicators: List[str]):
+    global _worker_manager
+    _worker_manager = StrategyManager(strategies=strategies, tail_only=tail_only, extra_indicators=extra_indicators)
+
+
+def _analyze_chunk_in_worker(chunk: List[Tuple[str, pd.DataFrame]]) -> List[Tuple[str, Any, Optional[str], float]]:
+    return _worker_manager._analyze_chunk(chunk)
 
 class StrategyManager:
-    def __init__(self):
-        self.strategies = {
+    def __init__(self, indicator_cache: Optional[IndicatorCache] = None, tail_only: bool = False,
+                 extra_indicators: Iterable[str] = DASHBOARD_INDICATORS,
+                 strategies: Optional[Dict[str, BaseStrategy]] = None):
+        self.strategies = strategies or {
             'scalp': ScalpStrategy(),
             'swing': SwingStrategy(),
             'daily': DailyStrategy()
         }
+        # Tüm stratejilerin ve dashboard'un göstergeleri tek planda: ortak EMA/SMA'lar bir kez hesaplanır
+        self.extra_indicators = list(extra_indicators)
+        specs = [spec for strategy in self.strategies.values() for spec in strategy.indicators]
+        self.indicator_plan: IndicatorPlan = get_plan(specs + self.extra_indicators)
+        self.indicator_cache = indicator_cache or IndicatorCache()
+        # tail_only: stratejiler yalnızca son iki değeri okuduğundan göstergeler kısa pencerede hesaplanır
+        self.tail = 2 if tail_only else None
+        # Toplu analiz havuzları çağrılar arasında yeniden kullanılır: (tür, worker sayısı) → havuz
+        self._pools: Dict[Tuple[str, int], Executor] = {}
     
-    def analyze_symbol(self, symbol: str, data: pd.DataFrame) -> Dict[str, Any]:
+    def compute_indicators(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Ortak planı bu sembol/zaman dilimi verisi için çalıştır; veri değişmediyse önbellekten döner,
+        yalnızca oluşan bar değiştiyse son satır ısınma penceresi üzerinden yeniden hesaplanır
+        """
+        return self.indicator_cache.get_or_compute(
+            data, 'plan', (self.indicator_plan.key, self.tail),
+            lambda: self.indicator_plan.evaluate(data, tail=self.tail),
+            refresh=lambda previous: self.indicator_plan.refresh_last(previous, data)
+        )
+    
+    def analyze_symbol(self, symbol: str, data: pd.DataFrame,
+                       strategy_names: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Stratejileri (strategy_names verilirse yalnızca onları) bu veri üzerinde çalıştır
+        """
         results = {}
+        selected = self.strategies if strategy_names is None else {
+            name: self.strategies[name] for name in strategy_names}
         
-        for strategy_name, strategy in self.strategies.items():
+        with self.indicator_cache.evaluation(data):
             try:
-                signal = strategy.generate_signal(data)
-                results[strategy_name] = signal
-            except Exception as e:
-                results[strategy_name] = {
-                    "signal": "ERROR",
-                    "confidence": 0,
-                    "message": f"Hata: {str(e)}"
-                }
+                indicators = self.compute_indicators(data)
+            except Exception:
+                # Ortak plan çalışmazsa her strateji kendi planını dener ve hatasını ayrı raporlar
+                indicators = None
+            for strategy_name, strategy in selected.items():
+                try:
+                    signal = strategy.generate_signal(data, indicators)
+                    results[strategy_name] = signal
+                except Exception as e:
+                    results[strategy_name] = {
+                        "signal": "ERROR",
+                        "confidence": 0,
+                        "message": f"Hata: {str(e)}"
+                    }
         
         return results
     
+    def analyze_symbols(self, frames: Union[Dict[str, pd.DataFrame], pd.DataFrame], executor: str = 'thread',
+                        max_workers: Optional[int] = None, chunk_size: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Sembol → OHLCV sözlüğünü (veya (sembol, alan) kolonlu paneli) havuzda toplu analiz et.
+        executor: 'serial', 'thread' veya 'process'. Semboller chunk_size'lık gruplar halinde
+        dağıtılır. Sonuçlar giriş sırasıyla; hatalar ve sembol başına süre ayrıca döner.
+        """
+        if executor not in EXECUTORS:
+            raise ValueError(f"Bilinmeyen executor: {executor} (seçenekler: {', '.join(EXECUTORS)})")
+        if isinstance(frames, pd.DataFrame):
+            frames = frames_from_panel(frames)
+        started = time.perf_counter()
+        items = list(frames.items())
+        workers = max(1, min(max_workers or os.cpu_count() or 1, len(items) or 1))
+        chunk_size = chunk_size or max(1, -(-len(items) // (workers * 4)))
+        chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+        
+        if executor == 'serial' or workers == 1:
+            outputs = [self._analyze_chunk(chunk) for chunk in chunks]
+        elif executor == 'thread':
+            outputs = list(self._pool('thread', workers).map(self._analyze_chunk, chunks))
+        else:
+            outputs = list(self._pool('process', workers).map(_analyze_chunk_in_worker, chunks))
+        
+        results, errors, timings = {}, {}, {}
+        for symbol, result, error, elapsed in (row for output in outputs for row in output):
+            timings[symbol] = elapsed
+            if error is None:
+                results[symbol] = result
+            else:
+                errors[symbol] = error
+        return {
+            "results": results,
+            "errors": errors,
+            "timings": timings,
+            "elapsed": time.perf_counter() - started
+        }
+    
+    def _analyze_chunk(self, chunk: List[Tuple[str, pd.DataFrame]]) -> List[Tuple[str, Any, Optional[str], float]]:
+        rows = []
+        for symbol, data in chunk:
+            started = time.perf_counter()
+            try:
+                if data is None or data.empty:
+                    raise ValueError("Veri yok")
+                rows.append((symbol, self.analyze_symbol(symbol, data), None, time.perf_counter() - started))
+            except Exception as e:
+                rows.append((symbol, None, str(e), time.perf_counter() - started))
+        return rows
+    
+    def _pool(self, kind: str, workers: int) -> Executor:
+        key = (kind, workers)
+        if key not in self._pools:
+            if kind == 'thread':
+                self._pools[key] = ThreadPoolExecutor(max_workers=workers)
+            else:
+                self._pools[key] = ProcessPoolExecutor(
+                    max_workers=workers, initializer=_init_worker,
+                    initargs=(self.strategies, self.tail is not None, self.extra_indicators))
+        return self._pools[key]
+    
+    def close(self):
+        """
+        Toplu analiz havuzlarını kapat
+        """
+        for pool in self._pools.values():
+            pool.shutdown()
+        self._pools.clear()
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        return self.indicator_cache.stats()
+    
     def get_all_strategies_info(self) -> Dict[str, Any]:
         info = {}
         for strategy_name, strategy in self.strategies.items():
@@ -1,23 +1,41 @@
+import numpy as np
 import pandas as pd
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from .base_strategy import BaseStrategy
-from analysis.technical_analyzer import TechnicalAnalyzer
 
 class SwingStrategy(BaseStrategy):
-    def __init__(self):
-        super().__init__("Swing Trading")
-        self.analyzer = TechnicalAnalyzer()
+    DEFAULT_PARAMS = {
+        'rsi_period': 14, 'rsi_overbought': 70, 'rsi_oversold': 30,
+        'macd_fast': 12, 'macd_slow': 26, 'macd_signal': 9,
+        'bb_period': 20, 'bb_std': 2,
+        'fast_ma': 20, 'slow_ma': 50,
+        'min_votes': 2
+    }
+    
+    def __init__(self, **params):
+        super().__init__("Swing Trading", **params)
         self.required_periods = 50
     
-    def generate_signal(self, data: pd.DataFrame) -> Dict[str, Any]:
+    def indicator_specs(self) -> Dict[str, str]:
+        p = self.params
+        return {
+            'rsi': f"rsi({p['rsi_period']})",
+            'macd': f"macd({p['macd_fast']},{p['macd_slow']},{p['macd_signal']})",
+            'fast_ma': f"sma({p['fast_ma']})",
+            'slow_ma': f"sma({p['slow_ma']})",
+            'bb': f"bb({p['bb_period']},{p['bb_std']})"
+        }
+    
+    def generate_signal(self, data: pd.DataFrame, indicators: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
         if len(data) < self.required_periods:
             return {"signal": "HOLD", "confidence": 0, "message": "Yetersiz veri"}
         
         # Swing için orta vadeli göstergeler
-        rsi = self.analyzer.calculate_rsi(data, period=14)
-        macd, macd_signal, histogram = self.analyzer.calculate_macd(data)
-        ma_dict = self.analyzer.calculate_moving_averages(data, [20, 50])
-        upper_bb, middle_bb, lower_bb = self.analyzer.calculate_bollinger_bands(data)
+        values = self.compute_indicators(data, indicators)
+        p = self.params
+        rsi = self._indicator(values, 'rsi')
+        macd, macd_signal, histogram = (self._indicator(values, 'macd', field) for field in ('macd', 'signal', 'histogram'))
+        upper_bb, lower_bb = self._indicator(values, 'bb', 'upper'), self._indicator(values, 'bb', 'lower')
         
         signals = []
         confidence = 0
@@ -25,10 +43,10 @@ class SwingStrategy(BaseStrategy):
         # RSI sinyali
         if not rsi.empty:
             last_rsi = rsi.iloc[-1]
-            if last_rsi > 70:
+            if last_rsi > p['rsi_overbought']:
                 signals.append("SELL")
                 confidence += 0.2
-            elif last_rsi < 30:
+            elif last_rsi < p['rsi_oversold']:
                 signals.append("BUY")
                 confidence += 0.2
         
@@ -52,13 +70,13 @@ class SwingStrategy(BaseStrategy):
                 confidence += 0.3
         
         # Moving Average sinyali
-        if 'sma_20' in ma_dict and 'sma_50' in ma_dict:
-            sma_20 = ma_dict['sma_20'].iloc[-1]
-            sma_50 = ma_dict['sma_50'].iloc[-1]
-            if sma_20 > sma_50 and data['close'].iloc[-1] > sma_20:
+        if self.columns['fast_ma'] in values and self.columns['slow_ma'] in values:
+            fast_ma = self._indicator(values, 'fast_ma').iloc[-1]
+            slow_ma = self._indicator(values, 'slow_ma').iloc[-1]
+            if fast_ma > slow_ma and data['close'].iloc[-1] > fast_ma:
                 signals.append("BUY")
                 confidence += 0.2
-            elif sma_20 < sma_50 and data['close'].iloc[-1] < sma_20:
+            elif fast_ma < slow_ma and data['close'].iloc[-1] < fast_ma:
                 signals.append("SELL")
                 confidence += 0.2
         
@@ -66,9 +84,9 @@ class SwingStrategy(BaseStrategy):
         buy_count = signals.count("BUY")
         sell_count = signals.count("SELL")
         
-        if buy_count >= 2 and buy_count > sell_count:
+        if buy_count >= p['min_votes'] and buy_count > sell_count:
             final_signal = "BUY"
-        elif sell_count >= 2 and sell_count > buy_count:
+        elif sell_count >= p['min_votes'] and sell_count > buy_count:
             final_signal = "SELL"
         else:
             final_signal = "HOLD"
@@ -86,10 +104,36 @@ class SwingStrategy(BaseStrategy):
             "message": f"Swing sinyali: {final_signal} (Güven: %{confidence*100:.1f})"
         }
     
+    def signal_series(self, data: pd.DataFrame, indicators: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        values = self.compute_indicators(data, indicators)
+        p = self.params
+        rsi = self._indicator(values, 'rsi').to_numpy()
+        macd, macd_signal, histogram = (self._indicator(values, 'macd', field).to_numpy()
+                                        for field in ('macd', 'signal', 'histogram'))
+        upper_bb = self._indicator(values, 'bb', 'upper').to_numpy()
+        lower_bb = self._indicator(values, 'bb', 'lower').to_numpy()
+        fast_ma = self._indicator(values, 'fast_ma').to_numpy()
+        slow_ma = self._indicator(values, 'slow_ma').to_numpy()
+        close = data['close'].to_numpy()
+        
+        votes = self._new_votes(len(data))
+        self._vote(votes, rsi < p['rsi_oversold'], rsi > p['rsi_overbought'], 0.2)
+        self._vote(votes, (macd > macd_signal) & (histogram > 0), (macd < macd_signal) & (histogram < 0), 0.3)
+        self._vote(votes, close <= lower_bb, close >= upper_bb, 0.3)
+        self._vote(votes, (fast_ma > slow_ma) & (close > fast_ma), (fast_ma < slow_ma) & (close < fast_ma), 0.2)
+        
+        buy, sell = votes["buy"], votes["sell"]
+        min_votes = p['min_votes']
+        signal = np.where((buy >= min_votes) & (buy > sell), 1, np.where((sell >= min_votes) & (sell > buy), -1, 0))
+        return self._signal_frame(data, signal, votes["confidence"], hold_factor=0.5)
+    
     def get_parameters(self) -> Dict[str, Any]:
+        p = self.params
         return {
             "timeframe": "1h-4h",
             "hold_time": "günler-haftalar",
             "risk_level": "orta",
-            "indicators": ["RSI(14)", "MACD(12,26,9)", "Bollinger Bands(20,2)", "MA(20,50)"]
+            "indicators": [f"RSI({p['rsi_period']})", f"MACD({p['macd_fast']},{p['macd_slow']},{p['macd_signal']})",
+                           f"Bollinger Bands({p['bb_period']},{p['bb_std']})", f"MA({p['fast_ma']},{p['slow_ma']})"],
+            "params": dict(p)
         }
\ No newline at end of file
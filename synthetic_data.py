@@ -0,0 +1,30 @@
+import numpy as np
+import pandas as pd
+
+
+def make_data(n=300, seed=0, freq="h", tz=None, datetime_index=True, open_from_previous=False,
+              open_noise=0.0, volume_spikes=0.0, gaps=0):
+    """
+    Testler için deterministik sentetik OHLCV (log-normal kapanış yürüyüşü).
+    open_from_previous: açılış bir önceki kapanış (open_noise ile oynatılabilir), aksi halde kapanışa eşit.
+    volume_spikes: hacmin 4 katına çıktığı bar oranı. gaps: NaN yapılan rastgele satır sayısı.
+    """
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    open_ = close
+    if open_from_previous:
+        open_ = np.concatenate(([close[0]], close[:-1]))
+        if open_noise:
+            open_ = open_ * (1 + rng.normal(0, open_noise, n))
+    spread = np.abs(rng.normal(0, 0.004, n)) * close
+    volume = rng.uniform(1, 10, n)
+    if volume_spikes:
+        volume = volume * np.where(rng.random(n) < volume_spikes, 4, 1)
+    index = pd.date_range("2024-01-01", periods=n, freq=freq, tz=tz) if datetime_index else None
+    data = pd.DataFrame({
+        'open': open_, 'high': np.maximum(open_, close) + spread, 'low': np.minimum(open_, close) - spread,
+        'close': close, 'volume': volume
+    }, index=index)
+    if gaps:
+        data.iloc[rng.integers(0, n, gaps)] = np.nan
+    return data
@@ -0,0 +1,66 @@
+import sys
+import os
+import time
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from strategies.strategy_manager import StrategyManager
+from strategies.swing_strategy import SwingStrategy
+from synthetic_data import make_data
+
+def make_universe(count, n=300):
+    return {f"SYM{i:03d}USDT": make_data(n, seed=i) for i in range(count)}
+
+def test_batch_matches_single():
+    print("📦 Toplu sembol analizi testi...")
+    frames = make_universe(12)
+    frames["EMPTYUSDT"] = pd.DataFrame()
+    manager = StrategyManager()
+    expected = {symbol: StrategyManager().analyze_symbol(symbol, data)
+                for symbol, data in frames.items() if not data.empty}
+    try:
+        for executor in ('serial', 'thread', 'process'):
+            batch = manager.analyze_symbols(frames, executor=executor, max_workers=3, chunk_size=4)
+            assert batch["results"] == expected, executor
+            assert list(batch["results"]) == [symbol for symbol in frames if symbol != "EMPTYUSDT"]
+            assert batch["errors"] == {"EMPTYUSDT": "Veri yok"}
+            assert set(batch["timings"]) == set(frames)
+            print(f"  {executor}: {len(batch['results'])} sembol, {batch['elapsed']*1000:.1f}ms")
+    finally:
+        manager.close()
+
+def test_panel_and_custom_strategies():
+    frames = make_universe(3)
+    panel = pd.concat(frames, axis=1)
+    manager = StrategyManager(strategies={'swing': SwingStrategy(rsi_overbought=60)})
+    batch = manager.analyze_symbols(panel, executor='serial')
+    assert set(batch["results"]) == set(frames)
+    for symbol, data in frames.items():
+        assert batch["results"][symbol] == {'swing': SwingStrategy(rsi_overbought=60).generate_signal(data)}
+    try:
+        manager.analyze_symbols(frames, executor='gpu')
+        assert False
+    except ValueError:
+        pass
+
+def benchmark_universe():
+    print("⏱️ 300 sembol × 500 bar toplu analiz...")
+    frames = make_universe(300, n=500)
+    for executor in ('serial', 'thread', 'process'):
+        manager = StrategyManager(tail_only=True)
+        try:
+            manager.analyze_symbols(make_universe(2), executor=executor)
+            start = time.perf_counter()
+            batch = manager.analyze_symbols(frames, executor=executor)
+            elapsed = time.perf_counter() - start
+        finally:
+            manager.close()
+        assert not batch["errors"]
+        print(f"  {executor}: {elapsed:.2f}s ({elapsed / len(frames) * 1000:.2f}ms/sembol)")
+
+if __name__ == "__main__":
+    test_batch_matches_single()
+    test_panel_and_custom_strategies()
+    benchmark_universe()
+    print("✅ Toplu sembol analizi testi tamamlandı!")
@@ -0,0 +1,118 @@
+import sys
+import os
+import tempfile
+import threading
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+import ccxt
+from data.bulk_fetcher import BulkFetcher
+from data.ohlcv_store import OHLCVStore
+from data.backfill import HistoryBackfiller
+
+MINUTE_MS = 60000
+
+class FakeExchange:
+    """
+    Listelenme zamanından itibaren her dakika için deterministik bar üreten sahte borsa
+    """
+    def __init__(self, listing_ms, now_ms, fail_after_calls=None):
+        self.listing_ms = listing_ms
+        self.now_ms = now_ms
+        self.fail_after_calls = fail_after_calls
+        self.requested_since = []
+        self._lock = threading.Lock()
+
+    def milliseconds(self):
+        return self.now_ms
+
+    def parse_timeframe(self, timeframe):
+        return ccxt.Exchange.parse_timeframe(timeframe)
+
+    def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=500):
+        with self._lock:
+            self.requested_since.append(since)
+            if self.fail_after_calls is not None and len(self.requested_since) > self.fail_after_calls:
+                raise ccxt.ExchangeError("bağlantı kesildi")
+        first = max(since, self.listing_ms)
+        first += (-first) % MINUTE_MS
+        bars = []
+        ts = first
+        while ts < self.now_ms and len(bars) < limit:
+            price = 100 + (ts // MINUTE_MS) % 50
+            bars.append([ts, price, price + 1, price - 1, price + 0.5, 1.0])
+            ts += MINUTE_MS
+        return bars
+
+def make_backfiller(exchange, root):
+    bulk = BulkFetcher(exchange, weight_per_minute=100000, backoff_base=0.001)
+    store = OHLCVStore(os.path.join(root, "ohlcv"))
+    return HistoryBackfiller(bulk, store, checkpoint_dir=os.path.join(root, "backfill"),
+                             max_workers=4, page_limit=100), store
+
+def test_backfill_range_is_complete_and_deduplicated():
+    print("📚 Backfill bütünlük testi...")
+    root = tempfile.mkdtemp()
+    start, end = 0, 2500 * MINUTE_MS
+    exchange = FakeExchange(listing_ms=300 * MINUTE_MS, now_ms=10**9)
+    backfiller, store = make_backfiller(exchange, root)
+
+    result = backfiller.backfill("BTCUSDT", "1m", start, end)
+    assert result['completed']
+    timestamps = list(store.read("BTCUSDT", "1m")['timestamp'])
+    assert timestamps == list(range(300 * MINUTE_MS, end, MINUTE_MS))
+    # Listelenmeden öncesi borsada yok; bu bilgi checkpoint'te saklanır
+    assert backfiller.history_start("BTCUSDT", "1m") == 300 * MINUTE_MS
+
+def test_backfill_resumes_after_interruption():
+    print("⏯️ Backfill devam ettirme testi...")
+    root = tempfile.mkdtemp()
+    start, end = 0, 5000 * MINUTE_MS
+
+    interrupted = FakeExchange(listing_ms=0, now_ms=10**9, fail_after_calls=20)
+    backfiller, store = make_backfiller(interrupted, root)
+    first = backfiller.backfill("BTCUSDT", "1m", start, end)
+    assert not first['completed'] and first['error']
+    checkpoint = backfiller.load_checkpoint("BTCUSDT", "1m")
+    assert 0 < checkpoint['next_since'] < end
+
+    resumed_exchange = FakeExchange(listing_ms=0, now_ms=10**9)
+    backfiller, store = make_backfiller(resumed_exchange, root)
+    second = backfiller.backfill("BTCUSDT", "1m", start, end)
+    assert second['completed']
+    # Devam eden indirme, checkpoint öncesini tekrar istemez
+    assert min(resumed_exchange.requested_since) == checkpoint['next_since']
+
+    timestamps = list(store.read("BTCUSDT", "1m")['timestamp'])
+    assert timestamps == list(range(start, end, MINUTE_MS))
+
+def test_backfill_resumes_without_end():
+    print("⏩ end verilmeden backfill devam ettirme testi...")
+    root = tempfile.mkdtemp()
+
+    interrupted = FakeExchange(listing_ms=0, now_ms=5000 * MINUTE_MS, fail_after_calls=20)
+    backfiller, store = make_backfiller(interrupted, root)
+    first = backfiller.backfill("BTCUSDT", "1m", 0)
+    assert not first['completed']
+    checkpoint = backfiller.load_checkpoint("BTCUSDT", "1m")
+
+    # Şimdi ilerledi: kaldığı yerden devam edilir ve aralık yeni şimdiye uzatılır
+    resumed_exchange = FakeExchange(listing_ms=0, now_ms=5600 * MINUTE_MS)
+    backfiller, store = make_backfiller(resumed_exchange, root)
+    second = backfiller.backfill("BTCUSDT", "1m", 0)
+    assert second['completed']
+    assert min(resumed_exchange.requested_since) == checkpoint['next_since']
+    assert list(store.read("BTCUSDT", "1m")['timestamp']) == list(range(0, 5600 * MINUTE_MS, MINUTE_MS))
+
+    # Tamamlanmış aralık yalnızca son saklanan bardan itibaren uzatılır
+    later = FakeExchange(listing_ms=0, now_ms=5700 * MINUTE_MS)
+    backfiller, store = make_backfiller(later, root)
+    third = backfiller.backfill("BTCUSDT", "1m", 0)
+    assert third['completed'] and min(later.requested_since) == 5599 * MINUTE_MS
+    assert list(store.read("BTCUSDT", "1m")['timestamp']) == list(range(0, 5700 * MINUTE_MS, MINUTE_MS))
+
+if __name__ == "__main__":
+    test_backfill_range_is_complete_and_deduplicated()
+    test_backfill_resumes_after_interruption()
+    test_backfill_resumes_without_end()
+    print("✅ Backfill testi tamamlandı!")
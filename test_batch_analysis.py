@@ -0,0 +1,161 @@
+import sys
+import os
+import re
+import json
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from deepseek.analyzer import DeepSeekAnalyzer
+from deepseek.response_cache import ResponseCache
+from deepseek.batch_analysis import (create_batch_prompt, estimate_tokens, format_item,
+                                     parse_batch_response, plan_batches)
+
+RESULTS = {
+    'scalp': {'signal': 'BUY', 'confidence': 0.7},
+    'swing': {'signal': 'HOLD', 'confidence': 0.25},
+    'daily': {'signal': 'SELL', 'confidence': 0.55}
+}
+
+def analysis_for(symbol):
+    return {
+        "recommendation": "AL" if len(symbol) % 2 else "SAT",
+        "confidence": 60 + len(symbol),
+        "risk_level": "ORTA",
+        "reasoning": f"{symbol} için test gerekçesi",
+        "market_context": "Yatay piyasa"
+    }
+
+def make_requests(count):
+    return [(f"C{i}USDT", RESULTS, 10.0 + i) for i in range(count)]
+
+def make_analyzer(drop=(), broken=(), fail_batch=False, **options):
+    analyzer = DeepSeekAnalyzer(api_key="test-key", response_cache=ResponseCache(cache_dir=None), **options)
+    analyzer.prompts = []
+
+    def query(prompt, max_tokens=1000):
+        analyzer.prompts.append((prompt, max_tokens))
+        symbols = re.findall(r"^- (\w+):", prompt, flags=re.M)
+        if not symbols:
+            # Tekil prompt
+            symbol = re.search(r"ANALİZİ - (\w+)", prompt).group(1)
+            return json.dumps(analysis_for(symbol))
+        if fail_batch:
+            raise ConnectionError("DeepSeek API zaman aşımı")
+        entries = []
+        for symbol in symbols:
+            if symbol in drop:
+                continue
+            entry = dict(analysis_for(symbol), symbol=symbol)
+            if symbol in broken:
+                entry["recommendation"] = "BELKİ"
+            entries.append(entry)
+        return "```json\n" + json.dumps(entries, ensure_ascii=False) + "\n```"
+
+    analyzer._query_deepseek_api = query
+    return analyzer
+
+def test_parse_and_validate():
+    print("🧪 Toplu yanıt ayrıştırma testi...")
+    symbols = ["BTCUSDT", "ETHUSDT", "SOLUSDT", "XRPUSDT"]
+    response = json.dumps([
+        dict(analysis_for("BTCUSDT"), symbol="btcusdt"),
+        dict(analysis_for("ETHUSDT"), symbol="ETHUSDT", confidence=140),
+        dict(analysis_for("SOLUSDT"), symbol="SOLUSDT", risk_level="BİLİNMİYOR"),
+        dict(analysis_for("BTCUSDT"), symbol="BTCUSDT", recommendation="SAT"),
+        dict(analysis_for("DOGEUSDT"), symbol="DOGEUSDT"),
+        "metin"
+    ])
+    analyses, invalid = parse_batch_response("Sonuçlar:\n" + response, symbols)
+    # İlk geçerli kayıt kullanılır; tekrar eden ve istenmeyen semboller yok sayılır
+    assert list(analyses) == ["BTCUSDT"] and analyses["BTCUSDT"]["recommendation"] == "AL"
+    assert "symbol" not in analyses["BTCUSDT"]
+    assert invalid == {"ETHUSDT", "SOLUSDT", "XRPUSDT"}
+
+    assert parse_batch_response("JSON yok", symbols) == ({}, set(symbols))
+    assert parse_batch_response('[{"symbol": "BTCUSDT",', symbols) == ({}, set(symbols))
+
+def test_batch_analysis_and_cache():
+    print("📦 Çok sembollü toplu analiz testi...")
+    analyzer = make_analyzer()
+    requests = make_requests(12)
+    results = analyzer.analyze_batch(requests)
+    assert len(analyzer.prompts) == 1
+    assert set(results) == {symbol for symbol, _, _ in requests}
+    for symbol, result in results.items():
+        expected = analysis_for(symbol)
+        assert result["recommendation"] == expected["recommendation"] and result["confidence"] == expected["confidence"]
+        assert result["batched"] and not result["cached"] and result["source"] == "DEEPSEEK_API"
+    assert analyzer.prompts[0][1] == 12 * analyzer.output_tokens_per_symbol + 200
+
+    # Toplu sonuçlar tekil analizle aynı önbellek anahtarında
+    single = analyzer.analyze_trading_signals("C3USDT", RESULTS, 13.0)
+    assert single["cached"] and single["reasoning"] == analysis_for("C3USDT")["reasoning"]
+    again = analyzer.analyze_batch(requests)
+    assert len(analyzer.prompts) == 1 and all(result["cached"] for result in again.values())
+
+    stats = analyzer.get_batch_stats()
+    assert stats["requests"] == 1 and stats["symbols"] == 12 and stats["retried"] == 0
+
+def test_missing_and_malformed_fallback():
+    print("🛟 Eksik/bozuk sembollerin tek tek yeniden denenmesi testi...")
+    analyzer = make_analyzer(drop={"C2USDT"}, broken={"C5USDT"})
+    results = analyzer.analyze_batch(make_requests(8) + [("BADUSDT", None, 1.0)])
+    assert len(analyzer.prompts) == 3
+    assert results["C2USDT"]["recommendation"] == analysis_for("C2USDT")["recommendation"]
+    assert results["C5USDT"]["recommendation"] == analysis_for("C5USDT")["recommendation"]
+    assert "batched" not in results["C2USDT"] and results["C1USDT"]["batched"]
+    assert "error" in results["BADUSDT"]
+    assert analyzer.get_batch_stats()["retried"] == 2
+
+    # Toplu istek tamamen başarısızsa tüm semboller tekil yoldan analiz edilir
+    failing = make_analyzer(fail_batch=True)
+    results = failing.analyze_batch(make_requests(4))
+    assert len(results) == 4 and all("error" not in result for result in results.values())
+    assert len(failing.prompts) == 5
+
+def test_batch_sizing():
+    print("📐 Bağlam penceresine göre grup boyutu testi...")
+    requests = make_requests(50)
+    analyzer = make_analyzer()
+    batches = plan_batches(requests, analyzer.context_window, analyzer.max_output_tokens,
+                           analyzer.output_tokens_per_symbol, max_batch_size=100)
+    # Cloud: yanıt sınırı (8192 / 260) grup boyutunu belirler
+    assert [len(batch) for batch in batches] == [31, 19]
+    assert [len(batch) for batch in plan_batches(requests, 65536, 8192, 260, max_batch_size=20)] == [20, 20, 10]
+
+    # Local (4096 bağlam): prompt + beklenen yanıt pencereye sığar
+    batches = plan_batches(requests, 4096, 2048, 160, max_batch_size=100, compact=True)
+    for batch in batches:
+        prompt = create_batch_prompt(batch, compact=True)
+        assert estimate_tokens(prompt) + len(batch) * 160 <= 4096
+        assert len(batch) <= 2048 // 160
+    assert sum(len(batch) for batch in batches) == 50 and len(batches) == 5
+
+    budgeted = plan_batches(requests, 65536, 8192, 260, max_batch_size=100, token_budget=1500)
+    overhead = estimate_tokens(create_batch_prompt([]))
+    for batch in budgeted:
+        assert overhead + sum(estimate_tokens(format_item(*item)) + 1 + 260 for item in batch) <= 1500
+    assert [item for batch in budgeted for item in batch] == requests
+
+    analyzer.analyze_batch(requests, max_batch_size=20, max_concurrency=3)
+    assert len(analyzer.prompts) == 3
+
+def benchmark_request_and_token_savings():
+    analyzer = make_analyzer()
+    requests = make_requests(30)
+    system = 40
+    single_tokens = sum(estimate_tokens(analyzer._create_analysis_prompt(*request)) + system for request in requests)
+    analyzer.analyze_batch(requests)
+    stats = analyzer.get_batch_stats()
+    batch_tokens = stats["prompt_tokens"] + stats["requests"] * system
+    print(f"📊 30 sembol: tekil {len(requests)} istek ~{single_tokens} prompt tokenı, "
+          f"toplu {stats['requests']} istek ~{batch_tokens} prompt tokenı ({single_tokens / batch_tokens:.1f}x)")
+    assert stats["requests"] < len(requests) and batch_tokens < single_tokens
+
+if __name__ == "__main__":
+    test_parse_and_validate()
+    test_batch_analysis_and_cache()
+    test_missing_and_malformed_fallback()
+    test_batch_sizing()
+    benchmark_request_and_token_savings()
+    print("✅ Toplu DeepSeek analizi testi tamamlandı!")
@@ -0,0 +1,65 @@
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+import numpy as np
+from data.candle_buffer import OHLCVRingBuffer
+from data.data_fetcher import DataFetcher
+
+MINUTE_MS = 60000
+
+def test_ring_buffer_wraps_and_keeps_order():
+    print("🔄 Halka tampon sıralama testi...")
+    buffer = OHLCVRingBuffer(capacity=5)
+    for i in range(12):
+        buffer.update(i * MINUTE_MS, i, i + 1, i - 1, i + 0.5, 1.0, closed=True)
+
+    window = buffer.window()
+    assert len(buffer) == 5
+    assert list(window['timestamp']) == [i * MINUTE_MS for i in range(7, 12)]
+    assert list(buffer.window(2)['close']) == [10.5, 11.5]
+
+def test_forming_bar_updates_in_place():
+    print("🕯️ Oluşan bar güncelleme testi...")
+    buffer = OHLCVRingBuffer(capacity=3)
+    buffer.update(0, 1, 1, 1, 1, 1, closed=True)
+    buffer.update(MINUTE_MS, 2, 2, 2, 2, 1, closed=False)
+    buffer.update(MINUTE_MS, 2, 3, 2, 2.5, 4, closed=False)
+
+    assert len(buffer) == 2
+    assert buffer.window()['close'][-1] == 2.5
+    assert list(buffer.window(include_forming=False)['timestamp']) == [0]
+
+def test_window_is_zero_copy():
+    print("📎 Kopyasız pencere testi...")
+    buffer = OHLCVRingBuffer(capacity=4)
+    for i in range(6):
+        buffer.update(i * MINUTE_MS, i, i, i, i, i, closed=True)
+    first = buffer.window(3)['close']
+    second = buffer.window(3)['close']
+    assert np.shares_memory(first, second)
+
+def test_kline_messages_are_routed_to_buffer():
+    print("📡 Kline mesaj yönlendirme testi...")
+    fetcher = DataFetcher(store_dir=None, use_cache=False)
+    fetcher.candle_buffers[("BTCUSDT", "1m")] = OHLCVRingBuffer(capacity=10)
+
+    def kline(start, close, closed):
+        return {"e": "kline", "s": "BTCUSDT",
+                "k": {"t": start, "i": "1m", "o": "1", "h": "2", "l": "0.5", "c": str(close), "v": "3", "x": closed}}
+
+    fetcher._handle_stream_message("btcusdt@kline_1m", kline(0, 1.5, False))
+    fetcher._handle_stream_message("btcusdt@kline_1m", kline(0, 1.7, True))
+    fetcher._handle_stream_message("btcusdt@kline_1m", kline(MINUTE_MS, 1.8, False))
+
+    df = fetcher.get_live_dataframe("BTCUSDT", "1m")
+    assert list(df['close']) == [1.7, 1.8]
+    assert len(fetcher.get_live_candles("BTCUSDT", "1m", include_forming=False)['close']) == 1
+
+if __name__ == "__main__":
+    test_ring_buffer_wraps_and_keeps_order()
+    test_forming_bar_updates_in_place()
+    test_window_is_zero_copy()
+    test_kline_messages_are_routed_to_buffer()
+    print("✅ Canlı mum tamponu testi tamamlandı!")
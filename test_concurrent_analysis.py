@@ -0,0 +1,200 @@
+import sys
+import os
+import json
+import time
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from deepseek.analyzer import DeepSeekAnalyzer
+from deepseek.response_cache import ResponseCache
+
+RESULTS = {
+    'scalp': {'signal': 'BUY', 'confidence': 0.7},
+    'swing': {'signal': 'HOLD', 'confidence': 0.25},
+    'daily': {'signal': 'SELL', 'confidence': 0.55}
+}
+REPLY = json.dumps({"recommendation": "AL", "confidence": 70, "risk_level": "ORTA", "reasoning": "test"})
+
+class MockDeepSeek:
+    """
+    Gecikmeli yanıt veren yerel chat-completions sunucusu; eşzamanlı istek sayısını izler
+    """
+    def __init__(self, delay=0.2, delays=None):
+        self.delay = delay
+        self.delays = delays or {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.started = []
+        self.lock = threading.Lock()
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                self._send({"data": [{"id": "mock-model"}]})
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                prompt = body["messages"][-1]["content"]
+                delay = next((d for symbol, d in mock.delays.items() if symbol in prompt), mock.delay)
+                with mock.lock:
+                    mock.in_flight += 1
+                    mock.max_in_flight = max(mock.max_in_flight, mock.in_flight)
+                    mock.started.append(time.monotonic())
+                try:
+                    time.sleep(delay)
+                    self._send({"choices": [{"message": {"content": REPLY}}]})
+                finally:
+                    with mock.lock:
+                        mock.in_flight -= 1
+
+            def _send(self, payload):
+                data = json.dumps(payload).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/v1"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+def make_analyzer(mock, requests_per_minute=60000):
+    return DeepSeekAnalyzer(api_key="test-key", base_url=mock.url, response_cache=ResponseCache(cache_dir=None),
+                            requests_per_minute=requests_per_minute)
+
+def make_requests(count, prefix="COIN"):
+    return [(f"{prefix}{i}USDT", RESULTS, 100.0 + i) for i in range(count)]
+
+def test_concurrency_bound_and_speedup():
+    print("🚀 Eşzamanlı DeepSeek analizi testi...")
+    mock = MockDeepSeek(delay=0.2)
+    try:
+        analyzer = make_analyzer(mock)
+        start = time.perf_counter()
+        results = analyzer.analyze_many_sync(make_requests(8), max_concurrency=4)
+        elapsed = time.perf_counter() - start
+        print(f"   8 sembol, 4 eşzamanlı: {elapsed:.2f}s (seri ~1.6s)")
+        assert len(results) == 8
+        assert all(r["recommendation"] == "AL" and not r["cached"] for r in results.values())
+        assert mock.max_in_flight == 4
+        assert elapsed < 1.0
+
+        # Önbellekteki yanıtlar API'ye gitmez
+        again = analyzer.analyze_many_sync(make_requests(8), max_concurrency=4)
+        assert all(r["cached"] for r in again.values())
+        assert len(mock.started) == 8
+    finally:
+        mock.close()
+
+def test_completion_order_and_errors():
+    print("🔀 Tamamlanma sırası ve hata testi...")
+    mock = MockDeepSeek(delays={"SLOWUSDT": 0.4, "FASTUSDT": 0.05})
+    try:
+        analyzer = make_analyzer(mock)
+        requests = [("SLOWUSDT", RESULTS, 1.0), ("FASTUSDT", RESULTS, 2.0), ("BADUSDT", None, 3.0)]
+
+        async def consume():
+            return [item async for item in analyzer.analyze_many(requests, max_concurrency=3)]
+
+        order = asyncio.run(consume())
+        symbols = [symbol for symbol, _ in order]
+        assert symbols[-1] == "SLOWUSDT" and symbols.index("FASTUSDT") < symbols.index("SLOWUSDT")
+        errors = {symbol: result for symbol, result in order if "error" in result}
+        assert list(errors) == ["BADUSDT"] and errors["BADUSDT"]["symbol"] == "BADUSDT"
+    finally:
+        mock.close()
+
+def test_deadline_and_cancellation():
+    print("⏱️ Süre sınırı ve iptal testi...")
+    mock = MockDeepSeek(delays={"SLOWUSDT": 1.0}, delay=0.05)
+    try:
+        analyzer = make_analyzer(mock)
+        requests = [("SLOWUSDT", RESULTS, 1.0), ("FASTUSDT", RESULTS, 2.0)]
+        start = time.perf_counter()
+        results = analyzer.analyze_many_sync(requests, max_concurrency=2, deadline=0.3)
+        assert time.perf_counter() - start < 0.8
+        assert results["FASTUSDT"]["recommendation"] == "AL"
+        assert "Süre sınırı" in results["SLOWUSDT"]["error"]
+
+        # Tüketici erken çıkarsa kuyruktaki istekler hiç gönderilmez
+        mock.started.clear()
+
+        async def first_only():
+            async for symbol, result in analyzer.analyze_many(make_requests(6), max_concurrency=1):
+                return symbol
+
+        assert asyncio.run(first_only()).startswith("COIN")
+        time.sleep(0.2)
+        assert len(mock.started) <= 2
+
+        # Dışarıdan görev iptali (önbellekte olmayan semboller)
+        mock.started.clear()
+
+        async def cancelled():
+            task = asyncio.ensure_future(analyzer.analyze_many(
+                make_requests(6, "NEW"), max_concurrency=1).__anext__())
+            await asyncio.sleep(0.01)
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                return True
+            return False
+
+        assert asyncio.run(cancelled())
+        time.sleep(0.2)
+        assert len(mock.started) <= 1
+    finally:
+        mock.close()
+
+def test_rate_limit_spacing():
+    print("🚦 Sağlayıcı istek limiti testi...")
+    mock = MockDeepSeek(delay=0.0)
+    try:
+        analyzer = make_analyzer(mock, requests_per_minute=600)
+        other = make_analyzer(mock, requests_per_minute=600)
+        assert analyzer.rate_limiter is other.rate_limiter
+        analyzer.analyze_many_sync(make_requests(5), max_concurrency=5)
+        gaps = [b - a for a, b in zip(mock.started, mock.started[1:])]
+        print(f"   İstek aralıkları: {', '.join(f'{g:.2f}' for g in gaps)}s")
+        assert mock.started[-1] - mock.started[0] >= 0.35
+        assert DeepSeekAnalyzer(local_mode=True, model="m", base_url=mock.url).rate_limiter is None
+    finally:
+        mock.close()
+
+def benchmark_portfolio_analysis():
+    mock = MockDeepSeek(delay=0.25)
+    try:
+        analyzer = make_analyzer(mock)
+        requests = make_requests(12)
+        start = time.perf_counter()
+        for symbol, results, price in requests[:4]:
+            analyzer.analyze_trading_signals(symbol, results, price)
+        serial = (time.perf_counter() - start) * 3
+        analyzer.response_cache.clear()
+        start = time.perf_counter()
+        analyzer.analyze_many_sync(requests, max_concurrency=6)
+        concurrent = time.perf_counter() - start
+        print(f"📊 12 sembol: seri ~{serial:.2f}s, 6 eşzamanlı {concurrent:.2f}s ({serial / concurrent:.1f}x)")
+    finally:
+        mock.close()
+
+if __name__ == "__main__":
+    test_concurrency_bound_and_speedup()
+    test_completion_order_and_errors()
+    test_deadline_and_cancellation()
+    test_rate_limit_spacing()
+    benchmark_portfolio_analysis()
+    print("✅ Eşzamanlı DeepSeek analizi testi tamamlandı!")
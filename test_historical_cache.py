@@ -0,0 +1,87 @@
+import sys
+import os
+import time
+import threading
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+import pandas as pd
+from data.historical_cache import HistoricalDataCache
+
+def make_frame(count):
+    index = pd.to_datetime([i * 3600000 for i in range(count)], unit='ms')
+    return pd.DataFrame({'close': [float(i) for i in range(count)]}, index=index)
+
+def test_smaller_limit_is_sliced_from_cache():
+    print("✂️ Küçük limit dilimleme testi...")
+    cache = HistoricalDataCache(clock=lambda: 1000.0)
+    loads = []
+
+    def loader(limit):
+        loads.append(limit)
+        return make_frame(limit)
+
+    big = cache.get_or_load("BTCUSDT", "1h", 200, 3600, loader)
+    small = cache.get_or_load("BTCUSDT", "1h", 100, 3600, loader)
+    assert loads == [200]
+    assert len(small) == 100 and small.index[-1] == big.index[-1]
+    assert cache.stats()['hits'] == 1
+
+def test_entry_expires_at_candle_close():
+    print("⏰ Mum kapanışı TTL testi...")
+    now = {"t": 3600 * 10 + 5}
+    cache = HistoricalDataCache(clock=lambda: now["t"])
+    loads = []
+
+    def loader(limit):
+        loads.append(limit)
+        return make_frame(limit)
+
+    cache.get_or_load("BTCUSDT", "1h", 50, 3600, loader)
+    now["t"] = 3600 * 11 - 1
+    cache.get_or_load("BTCUSDT", "1h", 50, 3600, loader)
+    assert len(loads) == 1
+    now["t"] = 3600 * 11 + 2
+    cache.get_or_load("BTCUSDT", "1h", 50, 3600, loader)
+    assert len(loads) == 2
+
+def test_concurrent_requests_share_one_load():
+    print("🧵 Single-flight testi...")
+    cache = HistoricalDataCache()
+    loads = []
+
+    def slow_loader(limit):
+        loads.append(limit)
+        time.sleep(0.2)
+        return make_frame(limit)
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(
+        cache.get_or_load("BTCUSDT", "1h", 100, 3600, slow_loader))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(loads) == 1
+    assert len(results) == 8 and all(len(df) == 100 for df in results)
+
+def test_empty_frames_are_not_cached():
+    print("🚫 Boş çerçeve testi...")
+    cache = HistoricalDataCache()
+    loads = []
+
+    def failing_loader(limit):
+        loads.append(limit)
+        return pd.DataFrame()
+
+    cache.get_or_load("BTCUSDT", "1h", 100, 3600, failing_loader)
+    cache.get_or_load("BTCUSDT", "1h", 100, 3600, failing_loader)
+    assert len(loads) == 2
+
+if __name__ == "__main__":
+    test_smaller_limit_is_sliced_from_cache()
+    test_entry_expires_at_candle_close()
+    test_concurrent_requests_share_one_load()
+    test_empty_frames_are_not_cached()
+    print("✅ Tarihsel veri önbellek testi tamamlandı!")
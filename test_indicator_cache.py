@@ -0,0 +1,74 @@
+import sys
+import os
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from analysis.technical_analyzer import TechnicalAnalyzer
+from analysis.indicator_cache import IndicatorCache
+from analysis.indicator_graph import IndicatorPlan, spec_name
+from strategies.strategy_manager import StrategyManager
+from strategies.swing_strategy import SwingStrategy
+from synthetic_data import make_data
+
+def test_shared_cache_results_unchanged():
+    print("🗃️ Ortak gösterge önbelleği testi...")
+    data = make_data(250, seed=5)
+    manager = StrategyManager()
+    cached = manager.analyze_symbol("BTCUSDT", data)
+    first = manager.get_cache_stats()
+    print(f"  ilk çağrı: {first['hits']} isabet / {first['misses']} ıska")
+
+    # Önbelleksiz tek başına strateji ile aynı sonuç
+    assert SwingStrategy().generate_signal(data) == cached['swing']
+
+    manager.analyze_symbol("BTCUSDT", data)
+    second = manager.get_cache_stats()
+    assert second['misses'] == first['misses']
+    assert second['hits'] > first['hits']
+
+def test_managers_share_cache():
+    data = make_data(250, seed=5)
+    cache = IndicatorCache()
+    StrategyManager(indicator_cache=cache).analyze_symbol("BTCUSDT", data)
+    # Aynı önbelleği kullanan ikinci yönetici ortak planı yeniden hesaplamaz
+    StrategyManager(indicator_cache=cache, tail_only=False).analyze_symbol("BTCUSDT", data)
+    assert cache.stats()['misses'] == 1 and cache.stats()['hits'] == 1
+
+def test_last_bar_change_reuses_prefix():
+    print("🧷 Son bar değişiminde önbellekteki önekin kullanılması testi...")
+    data = make_data(250, seed=5)
+    manager = StrategyManager()
+    plan = IndicatorPlan([spec_name(key) for key in manager.indicator_plan.outputs])
+    manager.indicator_plan = plan
+    tails = []
+    evaluate = plan.evaluate
+    plan.evaluate = lambda frame, tail=None: tails.append(tail) or evaluate(frame, tail)
+    manager.analyze_symbol("BTCUSDT", data)
+    before = manager.compute_indicators(data)
+    assert tails == [None] and manager.get_cache_stats()['misses'] == 1
+
+    # Yalnızca son kapanış değişir: önek önbellekten, son satır ısınma penceresinden
+    updated = data.copy()
+    updated.iloc[-1, updated.columns.get_loc('close')] *= 1.01
+    results = manager.analyze_symbol("BTCUSDT", updated)
+    stats = manager.get_cache_stats()
+    assert tails == [None, 1] and stats['partial_hits'] == 1 and stats['misses'] == 1
+    after = manager.compute_indicators(updated)
+    assert after.iloc[:-1].equals(before.iloc[:-1]) and list(after.index) == list(data.index)
+
+    full = evaluate(updated)
+    price_range = data['close'].max() - data['close'].min()
+    assert np.allclose(after.iloc[-1], full.iloc[-1], rtol=0, atol=3e-6 * price_range)
+    rsi = TechnicalAnalyzer().calculate_rsi(updated, period=14).iloc[-1]
+    assert abs(results['swing']['indicators']['rsi'] - rsi) < 1e-9
+
+    # Yeni bar eklenince önek değişir, tam hesap yapılır
+    manager.analyze_symbol("BTCUSDT", make_data(len(data) + 1, seed=5))
+    assert tails[-1] is None and manager.get_cache_stats()['misses'] == 2
+
+if __name__ == "__main__":
+    test_shared_cache_results_unchanged()
+    test_managers_share_cache()
+    test_last_bar_change_reuses_prefix()
+    print("✅ Gösterge önbelleği testi tamamlandı!")
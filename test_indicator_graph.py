@@ -0,0 +1,70 @@
+import sys
+import os
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from analysis.technical_analyzer import TechnicalAnalyzer
+from analysis.indicator_graph import IndicatorPlan, get_plan, parse_spec
+from strategies.strategy_manager import StrategyManager
+from strategies.daily_strategy import DailyStrategy
+from synthetic_data import make_data
+
+def assert_close(actual, expected, name):
+    actual, expected = np.asarray(actual, dtype=float), np.asarray(expected, dtype=float)
+    assert np.array_equal(np.isnan(actual), np.isnan(expected)), name
+    mask = ~np.isnan(expected)
+    assert np.allclose(actual[mask], expected[mask], rtol=1e-9, atol=1e-9), name
+
+def test_plan_shares_intermediates():
+    print("🕸️ Gösterge grafiği testi...")
+    plan = IndicatorPlan(['rsi(14)', 'bb(20,2)', 'sma(20)', 'ema(12)', 'macd(12,26,9)', 'ema(26)'])
+    # sma(20), ema(12), ema(26) hem çıktı hem ara değer; yalnızca bir kez yer alır
+    assert len(plan.nodes) == len(set(plan.nodes)) == 7
+    assert plan.nodes.index(('ema', 12)) < plan.nodes.index(('macd', 12, 26, 9))
+
+    data = make_data(seed=13)
+    result = plan.evaluate(data)
+    analyzer = TechnicalAnalyzer()
+    macd, macd_signal, histogram = analyzer.calculate_macd(data)
+    upper, middle, lower = analyzer.calculate_bollinger_bands(data)
+    assert_close(result['rsi(14)'], analyzer.calculate_rsi(data), "rsi")
+    assert_close(result['macd(12,26,9).signal'], macd_signal, "macd signal")
+    assert_close(result['macd(12,26,9).histogram'], histogram, "macd histogram")
+    assert_close(result['bb(20,2).upper'], upper, "bb upper")
+    assert_close(result['sma(20)'], middle, "sma")
+    assert_close(result['ema(26)'], data['close'].ewm(span=26).mean(), "ema")
+    print(f"  {len(plan.outputs)} çıktı, {len(plan.nodes)} düğüm, {len(result.columns)} kolon")
+
+def test_spec_parsing_and_tail():
+    assert parse_spec('macd') == ('macd', 12, 26, 9)
+    assert parse_spec(' BB(20, 2.0) ') == ('bb', 20, 2)
+    for bad in ('foo(3)', 'sma', 'bb(20)'):
+        try:
+            parse_spec(bad)
+            assert False, bad
+        except ValueError:
+            pass
+    assert get_plan(['sma(20)', 'rsi']) is get_plan(['rsi(14)', 'sma(20)'])
+
+    data = make_data(600, seed=13)
+    plan = IndicatorPlan(['rsi(14)', 'stoch(14,3)', 'macd(12,26,9)'])
+    full, tail = plan.evaluate(data), plan.evaluate(data, tail=2)
+    assert list(tail.index) == list(data.index[-2:])
+    assert_close(tail['stoch(14,3).d'], full['stoch(14,3).d'].iloc[-2:], "stoch tail")
+    assert np.allclose(tail['macd(12,26,9).signal'], full['macd(12,26,9).signal'].iloc[-2:], atol=1e-4)
+
+def test_strategies_share_one_plan():
+    data = make_data(seed=13)
+    manager = StrategyManager()
+    results = manager.analyze_symbol("BTCUSDT", data)
+    assert results['daily'] == DailyStrategy().generate_signal(data)
+    for strategy in manager.strategies.values():
+        assert set(get_plan(strategy.indicators).columns) <= set(manager.indicator_plan.columns)
+    assert manager.get_cache_stats()['misses'] == 1
+
+if __name__ == "__main__":
+    test_plan_shares_intermediates()
+    test_spec_parsing_and_tail()
+    test_strategies_share_one_plan()
+    print("✅ Gösterge grafiği testi tamamlandı!")
@@ -0,0 +1,102 @@
+import time
+import sys
+import os
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from analysis import kernels
+from analysis.technical_analyzer import TechnicalAnalyzer
+from synthetic_data import make_data
+
+TOLERANCE = 1e-9
+
+def assert_close(actual, expected, name):
+    actual, expected = np.asarray(actual, dtype=float), np.asarray(expected, dtype=float)
+    assert np.array_equal(np.isnan(actual), np.isnan(expected)), f"{name}: NaN konumları farklı"
+    mask = np.isfinite(expected)
+    assert np.array_equal(actual[~mask & ~np.isnan(expected)], expected[~mask & ~np.isnan(expected)]), name
+    scale = np.maximum(np.abs(expected[mask]), 1.0)
+    assert np.all(np.abs(actual[mask] - expected[mask]) / scale < TOLERANCE), name
+
+def reference(data):
+    kernels.set_backend('pandas')
+    analyzer = TechnicalAnalyzer()
+    results = {
+        'rsi': analyzer.calculate_rsi(data, 14),
+        'ema': data['close'].ewm(span=12).mean(),
+        'sma': data['close'].rolling(window=20).mean()
+    }
+    results['k'], results['d'] = analyzer.calculate_stochastic(data)
+    return results
+
+def check_functions(data, rsi, ema, rolling_mean, stochastic, label):
+    expected = reference(data)
+    close, high, low = (data[c].to_numpy() for c in ('close', 'high', 'low'))
+    assert_close(rsi(close, 14), expected['rsi'], f"{label} rsi")
+    assert_close(ema(close, 12), expected['ema'], f"{label} ema")
+    assert_close(rolling_mean(close, 20), expected['sma'], f"{label} sma")
+    k, d = stochastic(high, low, close, 14, 3)
+    assert_close(k, expected['k'], f"{label} stochastic k")
+    assert_close(d, expected['d'], f"{label} stochastic d")
+
+def test_numpy_backend_matches_pandas():
+    print("🧪 NumPy kernel ↔ pandas eşdeğerlik testi...")
+    for gaps in (False, True):
+        check_functions(make_data(3000, seed=9, datetime_index=False, gaps=20 if gaps else 0), kernels.rsi, kernels.ema, kernels.rolling_mean,
+                        kernels.stochastic, "numpy")
+    kernels.set_backend('auto')
+
+def test_loop_kernels_match_pandas():
+    # Numba yoksa aynı döngüler düz Python olarak çalışır
+    print(f"🧪 Döngü kernelleri testi (numba: {kernels.NUMBA_AVAILABLE})...")
+    for gaps in (False, True):
+        check_functions(make_data(3000, seed=9, datetime_index=False, gaps=20 if gaps else 0), kernels._rsi_loop, kernels._ema_loop, kernels._rolling_mean_loop,
+                        kernels._stochastic_loop, "loop")
+    kernels.set_backend('auto')
+
+def test_backend_selection():
+    try:
+        kernels.set_backend('gpu')
+        assert False, "geçersiz backend kabul edilmemeli"
+    except ValueError:
+        pass
+    expected = 'numba' if kernels.NUMBA_AVAILABLE else 'numpy'
+    assert kernels.set_backend('numba') == expected
+    assert kernels.set_backend('auto') == expected
+
+    data = make_data(300, seed=9, datetime_index=False)
+    analyzer = TechnicalAnalyzer()
+    kernels.set_backend('pandas')
+    macd_pandas = analyzer.calculate_macd(data)[0]
+    kernels.set_backend('auto')
+    assert_close(analyzer.calculate_macd(data)[0], macd_pandas, "macd")
+
+def benchmark_backends(bars=1_000_000, small=200, repeats=2000):
+    """
+    Uzun seri (backtest) ve çok sayıda kısa değerlendirme için backend karşılaştırması
+    """
+    large, short = make_data(bars, seed=9, datetime_index=False), make_data(small, seed=9, datetime_index=False)
+    analyzer = TechnicalAnalyzer()
+    for backend in ('pandas', kernels.set_backend('auto')):
+        kernels.set_backend(backend)
+        analyzer.calculate_rsi(short)
+        started = time.perf_counter()
+        analyzer.calculate_rsi(large)
+        analyzer.calculate_stochastic(large)
+        analyzer.calculate_macd(large)
+        long_run = time.perf_counter() - started
+        started = time.perf_counter()
+        for _ in range(repeats):
+            analyzer.calculate_rsi(short)
+            analyzer.calculate_stochastic(short)
+        short_run = time.perf_counter() - started
+        print(f"  {backend}: {bars} bar {long_run * 1000:.0f} ms, {repeats}×{small} bar {short_run * 1000:.0f} ms")
+    kernels.set_backend('auto')
+
+if __name__ == "__main__":
+    test_numpy_backend_matches_pandas()
+    test_loop_kernels_match_pandas()
+    test_backend_selection()
+    benchmark_backends()
+    print("✅ Kernel testi tamamlandı!")
@@ -0,0 +1,244 @@
+import sys
+import os
+import json
+import time
+import threading
+import requests
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from deepseek import analyzer as analyzer_module
+from deepseek.analyzer import DeepSeekAnalyzer
+from deepseek.health_check import HealthCheck
+from deepseek.response_cache import ResponseCache
+
+RESULTS = {
+    'scalp': {'signal': 'BUY', 'confidence': 0.7},
+    'swing': {'signal': 'HOLD', 'confidence': 0.25},
+    'daily': {'signal': 'SELL', 'confidence': 0.55}
+}
+REPLY = json.dumps({"recommendation": "AL", "confidence": 70, "risk_level": "ORTA", "reasoning": "test"})
+
+class MockLMStudio:
+    """
+    Keep-alive destekli yerel LM Studio benzeri sunucu; istekleri ve bağlantıları sayar
+    """
+    def __init__(self):
+        self.gets = 0
+        self.posts = 0
+        self.connections = set()
+        # True iken bağlantılar yanıt verilmeden kapatılır (sunucu çökmüş gibi)
+        self.down = False
+        # POST yanıt kodu (ör. 503 ile sunucu hatası)
+        self.status = 200
+        self.lock = threading.Lock()
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Başlık ve gövde tek pakette gitsin (keep-alive'da gecikmeli ACK beklenmesin)
+            wbufsize = -1
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def _count(self, kind):
+                if mock.down:
+                    self.close_connection = True
+                    return False
+                with mock.lock:
+                    setattr(mock, kind, getattr(mock, kind) + 1)
+                    mock.connections.add(self.client_address)
+                return True
+
+            def do_GET(self):
+                if self._count("gets"):
+                    self._send({"data": [{"id": "llama-3"}, {"id": "deepseek-r1-distill"}]})
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers["Content-Length"]))
+                if self._count("posts"):
+                    self._send({"choices": [{"message": {"content": REPLY}}]}, mock.status)
+
+            def _send(self, payload, status=200):
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/v1"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+def make_analyzer(mock):
+    return DeepSeekAnalyzer(local_mode=True, base_url=mock.url, response_cache=ResponseCache(cache_dir=None))
+
+def test_pooled_session_and_cached_health():
+    print("🔌 Bağlantı havuzu ve sağlık önbelleği testi...")
+    mock = MockLMStudio()
+    analyzer_module._models_cache.clear()
+    try:
+        analyzer = make_analyzer(mock)
+        assert analyzer.model == "deepseek-r1-distill"
+        for i in range(10):
+            result = analyzer.analyze_trading_signals("BTCUSDT", RESULTS, 60000.0 + i * 1000)
+            assert result["recommendation"] == "AL" and not result["cached"]
+
+        # Model tespiti + ilk sağlık yoklaması; sonraki analizler /models çağırmaz
+        assert mock.gets == 2 and mock.posts == 10
+        assert len(mock.connections) == 1
+        assert analyzer.get_health()["probes"] == 1 and analyzer.get_health()["cached"] == 9
+
+        # Aynı uç noktaya yeni analyzer: model listesi önbellekten
+        other = make_analyzer(mock)
+        assert other.model == analyzer.model and other.get_available_models() == ["llama-3", "deepseek-r1-distill"]
+        assert mock.gets == 2
+
+        # Açık test_connection her zaman yoklar
+        assert analyzer.test_connection() and mock.gets == 3
+        analyzer.close()
+        other.close()
+    finally:
+        mock.close()
+
+def test_health_failure_and_recovery():
+    print("🩺 Sağlık kontrolü hata/yenileme testi...")
+    mock = MockLMStudio()
+    analyzer_module._models_cache.clear()
+    analyzer = make_analyzer(mock)
+    analyzer.analyze_trading_signals("BTCUSDT", RESULTS, 60000.0)
+    mock.down = True
+
+    # Sunucu kapandı: sorgu hatası durumu sağlıksız yapar, sonraki analiz yoklamadan reddedilir
+    try:
+        analyzer.analyze_trading_signals("ETHUSDT", RESULTS, 3000.0)
+        assert False, "Bağlantı hatası bekleniyordu"
+    except ConnectionError:
+        pass
+    assert analyzer.get_health()["healthy"] is False
+    probes = analyzer.get_health()["probes"]
+    try:
+        analyzer.analyze_trading_signals("ETHUSDT", RESULTS, 3000.0)
+        assert False, "Bağlantı hatası bekleniyordu"
+    except ConnectionError as e:
+        assert "LM Studio bağlantısı yok" in str(e)
+    assert analyzer.get_health()["probes"] == probes
+    analyzer.close()
+    mock.close()
+
+    clock = FakeClock()
+    state = {"up": True, "calls": 0}
+    release = threading.Event()
+
+    def probe():
+        state["calls"] += 1
+        if state["calls"] > 1:
+            release.wait(1.0)
+        return state["up"]
+
+    health = HealthCheck(probe, ttl=30, failure_ttl=5, clock=clock)
+    assert health.check() and state["calls"] == 1
+    clock.now += 10
+    assert health.check() and state["calls"] == 1
+
+    # Bayat sağlıklı durum hemen döner, yenileme arka planda
+    state["up"] = False
+    clock.now += 30
+    start = time.perf_counter()
+    assert health.check()
+    assert time.perf_counter() - start < 0.1
+    release.set()
+    for _ in range(100):
+        if health.stats()["healthy"] is False:
+            break
+        time.sleep(0.01)
+    assert health.stats()["healthy"] is False and state["calls"] == 2
+
+    # Sağlıksız durum failure_ttl dolunca senkron yeniden yoklanır
+    assert not health.check() and state["calls"] == 2
+    state["up"] = True
+    clock.now += 6
+    assert health.check() and state["calls"] == 3
+
+    health.mark_failure()
+    assert not health.check()
+
+def test_cloud_failures_mark_unhealthy():
+    print("☁️ Cloud sorgu hatalarının sağlık durumuna yansıması testi...")
+    mock = MockLMStudio()
+    analyzer = DeepSeekAnalyzer(api_key="test-key", base_url=mock.url, response_cache=ResponseCache(cache_dir=None),
+                                requests_per_minute=60000)
+    try:
+        assert analyzer._query_deepseek_api("test") == REPLY
+        assert analyzer.get_health()["healthy"] is True
+
+        # Başarılı istekten sonra gelen hata yanıtı ttl dolmadan durumu sağlıksız yapar
+        mock.status = 503
+        try:
+            analyzer._query_deepseek_api("test")
+            assert False, "API hatası bekleniyordu"
+        except ConnectionError:
+            pass
+        assert analyzer.get_health()["healthy"] is False
+
+        mock.status = 200
+        analyzer._query_deepseek_api("test")
+        assert analyzer.get_health()["healthy"] is True
+        mock.down = True
+        try:
+            analyzer._query_deepseek_api("test")
+            assert False, "Bağlantı hatası bekleniyordu"
+        except ConnectionError:
+            pass
+        assert analyzer.get_health()["healthy"] is False
+    finally:
+        analyzer.close()
+        mock.close()
+
+def benchmark_local_overhead():
+    mock = MockLMStudio()
+    analyzer_module._models_cache.clear()
+    try:
+        count = 200
+        # Eski yol: havuzsuz requests çağrıları ve her analizden önce /models yoklaması
+        legacy_analyzer = make_analyzer(mock)
+        legacy_analyzer.session = requests
+        start = time.perf_counter()
+        for i in range(count):
+            legacy_analyzer.test_connection()
+            legacy_analyzer.analyze_trading_signals("BTCUSDT", RESULTS, 1000.0 + i * 10)
+        legacy = (time.perf_counter() - start) / count
+
+        analyzer = make_analyzer(mock)
+        start = time.perf_counter()
+        for i in range(count):
+            analyzer.analyze_trading_signals("ETHUSDT", RESULTS, 1000.0 + i * 10)
+        pooled = (time.perf_counter() - start) / count
+        analyzer.close()
+        print(f"📊 Analiz başına ek yük: eski {legacy * 1000:.2f}ms, havuzlu {pooled * 1000:.2f}ms "
+              f"({legacy / pooled:.1f}x)")
+    finally:
+        mock.close()
+
+if __name__ == "__main__":
+    test_pooled_session_and_cached_health()
+    test_health_failure_and_recovery()
+    test_cloud_failures_mark_unhealthy()
+    benchmark_local_overhead()
+    print("✅ Bağlantı havuzu testi tamamlandı!")
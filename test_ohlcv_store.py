@@ -0,0 +1,145 @@
+import sys
+import os
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+import numpy as np
+from data.ohlcv_store import OHLCVStore
+from data.data_fetcher import DataFetcher
+
+HOUR_MS = 3600000
+
+def make_bars(start_index, count, price=100.0):
+    return [[i * HOUR_MS, price + i, price + i + 1, price + i - 1, price + i + 0.5, 10.0 + i]
+            for i in range(start_index, start_index + count)]
+
+def test_append_and_window_read():
+    print("💾 OHLCV store ekleme/okuma testi...")
+    store = OHLCVStore(tempfile.mkdtemp())
+    store.append("BTCUSDT", "1h", make_bars(0, 10))
+    store.append("BTCUSDT", "1h", make_bars(10, 5))
+
+    assert store.length("BTCUSDT", "1h") == 15
+    assert store.last_timestamp("BTCUSDT", "1h") == 14 * HOUR_MS
+
+    window = store.read("BTCUSDT", "1h", start=3 * HOUR_MS, end=8 * HOUR_MS)
+    assert list(window['timestamp']) == [i * HOUR_MS for i in range(3, 8)]
+    # Okumalar memmap üzerinden kopyasız dilim
+    assert isinstance(window['close'], np.memmap)
+
+    tail = store.read_dataframe("BTCUSDT", "1h", limit=4)
+    assert len(tail) == 4
+    assert tail['close'].iloc[-1] == 100.0 + 14 + 0.5
+
+def test_forming_bar_is_updated_in_place():
+    print("🕯️ Oluşmakta olan mum güncelleme testi...")
+    store = OHLCVStore(tempfile.mkdtemp())
+    store.append("BTCUSDT", "1h", make_bars(0, 5))
+    updated = make_bars(4, 2, price=200.0)
+    store.append("BTCUSDT", "1h", updated)
+
+    cols = store.read("BTCUSDT", "1h")
+    assert len(cols['timestamp']) == 6
+    assert cols['close'][4] == updated[0][4]
+
+def test_older_bars_are_merged():
+    print("🔀 Eski bar birleştirme testi...")
+    store = OHLCVStore(tempfile.mkdtemp())
+    store.append("BTCUSDT", "1h", make_bars(5, 5))
+    store.append("BTCUSDT", "1h", make_bars(0, 7))
+
+    timestamps = list(store.read("BTCUSDT", "1h")['timestamp'])
+    assert timestamps == [i * HOUR_MS for i in range(10)]
+
+def test_incremental_fetch_requests_only_new_bars():
+    print("📡 Artımlı veri çekme testi...")
+    fetcher = DataFetcher(store_dir=tempfile.mkdtemp(), use_cache=False)
+    calls = []
+    now = {"ms": 99 * HOUR_MS + 10}
+
+    def fake_fetch_ohlcv(symbol, timeframe='1h', since=None, limit=100):
+        calls.append((since, limit))
+        last = now["ms"] // HOUR_MS
+        first = last - limit + 1 if since is None else since // HOUR_MS
+        return make_bars(first, min(limit, last - first + 1))
+
+    fetcher.binance.fetch_ohlcv = fake_fetch_ohlcv
+    fetcher.binance.milliseconds = lambda: now["ms"]
+
+    df = fetcher.get_historical_data("BTCUSDT", "1h", 50)
+    assert len(df) == 50 and calls[-1] == (None, 50)
+
+    now["ms"] += 2 * HOUR_MS
+    df = fetcher.get_historical_data("BTCUSDT", "1h", 50)
+    since, limit = calls[-1]
+    assert since == 99 * HOUR_MS and limit < 10
+    assert len(df) == 50
+    assert df.index[-1].value // 10**6 == 101 * HOUR_MS
+
+def test_newly_listed_symbol_is_not_refetched():
+    print("🆕 Yeni listelenmiş sembol artımlı çekme testi...")
+    root = tempfile.mkdtemp()
+    fetcher = DataFetcher(store_dir=os.path.join(root, "ohlcv"), use_cache=False)
+    fetcher.backfiller.checkpoint_dir = os.path.join(root, "backfill")
+    calls = []
+    rewrites = []
+    listing = 60
+    now = {"ms": 99 * HOUR_MS + 10}
+
+    def fake_fetch_ohlcv(symbol, timeframe='1h', since=None, limit=100):
+        calls.append((since, limit))
+        last = now["ms"] // HOUR_MS
+        first = max(listing, last - limit + 1 if since is None else since // HOUR_MS)
+        return make_bars(first, min(limit, last - first + 1))
+
+    original_rewrite = fetcher.ohlcv_store._rewrite_merged
+    fetcher.ohlcv_store._rewrite_merged = lambda *args: rewrites.append(args) or original_rewrite(*args)
+    fetcher.binance.fetch_ohlcv = fake_fetch_ohlcv
+    fetcher.binance.milliseconds = lambda: now["ms"]
+
+    df = fetcher.get_historical_data("NEWUSDT", "1h", 100)
+    assert len(df) == 40 and calls[-1] == (None, 100)
+    assert fetcher.backfiller.history_start("NEWUSDT", "1h") == listing * HOUR_MS
+
+    # Depodaki bar sayısı limitin altında kalsa da yalnızca yeni barlar istenir
+    for step in range(3):
+        now["ms"] += HOUR_MS
+        df = fetcher.get_historical_data("NEWUSDT", "1h", 100)
+        since, limit = calls[-1]
+        assert since == (99 + step) * HOUR_MS and limit < 10
+        assert len(df) == 41 + step
+    assert not rewrites
+
+def test_long_absence_does_not_leave_gap():
+    print("🕳️ Uzun aradan sonra boşluksuz seri testi...")
+    fetcher = DataFetcher(store_dir=tempfile.mkdtemp(), use_cache=False)
+    now = {"ms": 499 * HOUR_MS + 10}
+
+    def fake_fetch_ohlcv(symbol, timeframe='1h', since=None, limit=100):
+        last = now["ms"] // HOUR_MS
+        first = last - limit + 1 if since is None else since // HOUR_MS
+        return make_bars(first, min(limit, last - first + 1))
+
+    fetcher.binance.fetch_ohlcv = fake_fetch_ohlcv
+    fetcher.binance.milliseconds = lambda: now["ms"]
+
+    fetcher.get_historical_data("BTCUSDT", "1h", 100)
+    # limit'ten uzun süre uzak kalındı: son 100 bar eski serinin ardına eklenmemeli
+    now["ms"] += 300 * HOUR_MS
+    fetcher.get_historical_data("BTCUSDT", "1h", 100)
+    df = fetcher.get_historical_data("BTCUSDT", "1h", 150)
+
+    assert len(df) == 150
+    diffs = np.diff(df.index.as_unit("ms").asi8)
+    assert set(diffs.tolist()) == {HOUR_MS}, sorted(set(diffs.tolist()))
+    assert df.index[-1].value // 10**6 == 799 * HOUR_MS
+
+if __name__ == "__main__":
+    test_append_and_window_read()
+    test_forming_bar_is_updated_in_place()
+    test_older_bars_are_merged()
+    test_incremental_fetch_requests_only_new_bars()
+    test_newly_listed_symbol_is_not_refetched()
+    test_long_absence_does_not_leave_gap()
+    print("✅ OHLCV store testi tamamlandı!")
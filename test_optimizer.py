@@ -0,0 +1,105 @@
+import sys
+import os
+import time
+import shutil
+import tempfile
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from backtest.engine import Backtester
+from backtest.optimizer import (ParameterOptimizer, SharedOHLCV, grid, random_search, walk_forward_splits)
+from strategies.scalp_strategy import ScalpStrategy
+from strategies.swing_strategy import SwingStrategy
+from synthetic_data import make_data
+
+MARKET = dict(seed=5, open_from_previous=True)
+
+SPACE = {'rsi_overbought': [70, 75, 80], 'rsi_oversold': [20, 25, 30], 'fast_ma': [3, 5], 'slow_ma': [10, 20]}
+
+def test_strategy_parameters():
+    print("🎛️ Strateji parametreleri testi...")
+    default, tuned = SwingStrategy(), SwingStrategy(bb_period=30, bb_std=2.5, rsi_period=10)
+    assert default.indicators == ['rsi(14)', 'macd(12,26,9)', 'sma(20)', 'sma(50)', 'bb(20,2)']
+    assert 'bb(30,2.5)' in tuned.indicators and 'rsi(10)' in tuned.indicators
+    assert tuned.get_parameters()['params']['bb_std'] == 2.5
+    try:
+        ScalpStrategy(rsi_threshold=10)
+        assert False
+    except ValueError:
+        pass
+
+    data = make_data(300, **MARKET)
+    strategy = ScalpStrategy(rsi_overbought=60, rsi_oversold=40, macd_fast=4, slow_ma=15)
+    series = strategy.signal_series(data)
+    for t in range(250, 300):
+        expected = strategy.generate_signal(data.iloc[:t + 1])
+        assert series['signal'].iloc[t] == {"BUY": 1, "SELL": -1, "HOLD": 0}[expected["signal"]]
+        assert abs(series['confidence'].iloc[t] - expected["confidence"]) < 1e-12
+
+def test_search_spaces_and_splits():
+    print("🧭 Arama uzayı ve walk-forward testi...")
+    assert len(grid(SPACE)) == 36
+    samples = random_search(SPACE, 10, seed=1)
+    assert len(samples) == 10 and len({tuple(sorted(p.items())) for p in samples}) == 10
+    assert len(random_search(SPACE, 100)) == 36
+
+    splits = walk_forward_splits(1000, 4)
+    assert splits[0] == ((0, 200), (200, 400)) and splits[-1] == ((0, 800), (800, 1000))
+    assert walk_forward_splits(1000, 4, anchored=False)[2] == ((400, 600), (600, 800))
+
+    data = make_data(50, tz="Europe/Istanbul", **MARKET)
+    with SharedOHLCV(data) as shared:
+        shm, attached = SharedOHLCV.attach(shared.descriptor)
+        pd.testing.assert_frame_equal(attached, data[attached.columns], check_freq=False)
+        del attached
+        shm.close()
+
+def test_parallel_sweep_and_cache():
+    print("⚙️ Paralel tarama ve disk önbelleği testi...")
+    data = make_data(3000, **MARKET)
+    cache_dir = tempfile.mkdtemp()
+    try:
+        serial = ParameterOptimizer('scalp', SPACE, n_splits=3, max_workers=1, cache_dir=None).run(data)
+        parallel = ParameterOptimizer('scalp', SPACE, n_splits=3, max_workers=2, cache_dir=cache_dir)
+        first = parallel.run(data)
+        pd.testing.assert_frame_equal(serial['trials'], first['trials'])
+        assert first['best_params'] == serial['best_params']
+        assert len(first['folds']) == 3 and 'sharpe' in first['out_of_sample']
+        assert first['cache'] == {"hits": 0, "misses": 36}
+
+        again = ParameterOptimizer('scalp', SPACE, n_splits=3, max_workers=2, cache_dir=cache_dir).run(data)
+        assert again['cache'] == {"hits": 36, "misses": 0}
+        pd.testing.assert_frame_equal(again['trials'], first['trials'])
+
+        # Farklı maliyet ayarları ayrı önbellek anahtarı kullanır
+        costly = ParameterOptimizer('scalp', SPACE, backtester=Backtester(fee_rate=0.01), n_splits=3,
+                                    max_workers=1, cache_dir=cache_dir).run(data, method='random', n_trials=5)
+        assert costly['cache']['misses'] == 5
+
+        bayesian = ParameterOptimizer('scalp', SPACE, max_workers=1, cache_dir=None).run(
+            data, method='bayesian', n_trials=20, batch_size=4)
+        assert len(bayesian['trials']) == 20 and bayesian['trials']['score'].is_monotonic_decreasing
+        print(f"  En iyi: {first['best_params']} skor {first['best_score']:.3f}, "
+              f"OOS {first['out_of_sample']}")
+    finally:
+        shutil.rmtree(cache_dir)
+
+def benchmark_scaling():
+    print("⏱️ Çekirdek sayısına göre ölçekleme...")
+    data = make_data(200000, freq="min", **MARKET)
+    space = {'rsi_overbought': [70, 75, 80, 85], 'rsi_oversold': [15, 20, 25, 30], 'slow_ma': [10, 20]}
+    timings = {}
+    for workers in sorted({1, 2, os.cpu_count() or 1}):
+        optimizer = ParameterOptimizer('scalp', space, max_workers=workers, cache_dir=None)
+        start = time.perf_counter()
+        optimizer.run(data)
+        timings[workers] = time.perf_counter() - start
+        print(f"  {workers} worker: {timings[workers]:.2f}s ({timings[1] / timings[workers]:.1f}x)")
+
+if __name__ == "__main__":
+    test_strategy_parameters()
+    test_search_spaces_and_splits()
+    test_parallel_sweep_and_cache()
+    benchmark_scaling()
+    print("✅ Parametre optimizasyonu testi tamamlandı!")
@@ -0,0 +1,87 @@
+import time
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from analysis.technical_analyzer import TechnicalAnalyzer
+from analysis.panel_indicators import IndicatorPanel
+
+TOLERANCE = 1e-6
+
+def make_frames(symbols=300, bars=500, seed=3):
+    # Farklı uzunlukta geçmişler: yeni listelenen semboller daha kısa
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2024-01-01", periods=bars, freq="h")
+    frames = {}
+    for i in range(symbols):
+        n = bars if i % 3 else int(rng.integers(60, bars))
+        start_price = rng.uniform(0.1, 50000)
+        close = start_price * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+        spread = np.abs(rng.normal(0, 0.004, n)) * close
+        frames[f"SYM{i}USDT"] = pd.DataFrame({
+            'open': close, 'high': close + spread, 'low': close - spread,
+            'close': close, 'volume': rng.uniform(1, 10, n)
+        }, index=index[-n:])
+    return frames
+
+def per_symbol(analyzer, df):
+    macd, macd_signal, macd_histogram = analyzer.calculate_macd(df)
+    upper, middle, lower = analyzer.calculate_bollinger_bands(df)
+    k, d = analyzer.calculate_stochastic(df)
+    results = {
+        'rsi': analyzer.calculate_rsi(df),
+        'macd': macd, 'macd_signal': macd_signal, 'macd_histogram': macd_histogram,
+        'bollinger_upper': upper, 'bollinger_middle': middle, 'bollinger_lower': lower,
+        'stochastic_k': k, 'stochastic_d': d
+    }
+    results.update(analyzer.calculate_moving_averages(df, [20, 50]))
+    return results
+
+def test_panel_matches_per_symbol():
+    print("🧮 Panel göstergeleri ↔ sembol bazlı hesaplama testi...")
+    frames = make_frames(symbols=30)
+    analyzer = TechnicalAnalyzer()
+    panel = IndicatorPanel.from_frames(frames).compute_all()
+    for symbol, df in frames.items():
+        for name, expected in per_symbol(analyzer, df).items():
+            actual = panel[name][symbol].loc[df.index].to_numpy()
+            expected = expected.to_numpy()
+            assert np.array_equal(np.isnan(actual), np.isnan(expected)), f"{symbol} {name}: NaN konumları farklı"
+            mask = ~np.isnan(expected)
+            scale = np.maximum(np.abs(expected[mask]), 1.0)
+            assert np.all(np.abs(actual[mask] - expected[mask]) / scale < TOLERANCE), f"{symbol} {name}"
+        # Kısa geçmişin öncesi tamamen NaN kalmalı
+        assert panel['sma_20'][symbol].loc[:df.index[0]].iloc[:-1].isna().all()
+    print(f"  {len(frames)} sembol eşleşti")
+
+def test_latest_screen():
+    frames = make_frames(symbols=10, bars=120)
+    latest = IndicatorPanel.from_frames(frames).latest()
+    assert list(latest.index) == list(frames)
+    assert {'rsi', 'macd', 'sma_50', 'stochastic_d'} <= set(latest.columns)
+
+def benchmark_universe(symbols=300, bars=500):
+    """
+    Sembol döngüsü ile tek geçişli panel hesaplamasının karşılaştırması
+    """
+    frames = make_frames(symbols, bars)
+    analyzer = TechnicalAnalyzer()
+    started = time.perf_counter()
+    for df in frames.values():
+        per_symbol(analyzer, df)
+    loop = time.perf_counter() - started
+
+    panel = IndicatorPanel.from_frames(frames)
+    started = time.perf_counter()
+    panel.compute_all()
+    vectorized = time.perf_counter() - started
+    print(f"  {symbols} sembol × {bars} bar: döngü {loop * 1000:.0f} ms, panel {vectorized * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    test_panel_matches_per_symbol()
+    test_latest_screen()
+    benchmark_universe()
+    print("✅ Panel gösterge testi tamamlandı!")
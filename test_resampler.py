@@ -0,0 +1,105 @@
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+import numpy as np
+import pandas as pd
+from data.resampler import resample_ohlcv, IncrementalResampler
+from data.ohlcv_store import columns_to_dataframe
+from data.data_fetcher import DataFetcher
+
+MINUTE_MS = 60000
+
+def make_minute_columns(count, start_ms=7 * MINUTE_MS, seed=1):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 0.5, count))
+    open_ = np.r_[close[0], close[:-1]]
+    high = np.maximum(open_, close) + rng.random(count)
+    low = np.minimum(open_, close) - rng.random(count)
+    return {
+        'timestamp': start_ms + np.arange(count, dtype=np.int64) * MINUTE_MS,
+        'open': open_, 'high': high, 'low': low, 'close': close,
+        'volume': rng.random(count) * 10
+    }
+
+def test_matches_pandas_resample():
+    print("📐 pandas resample eşdeğerlik testi...")
+    columns = make_minute_columns(3000)
+    minute_df = columns_to_dataframe(columns)
+
+    for timeframe, rule in [('5m', '5min'), ('15m', '15min'), ('1h', '1h'), ('4h', '4h')]:
+        ours = columns_to_dataframe(resample_ohlcv(columns, timeframe))
+        expected = minute_df.resample(rule).agg({
+            'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'
+        }).dropna()
+        assert list(ours.index) == list(expected.index)
+        assert np.allclose(ours.to_numpy(), expected[ours.columns].to_numpy())
+
+def test_incremental_forming_bar_matches_batch():
+    print("🧩 Artımlı üst zaman dilimi testi...")
+    columns = make_minute_columns(200, seed=3)
+    resampler = IncrementalResampler(['5m', '1h'])
+
+    for i in range(200):
+        bar = [columns[col][i] for col in ['timestamp', 'open', 'high', 'low', 'close', 'volume']]
+        # Oluşan bar önce yarım, sonra kapanmış olarak gelir
+        resampler.update(int(bar[0]), bar[1], bar[1], bar[1], bar[1], bar[5] / 2, closed=False)
+        resampler.update(int(bar[0]), *bar[1:], closed=True)
+
+    for timeframe in ['5m', '1h']:
+        batch = resample_ohlcv(columns, timeframe)
+        last = [batch[col][-1] for col in ['timestamp', 'open', 'high', 'low', 'close', 'volume']]
+        assert np.allclose(resampler.current(timeframe), last)
+        previous = [batch[col][-2] for col in ['timestamp', 'open', 'high', 'low', 'close', 'volume']]
+        assert np.allclose(resampler.completed[timeframe], previous)
+
+def test_resampled_data_pages_without_store():
+    print("📑 Depo olmadan sayfalı taban bar çekme testi...")
+    fetcher = DataFetcher(store_dir=None, use_cache=False)
+    columns = make_minute_columns(8000, start_ms=0)
+    bars = np.column_stack([columns[col] for col in ['timestamp', 'open', 'high', 'low', 'close', 'volume']]).tolist()
+    now = 8000 * MINUTE_MS
+    calls = []
+
+    def fake_fetch_ohlcv(symbol, timeframe='1m', since=None, limit=500):
+        calls.append((since, limit))
+        # Borsa tek istekte en fazla 1000 bar döndürür
+        limit = min(limit, 1000)
+        first = len(bars) - limit if since is None else since // MINUTE_MS
+        return bars[first:first + limit]
+
+    fetcher.binance.fetch_ohlcv = fake_fetch_ohlcv
+    fetcher.binance.milliseconds = lambda: now
+    df = fetcher.get_resampled_data("BTCUSDT", "1h", 100)
+    assert len(df) == 100 and len(calls) == 7
+    expected = resample_ohlcv(columns, '1h')
+    assert np.allclose(df['close'].to_numpy(), expected['close'][-100:])
+    assert pd.DatetimeIndex(df.index).as_unit('ms').asi8[-1] == expected['timestamp'][-1]
+
+def test_long_resample_falls_back_to_native_timeframe():
+    print("📆 Uzun üst zaman dilimi için doğrudan çekme testi...")
+    fetcher = DataFetcher(store_dir=None, use_cache=False)
+    day_ms = 1440 * MINUTE_MS
+    now = 1000 * day_ms
+    calls = []
+
+    def fake_fetch_ohlcv(symbol, timeframe='1m', since=None, limit=500):
+        calls.append((timeframe, since, limit))
+        step = fetcher.binance.parse_timeframe(timeframe) * 1000
+        last = now // step
+        return [[i * step, 100.0, 101.0, 99.0, 100.5, 1.0] for i in range(last - min(limit, 1000) + 1, last + 1)]
+
+    fetcher.binance.fetch_ohlcv = fake_fetch_ohlcv
+    fetcher.binance.milliseconds = lambda: now
+    # 1d x 200 için ~289 bin 1m bar (~290 sayfa) yerine tek 1d isteği
+    df = fetcher.get_resampled_data("BTCUSDT", "1d", 200)
+    assert len(df) == 200
+    assert calls == [('1d', None, 200)]
+
+if __name__ == "__main__":
+    test_matches_pandas_resample()
+    test_incremental_forming_bar_matches_batch()
+    test_resampled_data_pages_without_store()
+    test_long_resample_falls_back_to_native_timeframe()
+    print("✅ Resampling testi tamamlandı!")
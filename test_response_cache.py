@@ -0,0 +1,124 @@
+import sys
+import os
+import json
+import shutil
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from deepseek.analyzer import DeepSeekAnalyzer
+from deepseek.response_cache import ResponseCache
+
+RESULTS = {
+    'scalp': {'signal': 'BUY', 'confidence': 0.7},
+    'swing': {'signal': 'HOLD', 'confidence': 0.25},
+    'daily': {'signal': 'SELL', 'confidence': 0.55}
+}
+REPLY = json.dumps({"recommendation": "AL", "confidence": 70, "risk_level": "ORTA", "reasoning": "test"})
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+def make_analyzer(cache_dir, clock, reply=REPLY):
+    cache = ResponseCache(max_entries=8, ttl=60, cache_dir=cache_dir, clock=clock)
+    analyzer = DeepSeekAnalyzer(api_key="test-key", response_cache=cache)
+    analyzer.calls = []
+    def query(prompt):
+        analyzer.calls.append(prompt)
+        return reply
+    analyzer._query_deepseek_api = query
+    return analyzer
+
+def test_cache_hits_and_ttl():
+    print("🗃️ LLM yanıt önbelleği testi...")
+    cache_dir = tempfile.mkdtemp()
+    clock = FakeClock()
+    try:
+        analyzer = make_analyzer(cache_dir, clock)
+        first = analyzer.analyze_trading_signals("BTCUSDT", RESULTS, 65000.0)
+        assert first["recommendation"] == "AL" and not first["cached"]
+
+        # Aynı fiyat kovası ve aynı sinyaller: API çağrılmaz
+        second = analyzer.analyze_trading_signals("BTCUSDT", RESULTS, 65010.0)
+        assert second["cached"] and second["analysis"] == first["analysis"]
+        assert len(analyzer.calls) == 1
+
+        # Sinyal, sembol veya fiyat kovası değişince yeni sorgu
+        changed = dict(RESULTS, swing={'signal': 'BUY', 'confidence': 0.5})
+        analyzer.analyze_trading_signals("BTCUSDT", changed, 65000.0)
+        analyzer.analyze_trading_signals("ETHUSDT", RESULTS, 65000.0)
+        analyzer.analyze_trading_signals("BTCUSDT", RESULTS, 66000.0)
+        assert len(analyzer.calls) == 4
+
+        # Süresi dolan kayıt yeniden sorgulanır
+        clock.now += 61
+        assert not analyzer.analyze_trading_signals("BTCUSDT", RESULTS, 65000.0)["cached"]
+        assert len(analyzer.calls) == 5
+        stats = analyzer.get_cache_stats()
+        assert stats["hits"] == 1 and stats["expired"] == 1
+        print(f"  {stats}")
+    finally:
+        shutil.rmtree(cache_dir)
+
+def test_disk_persistence_and_lru():
+    cache_dir = tempfile.mkdtemp()
+    clock = FakeClock()
+    try:
+        make_analyzer(cache_dir, clock).analyze_trading_signals("BTCUSDT", RESULTS, 65000.0)
+        restarted = make_analyzer(cache_dir, clock)
+        assert restarted.analyze_trading_signals("BTCUSDT", RESULTS, 65000.0)["cached"]
+        assert restarted.calls == [] and restarted.get_cache_stats()["disk_hits"] == 1
+
+        memory = ResponseCache(max_entries=2, cache_dir=None, clock=clock)
+        for key in "abc":
+            memory.put(key, key.upper())
+        assert memory.get("a") is None and memory.get("c") == "C"
+
+        # Ayrıştırılamayan yanıt önbelleğe yazılmaz
+        broken = make_analyzer(None, clock, reply="model hatası")
+        broken.analyze_trading_signals("BTCUSDT", RESULTS, 65000.0)
+        broken.analyze_trading_signals("BTCUSDT", RESULTS, 65000.0)
+        assert len(broken.calls) == 2
+    finally:
+        shutil.rmtree(cache_dir)
+
+def test_disk_limit_and_startup_sweep():
+    print("🧹 Disk sınırı ve açılış temizliği testi...")
+    cache_dir = tempfile.mkdtemp()
+    clock = FakeClock()
+    try:
+        def disk_keys():
+            return sorted(name[:-5] for _, _, names in os.walk(cache_dir) for name in names)
+
+        cache = ResponseCache(max_entries=3, ttl=60, cache_dir=cache_dir, clock=clock)
+        for i, key in enumerate(["k1", "k2", "k3", "k4", "k5"]):
+            clock.now = 1000.0 + i
+            cache.put(key, i)
+        # Diskte de en fazla max_entries dosya; en eskiler silinir
+        assert disk_keys() == ["k3", "k4", "k5"]
+        assert cache.stats()["evicted"] == 2 and cache.stats()["disk_entries"] == 3
+
+        # Süresi dolan dosyalar ve yarım kalmış yazımlar açılışta silinir
+        with open(os.path.join(cache_dir, "k3"[:2], "k3.json.tmp"), "w") as f:
+            f.write("{")
+        clock.now = 1063.5
+        restarted = ResponseCache(max_entries=3, ttl=60, cache_dir=cache_dir, clock=clock)
+        assert disk_keys() == ["k5"] and restarted.stats()["expired"] == 2
+        assert restarted.get("k5") == 4
+
+        # Açılışta sınırın üzerindeki dosyalar da eskiden yeniye silinir
+        smaller = ResponseCache(max_entries=1, ttl=60, cache_dir=cache_dir, clock=clock)
+        smaller.put("k6", 6)
+        assert disk_keys() == ["k6"]
+    finally:
+        shutil.rmtree(cache_dir)
+
+if __name__ == "__main__":
+    test_cache_hits_and_ttl()
+    test_disk_persistence_and_lru()
+    test_disk_limit_and_startup_sweep()
+    print("✅ LLM yanıt önbelleği testi tamamlandı!")
@@ -0,0 +1,148 @@
+import sys
+import os
+import time
+import threading
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from strategies.strategy_manager import StrategyManager
+from strategies.signal_scheduler import SignalScheduler
+from synthetic_data import make_data
+
+HOUR = 3600
+
+def bar_open(data, i):
+    return pd.Timestamp(data.index[i]).value / 1e9
+
+def test_evaluates_only_on_close():
+    print("⏰ Mum kapanışı zamanlayıcı testi...")
+    full = make_data(seed=3)
+    scheduler = SignalScheduler(StrategyManager())
+    events = scheduler.subscribe_queue()
+
+    data = full.iloc[:250]
+    now = bar_open(data, -1) + 60  # Son bar oluşuyor
+    signals = scheduler.on_data("BTCUSDT", "1h", data, now=now)
+    assert signals == StrategyManager().analyze_symbol("BTCUSDT", data.iloc[:-1])
+    assert scheduler.get_stats()["evaluations"] == 1
+    assert events.qsize() == 3 and events.get()["previous"] is None
+
+    # Aynı mum içinde tekrar çağrılar strateji çalıştırmaz
+    for offset in range(10):
+        assert scheduler.on_data("BTCUSDT", "1h", data, now=now + offset * 60) == signals
+    assert scheduler.get_stats()["evaluations"] == 1 and scheduler.get_stats()["skipped"] == 10
+
+    # Mum kapanınca yeniden değerlendirilir
+    scheduler.on_data("BTCUSDT", "1h", data, now=bar_open(data, -1) + HOUR)
+    assert scheduler.get_stats()["evaluations"] == 2
+
+def test_change_events_and_intrabar():
+    print("📣 Sinyal değişimi ve bar içi değerlendirme testi...")
+    full = make_data(seed=3)
+    scheduler = SignalScheduler(StrategyManager(), intrabar_intervals={'scalp': 30})
+    received = []
+    scheduler.subscribe(received.append)
+
+    changes = 0
+    previous = {}
+    for end in range(220, 300):
+        data = full.iloc[:end]
+        scheduler.on_data("ETHUSDT", "1h", data, now=bar_open(data, -1) + 10)
+        current = scheduler.signals("ETHUSDT", "1h")
+        changes += sum(1 for name, result in current.items()
+                       if previous.get(name, {}).get("signal") != result["signal"])
+        previous = {name: dict(result) for name, result in current.items()}
+    assert len(received) == changes > 3
+    assert all(event["previous"] != event["signal"] for event in received)
+
+    # Oluşan bar değişince scalp en fazla 30 saniyede bir yeniden çalışır
+    data = full.iloc[:300].copy()
+    start = bar_open(data, -1)
+    close = data.columns.get_loc('close')
+    scheduler.on_data("ETHUSDT", "1h", data, now=start + 5)
+    before = scheduler.get_stats()["intrabar_evaluations"]
+    expected = [(10, True, before + 1), (20, True, before + 1), (45, True, before + 2), (90, False, before + 2)]
+    for offset, change, count in expected:
+        if change:
+            data.iloc[-1, close] *= 1.01
+        scheduler.on_data("ETHUSDT", "1h", data, now=start + offset)
+        assert scheduler.get_stats()["intrabar_evaluations"] == count, offset
+    # Oluşan bar güncellemeleri önbellekteki öneki kullanır; EMA tabanlılar tail_tolerance içinde
+    actual = scheduler.signals("ETHUSDT", "1h")['scalp']
+    expected = StrategyManager().analyze_symbol("ETHUSDT", data, ['scalp'])['scalp']
+    assert actual['signal'] == expected['signal'] and abs(actual['confidence'] - expected['confidence']) < 1e-9
+    for name, value in expected['indicators'].items():
+        assert abs(actual['indicators'][name] - value) < 1e-6, name
+
+def test_update_many():
+    frames = {f"SYM{i}USDT": make_data(seed=i) for i in range(5)}
+    frames["EMPTYUSDT"] = pd.DataFrame()
+    scheduler = SignalScheduler(StrategyManager())
+    now = bar_open(frames["SYM0USDT"], -1) + 60
+    first = scheduler.update_many(frames, "1h", now=now, executor='serial')
+    assert len(first["evaluated"]) == 5 and first["errors"] == {"EMPTYUSDT": "Veri yok"}
+    second = scheduler.update_many(frames, "1h", now=now + 60, executor='serial')
+    assert second["evaluated"] == [] and second["results"] == first["results"]
+
+def test_concurrent_callers_evaluate_bar_once():
+    print("🔒 Eşzamanlı çağrılarda tek değerlendirme testi...")
+
+    class SlowManager(StrategyManager):
+        def __init__(self):
+            super().__init__()
+            self.calls = 0
+            self.fail = False
+
+        def analyze_symbol(self, symbol, data, strategies=None):
+            self.calls += 1
+            time.sleep(0.05)
+            if self.fail:
+                raise RuntimeError("strateji hatası")
+            return super().analyze_symbol(symbol, data, strategies)
+
+    manager = SlowManager()
+    scheduler = SignalScheduler(manager)
+    data = make_data(seed=3).iloc[:250]
+    now = bar_open(data, -1) + 60
+    threads = [threading.Thread(target=scheduler.on_data, args=("BTCUSDT", "1h", data, now)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert manager.calls == 1 and scheduler.get_stats()["skipped"] == 7
+
+    # Başarısız değerlendirme bar işaretini geri alır; sonraki çağrı yeniden dener
+    manager.fail = True
+    closed = bar_open(data, -1) + HOUR
+    try:
+        scheduler.on_data("BTCUSDT", "1h", data, now=closed)
+        assert False, "Strateji hatası bekleniyordu"
+    except RuntimeError:
+        pass
+    manager.fail = False
+    scheduler.on_data("BTCUSDT", "1h", data, now=closed)
+    assert manager.calls == 3 and scheduler.get_stats()["evaluations"] == 2
+
+def benchmark_between_candles():
+    print("⏱️ Mumlar arası tekrar çağrı maliyeti...")
+    frames = {f"SYM{i}USDT": make_data(seed=i) for i in range(50)}
+    scheduler = SignalScheduler(StrategyManager(tail_only=True))
+    now = bar_open(frames["SYM0USDT"], -1) + 60
+    start = time.perf_counter()
+    scheduler.update_many(frames, "1h", now=now, executor='serial')
+    evaluate = time.perf_counter() - start
+    start = time.perf_counter()
+    for i in range(10):
+        scheduler.update_many(frames, "1h", now=now + i)
+    repeat = (time.perf_counter() - start) / 10
+    print(f"  İlk değerlendirme: {evaluate*1000:.1f}ms, mum içi tekrar: {repeat*1000:.2f}ms")
+    assert repeat < evaluate
+
+if __name__ == "__main__":
+    test_evaluates_only_on_close()
+    test_change_events_and_intrabar()
+    test_update_many()
+    test_concurrent_callers_evaluate_bar_once()
+    benchmark_between_candles()
+    print("✅ Sinyal zamanlayıcı testi tamamlandı!")
@@ -0,0 +1,142 @@
+import time
+import threading
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from data.data_fetcher import DataFetcher
+from data.exchange_simulator import start_simulated_environment
+
+SYMBOLS = ["BTCUSDT", "ETHUSDT", "ADAUSDT"]
+
+def client_thread_count():
+    # Simülatörün bağlantı başına açtığı sunucu thread'leri sayılmaz
+    return sum(1 for t in threading.enumerate() if "_serve" not in t.name and "_emit_loop" not in t.name)
+
+def make_fetcher(streams, exchange):
+    fetcher = DataFetcher(store_dir=None, exchange=exchange, stream_base_url=streams.base_url, max_streams=4)
+    fetcher.stream_supervisor.backoff_base = 0.05
+    fetcher.stream_supervisor.backoff_max = 0.2
+    return fetcher
+
+def test_reconnects_keep_threads_flat():
+    print("🔌 Zorunlu kopma / yeniden bağlanma testi...")
+    exchange, streams = start_simulated_environment(SYMBOLS, messages_per_second=500, disconnect_every=0.5)
+    fetcher = make_fetcher(streams, exchange)
+    try:
+        fetcher.start_real_time_data(SYMBOLS, combined=False)
+        time.sleep(1.0)
+        threads_before = client_thread_count()
+        time.sleep(3.0)
+        threads_after = client_thread_count()
+
+        stats = fetcher.get_stream_stats()
+        assert set(stats) == set(SYMBOLS)
+        assert all(s['reconnects'] >= 3 for s in stats.values())
+        assert all(s['last_message_age'] is not None and s['last_message_age'] < 1.0 for s in stats.values())
+        # İstemci tarafı sabit kalmalı: akış + ping thread'i başına en fazla bir fark
+        assert threads_after <= threads_before + len(SYMBOLS)
+        print(f"  thread: {threads_before} → {threads_after}, yeniden bağlanma: "
+              f"{[s['reconnects'] for s in stats.values()]}")
+    finally:
+        fetcher.stop_all_connections()
+        streams.stop()
+
+def test_combined_stream_resubscribes_after_disconnect():
+    print("🔁 Combined abonelik yenileme testi...")
+    exchange, streams = start_simulated_environment(SYMBOLS, messages_per_second=500)
+    fetcher = make_fetcher(streams, exchange)
+    try:
+        fetcher.start_real_time_data(SYMBOLS, max_connections=1)
+        time.sleep(0.5)
+        streams.disconnect_all()
+        time.sleep(0.3)
+        before = {symbol: fetcher.tick_buffers[symbol].total_ticks for symbol in SYMBOLS}
+        time.sleep(1.0)
+        for symbol in SYMBOLS:
+            assert fetcher.tick_buffers[symbol].total_ticks > before[symbol]
+        stats = fetcher.get_stream_stats()
+        assert list(stats.values())[0]['reconnects'] >= 1
+        assert streams.total_connections == 2
+    finally:
+        fetcher.stop_all_connections()
+        streams.stop()
+
+def server_streams(streams):
+    # Simülatörün tek combined bağlantıda abone tuttuğu stream'ler
+    assert len(streams.connections) == 1
+    return set(streams.connections[0].streams)
+
+def test_runtime_subscribe_unsubscribe_without_reconnect():
+    print("➕ Çalışma anında abone ekleme/çıkarma testi...")
+    exchange, streams = start_simulated_environment(SYMBOLS, messages_per_second=500)
+    fetcher = make_fetcher(streams, exchange)
+    try:
+        fetcher.start_real_time_data(["BTCUSDT"], max_connections=1)
+        time.sleep(0.5)
+        assert server_streams(streams) == {"btcusdt@ticker"}
+
+        # SUBSCRIBE aynı bağlantı üzerinden gider; yeni bağlantı açılmaz
+        fetcher.add_real_time_symbols(["ETHUSDT", "ADAUSDT"])
+        time.sleep(0.5)
+        assert server_streams(streams) == {"btcusdt@ticker", "ethusdt@ticker", "adausdt@ticker"}
+        assert all(fetcher.tick_buffers[symbol].total_ticks > 0 for symbol in SYMBOLS)
+
+        fetcher.remove_real_time_symbols(["ETHUSDT"])
+        time.sleep(0.3)
+        assert server_streams(streams) == {"btcusdt@ticker", "adausdt@ticker"}
+        # Kapanmadan önce yoldaki mesajlar tamponu yeniden açabilir; temizleyip akışın durduğunu doğrula
+        fetcher.tick_buffers.pop("ETHUSDT", None)
+        before = fetcher.tick_buffers["ADAUSDT"].total_ticks
+        time.sleep(0.5)
+        assert "ETHUSDT" not in fetcher.tick_buffers
+        assert fetcher.tick_buffers["ADAUSDT"].total_ticks > before
+        assert streams.total_connections == 1
+
+        # Kopmadan sonra yalnızca güncel abonelikler yeniden gönderilir
+        streams.disconnect_all()
+        time.sleep(0.5)
+        assert streams.total_connections == 2
+        assert server_streams(streams) == {"btcusdt@ticker", "adausdt@ticker"}
+        before = fetcher.tick_buffers["ADAUSDT"].total_ticks
+        time.sleep(0.5)
+        assert fetcher.tick_buffers["ADAUSDT"].total_ticks > before
+        assert "ETHUSDT" not in fetcher.tick_buffers
+    finally:
+        fetcher.stop_all_connections()
+        streams.stop()
+
+def test_stream_limit_is_enforced():
+    print("🚧 Akış limiti testi...")
+    fetcher = DataFetcher(store_dir=None, max_streams=2)
+    fetcher.stream_base_url = "ws://127.0.0.1:9"
+    try:
+        fetcher.start_real_time_data(["AUSDT", "BUSDT"], combined=False)
+        try:
+            fetcher.start_real_time_data(["CUSDT"], combined=False)
+            assert False, "limit aşılmamalıydı"
+        except ValueError:
+            pass
+    finally:
+        fetcher.stop_all_connections()
+
+def test_multiplexer_connection_count_is_fixed():
+    print("🔗 Combined bağlantı sayısı testi...")
+    fetcher = DataFetcher(store_dir=None)
+    multiplexer = fetcher._get_multiplexer(1)
+    assert fetcher._get_multiplexer() is multiplexer and fetcher._get_multiplexer(1) is multiplexer
+    try:
+        fetcher._get_multiplexer(3)
+        assert False, "farklı bağlantı sayısı reddedilmeliydi"
+    except ValueError:
+        pass
+    assert len(multiplexer.connections) == 1
+
+if __name__ == "__main__":
+    test_reconnects_keep_threads_flat()
+    test_combined_stream_resubscribes_after_disconnect()
+    test_runtime_subscribe_unsubscribe_without_reconnect()
+    test_stream_limit_is_enforced()
+    test_multiplexer_connection_count_is_fixed()
+    print("✅ Akış denetleyici testi tamamlandı!")
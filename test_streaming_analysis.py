@@ -0,0 +1,185 @@
+import sys
+import os
+import json
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from deepseek.analyzer import DeepSeekAnalyzer
+from deepseek.response_cache import ResponseCache
+from deepseek.streaming import IncrementalJSONFields, iter_sse_content
+
+RESULTS = {
+    'scalp': {'signal': 'BUY', 'confidence': 0.7},
+    'swing': {'signal': 'HOLD', 'confidence': 0.25},
+    'daily': {'signal': 'SELL', 'confidence': 0.55}
+}
+ANALYSIS = {
+    "recommendation": "AL",
+    "confidence": 72,
+    "risk_level": "ORTA",
+    "reasoning": "Kısa vadeli momentum güçlü, \"hacim\" artıyor; {direnç} 67k civarında.",
+    "market_context": "Piyasa genelinde [yükseliş] eğilimi",
+    "price_targets": {"short_term": "66500", "medium_term": "69000", "stop_loss": "63000"}
+}
+REPLY = "```json\n" + json.dumps(ANALYSIS, ensure_ascii=False, indent=2) + "\n```"
+
+class StreamingMock:
+    """
+    SSE ile parça parça yanıt veren sunucu; karar alanlarından sonra gerekçe yavaş gelir
+    """
+    def __init__(self, reply=REPLY, chunk_size=12, slow_after="reasoning", delay=0.02):
+        self.requests = []
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            wbufsize = -1
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                mock.requests.append(body)
+                if not body.get("stream"):
+                    time.sleep(delay * len(reply) / chunk_size / 2)
+                    data = json.dumps({"choices": [{"message": {"content": reply}}]}).encode()
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                slow_from = reply.find(slow_after)
+                for start in range(0, len(reply), chunk_size):
+                    if start >= slow_from:
+                        time.sleep(delay)
+                    event = {"choices": [{"delta": {"content": reply[start:start + chunk_size]}}]}
+                    self.wfile.write(f"data: {json.dumps(event, ensure_ascii=False)}\n\n".encode())
+                    self.wfile.flush()
+                self.wfile.write(b"data: [DONE]\n\n")
+                self.wfile.flush()
+                self.close_connection = True
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/v1"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+def make_analyzer(mock):
+    return DeepSeekAnalyzer(api_key="test-key", base_url=mock.url, response_cache=ResponseCache(cache_dir=None),
+                            requests_per_minute=60000)
+
+def test_incremental_json_fields():
+    print("🧩 Artımlı JSON alan çıkarımı testi...")
+    for size in (1, 3, 7, len(REPLY)):
+        extractor = IncrementalJSONFields()
+        emitted = []
+        for start in range(0, len(REPLY), size):
+            emitted.extend(extractor.feed(REPLY[start:start + size]))
+        assert emitted == list(ANALYSIS.items()), size
+        assert extractor.done and extractor.fields == ANALYSIS
+
+    # Alanlar tamamlandığı anda çıkar; sonraki alan beklenmez
+    extractor = IncrementalJSONFields()
+    prefix = REPLY[:REPLY.index('"reasoning"')]
+    assert [field for field, _ in extractor.feed(prefix)] == ["recommendation", "confidence", "risk_level"]
+    assert extractor.has(("recommendation", "confidence", "risk_level")) and not extractor.done
+
+    lines = [
+        ": yorum",
+        'data: {"choices": [{"delta": {"role": "assistant"}}]}',
+        "",
+        'data: {"choices": [{"delta": {"content": "{\\"a\\""}}]}',
+        'data: {"choices": [{"delta": {"content": ": 1}"}}]}'.encode(),
+        "data: [DONE]",
+        'data: {"choices": [{"delta": {"content": "sonra"}}]}'
+    ]
+    assert "".join(iter_sse_content(lines)) == '{"a": 1}'
+
+def test_streaming_analysis_early_verdict():
+    print("⚡ Akışlı analizde erken karar testi...")
+    mock = StreamingMock()
+    try:
+        analyzer = make_analyzer(mock)
+        events = list(analyzer.analyze_trading_signals_stream("BTCUSDT", RESULTS, 65000.0))
+        kinds = [event["type"] for event in events]
+        assert kinds.count("verdict") == 1 and kinds[-1] == "result"
+        verdict = next(event for event in events if event["type"] == "verdict")
+        assert (verdict["recommendation"], verdict["confidence"], verdict["risk_level"]) == ("AL", 72, "ORTA")
+        # Karar, gerekçe alanından önce gelir
+        fields = [event.get("field") for event in events]
+        assert kinds.index("verdict") < fields.index("reasoning")
+
+        result = events[-1]["result"]
+        timing = result["timing"]
+        print(f"   İlk parça {timing['first_token']:.3f}s, karar {timing['verdict']:.3f}s, toplam {timing['total']:.3f}s")
+        assert timing["verdict"] < timing["total"] / 2
+        assert mock.requests[-1]["stream"] is True
+
+        # Akışlı ve normal yol aynı sonucu verir; akışlı yanıt önbelleğe yazılır
+        plain = make_analyzer(mock)
+        plain.response_cache = ResponseCache(cache_dir=None)
+        expected = plain.analyze_trading_signals("BTCUSDT", RESULTS, 65000.0)
+        for key in ("recommendation", "confidence", "risk_level", "reasoning", "market_context", "price_targets"):
+            assert result[key] == expected[key], key
+        assert mock.requests[-1]["stream"] is False
+
+        count = len(mock.requests)
+        cached = list(analyzer.analyze_trading_signals_stream("BTCUSDT", RESULTS, 65000.0))
+        assert [event["type"] for event in cached] == ["verdict", "result"]
+        assert cached[-1]["result"]["cached"] and len(mock.requests) == count
+    finally:
+        mock.close()
+
+def test_streaming_fallback_and_errors():
+    print("🛟 Akışlı analiz yedek/hata testi...")
+    mock = StreamingMock(reply="Model JSON üretmedi")
+    try:
+        analyzer = make_analyzer(mock)
+        events = list(analyzer.analyze_trading_signals_stream("BTCUSDT", RESULTS, 65000.0))
+        assert [event["type"] for event in events] == ["verdict", "result"]
+        assert events[-1]["result"]["recommendation"] == "BEKLE"
+    finally:
+        mock.close()
+
+    analyzer = DeepSeekAnalyzer(api_key="test-key", base_url=mock.url, response_cache=ResponseCache(cache_dir=None))
+    try:
+        list(analyzer.analyze_trading_signals_stream("BTCUSDT", RESULTS, 65000.0))
+        assert False, "Bağlantı hatası bekleniyordu"
+    except ConnectionError as e:
+        assert "bağlantı hatası" in str(e)
+
+def benchmark_time_to_verdict():
+    mock = StreamingMock(delay=0.03)
+    try:
+        analyzer = make_analyzer(mock)
+        start = time.perf_counter()
+        analyzer.analyze_trading_signals("BTCUSDT", RESULTS, 65000.0)
+        blocking = time.perf_counter() - start
+        analyzer.response_cache.clear()
+        for event in analyzer.analyze_trading_signals_stream("BTCUSDT", RESULTS, 65000.0):
+            if event["type"] == "verdict":
+                verdict = event["elapsed"]
+        print(f"📊 İlk kullanılabilir çıktı: tam yanıt {blocking:.2f}s, akışlı karar {verdict:.2f}s")
+    finally:
+        mock.close()
+
+if __name__ == "__main__":
+    test_incremental_json_fields()
+    test_streaming_analysis_early_verdict()
+    test_streaming_fallback_and_errors()
+    benchmark_time_to_verdict()
+    print("✅ Akışlı analiz testi tamamlandı!")
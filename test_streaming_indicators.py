@@ -0,0 +1,85 @@
+import time
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from analysis.technical_analyzer import TechnicalAnalyzer
+from analysis.streaming_indicators import StreamingIndicators
+from synthetic_data import make_data
+
+TOLERANCE = 1e-6
+
+def assert_close(streaming, batch, name):
+    streaming = np.asarray(streaming, dtype=float)
+    batch = np.asarray(batch, dtype=float)
+    assert np.array_equal(np.isnan(streaming), np.isnan(batch)), f"{name}: NaN konumları farklı"
+    mask = ~np.isnan(batch)
+    diff = np.max(np.abs(streaming[mask] - batch[mask])) if mask.any() else 0.0
+    assert diff < TOLERANCE, f"{name}: fark {diff}"
+
+def test_streaming_matches_batch():
+    print("📈 Akış göstergeleri ↔ toplu hesaplama testi...")
+    data = make_data(600, seed=7, datetime_index=False)
+    analyzer = TechnicalAnalyzer()
+    indicators = StreamingIndicators()
+    rows = [indicators.update(bar) for bar in data.to_dict('records')]
+    streaming = pd.DataFrame(rows)
+
+    macd, macd_signal, macd_histogram = analyzer.calculate_macd(data)
+    upper, middle, lower = analyzer.calculate_bollinger_bands(data)
+    k, d = analyzer.calculate_stochastic(data)
+    ma = analyzer.calculate_moving_averages(data, [20, 50])
+    expected = {
+        'rsi': analyzer.calculate_rsi(data),
+        'macd': macd, 'macd_signal': macd_signal, 'macd_histogram': macd_histogram,
+        'bollinger_upper': upper, 'bollinger_middle': middle, 'bollinger_lower': lower,
+        'stochastic_k': k, 'stochastic_d': d,
+        'sma_20': ma['sma_20'], 'sma_50': ma['sma_50']
+    }
+    for name, series in expected.items():
+        assert_close(streaming[name], series, name)
+    print(f"  {len(expected)} gösterge {len(data)} bar boyunca eşleşti")
+
+def test_warm_up_then_update():
+    print("🔥 Isınma + tek bar güncelleme testi...")
+    data = make_data(300, seed=11, datetime_index=False)
+    indicators = StreamingIndicators()
+    indicators.warm_up(data.iloc[:-1])
+    latest = indicators.update(data.iloc[-1])
+    rsi = TechnicalAnalyzer().calculate_rsi(data).iloc[-1]
+    assert abs(latest['rsi'] - rsi) < TOLERANCE
+
+def benchmark_update(symbols=500, bars=200):
+    """
+    Sembol başına yeni bar geldiğinde akış güncellemesi ile toplu yeniden hesaplamanın karşılaştırması
+    """
+    data = make_data(bars, seed=7, datetime_index=False)
+    analyzer = TechnicalAnalyzer()
+    states = [StreamingIndicators() for _ in range(symbols)]
+    for state in states:
+        state.warm_up(data)
+    bar = data.iloc[-1].to_dict()
+
+    started = time.perf_counter()
+    for state in states:
+        state.update(bar)
+    streaming = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(symbols):
+        analyzer.calculate_rsi(data)
+        analyzer.calculate_macd(data)
+        analyzer.calculate_bollinger_bands(data)
+        analyzer.calculate_stochastic(data)
+        analyzer.calculate_moving_averages(data, [20, 50])
+    batch = time.perf_counter() - started
+    print(f"  {symbols} sembol: akış {streaming * 1000:.1f} ms, toplu {batch * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    test_streaming_matches_batch()
+    test_warm_up_then_update()
+    benchmark_update()
+    print("✅ Akış göstergeleri testi tamamlandı!")
@@ -0,0 +1,49 @@
+import time
+import sys
+import os
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from strategies.strategy_manager import StrategyManager
+from synthetic_data import make_data
+
+def test_tail_values_within_tolerance():
+    print("✂️ Son değer modu tolerans testi...")
+    data = make_data(400, seed=21)
+    full = StrategyManager().compute_indicators(data)
+    tail = StrategyManager(tail_only=True).compute_indicators(data)
+    assert list(tail.index) == list(data.index[-2:]) and list(tail.columns) == list(full.columns)
+    price_range = data['close'].max() - data['close'].min()
+    for column in tail.columns:
+        diff = np.max(np.abs(tail[column].to_numpy() - full[column].iloc[-2:].to_numpy()))
+        # SMA/std/RSI/Stochastic tam pencereyle aynı; EMA tabanlılar tail_tolerance ile kesilir
+        exact = not column.startswith(('ema', 'macd'))
+        bound = 1e-9 * max(price_range, 100) if exact else 3e-6 * price_range
+        assert diff <= bound, f"{column}: fark {diff}"
+
+def test_strategy_signals_unchanged():
+    data = make_data(200, seed=21)
+    full = StrategyManager().analyze_symbol("BTCUSDT", data)
+    tail = StrategyManager(tail_only=True).analyze_symbol("BTCUSDT", data)
+    for name in full:
+        assert full[name]['signal'] == tail[name]['signal']
+        assert abs(full[name]['confidence'] - tail[name]['confidence']) < 1e-9
+
+def benchmark_tail(evaluations=200):
+    for bars in (200, 5000):
+        data = make_data(bars, seed=21)
+        for label, tail_only in (("tam seri", False), ("son değer", True)):
+            manager = StrategyManager(tail_only=tail_only)
+            started = time.perf_counter()
+            for _ in range(evaluations):
+                # Canlı yol: her değerlendirmede yeni bar → önbellek isabeti yok
+                manager.indicator_cache.clear()
+                manager.analyze_symbol("BTCUSDT", data)
+            print(f"  {bars} bar, {label}: {(time.perf_counter() - started) / evaluations * 1000:.2f} ms/değerlendirme")
+
+if __name__ == "__main__":
+    test_tail_values_within_tolerance()
+    test_strategy_signals_unchanged()
+    benchmark_tail()
+    print("✅ Son değer modu testi tamamlandı!")
@@ -0,0 +1,56 @@
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from data.tick_buffer import TickRingBuffer
+from data.data_fetcher import DataFetcher
+
+def test_last_and_since_queries():
+    print("⏱️ Tik sorgu testi...")
+    buffer = TickRingBuffer(capacity=100)
+    for i in range(250):
+        buffer.append(100.0 + i, 1.0, 1000 + i, i)
+
+    last = buffer.last(3)
+    assert list(last['price']) == [347.0, 348.0, 349.0]
+    # Okumalar en fazla capacity - 1 tik döndürür
+    assert len(buffer.last()) == 99
+    since = buffer.since(1245)
+    assert list(since['event_time']) == [1245, 1246, 1247, 1248, 1249]
+    assert buffer.latest()['price'] == 349.0
+
+def test_reader_window_is_not_overwritten_by_next_write():
+    print("🔒 Tek yazıcı / çok okuyucu testi...")
+    buffer = TickRingBuffer(capacity=10)
+    for i in range(25):
+        buffer.append(float(i), 1.0, i, i)
+    window = buffer.last()
+    before = window['price'].copy()
+    buffer.append(99.0, 1.0, 99, 99)
+    assert (window['price'] == before).all()
+
+def test_ticker_messages_keep_history_and_legacy_view():
+    print("📈 Ticker geçmişi ve real_time_data uyumluluk testi...")
+    fetcher = DataFetcher(store_dir=None, use_cache=False)
+
+    for i in range(5):
+        fetcher._handle_stream_message("btcusdt@ticker", {
+            "e": "24hrTicker", "E": 1000 + i, "s": "BTCUSDT", "c": str(100 + i),
+            "P": "1.5", "h": "110", "l": "90", "v": "1234", "p": "2"
+        })
+
+    assert fetcher.get_current_price("BTCUSDT") == 104.0
+    assert len(fetcher.get_recent_ticks("BTCUSDT")) == 5
+    assert list(fetcher.get_ticks_since("BTCUSDT", 1003)['price']) == [103.0, 104.0]
+
+    snapshot = fetcher.real_time_data["BTCUSDT"]
+    assert snapshot['price'] == 104.0 and snapshot['high_24h'] == 110.0
+    assert "BTCUSDT" in fetcher.real_time_data
+    assert fetcher.get_current_price("ETHUSDT") is None
+
+if __name__ == "__main__":
+    test_last_and_since_queries()
+    test_reader_window_is_not_overwritten_by_next_write()
+    test_ticker_messages_keep_history_and_legacy_view()
+    print("✅ Tik tamponu testi tamamlandı!")